@@ -41,7 +41,8 @@ db_url = dialect.build_url(db_config)
 
 # Set database URL from MindWeaver config
 # This ensures migrations use the same database as the application
-config.set_main_option("sqlalchemy.url", db_url)
+# (escape "%" from URL-encoded credentials for configparser interpolation)
+config.set_main_option("sqlalchemy.url", db_url.replace("%", "%%"))
 
 # Target metadata for autogenerate support
 # This includes all SQLAlchemy models: feeds, entries, categories, filter_rules
@@ -104,6 +105,15 @@ def run_migrations_online() -> None:
     dialect.setup_engine_events(connectable)
 
     with connectable.connect() as connection:
+        # Batch migrations rebuild SQLite tables by copy, drop and rename,
+        # which cannot drop a table that other tables reference while
+        # foreign keys are enforced. The pragma is a no-op inside a
+        # transaction, so it is switched off on the driver connection before
+        # the migration transaction starts and checked before it commits.
+        is_sqlite = connection.dialect.name == "sqlite"
+        if is_sqlite:
+            connection.connection.driver_connection.execute("PRAGMA foreign_keys=OFF")
+
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
@@ -115,6 +125,13 @@ def run_migrations_online() -> None:
 
         with context.begin_transaction():
             context.run_migrations()
+            if is_sqlite:
+                violations = connection.exec_driver_sql("PRAGMA foreign_key_check").fetchall()
+                if violations:
+                    raise RuntimeError(f"Migration left foreign key violations: {violations}")
+
+        if is_sqlite:
+            connection.connection.driver_connection.execute("PRAGMA foreign_keys=ON")
 
 
 if context.is_offline_mode():
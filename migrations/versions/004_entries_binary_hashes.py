@@ -0,0 +1,108 @@
+"""Store entry hashes as 16-byte binary digests
+
+- Convert entries.title_hash, link_hash and content_hash from hex String(64)
+  to LargeBinary(16)
+- content_hash (hex SHA256) is truncated to its first 16 bytes, matching
+  compute_content_hash
+
+Migration ID: 004
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "004"
+down_revision: Union[str, Sequence[str], None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+HASH_COLUMNS = ("title_hash", "link_hash", "content_hash")
+
+
+def _read_hashes(conn) -> list:
+    return conn.execute(
+        sa.text("SELECT id, title_hash, link_hash, content_hash FROM entries")
+    ).fetchall()
+
+
+def _write_hashes(conn, rows: list) -> None:
+    if rows:
+        conn.execute(
+            sa.text(
+                "UPDATE entries SET title_hash = :title_hash, link_hash = :link_hash, "
+                "content_hash = :content_hash WHERE id = :id"
+            ),
+            rows,
+        )
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    dialect_name = conn.dialect.name
+
+    if dialect_name == "postgresql":
+        for column in HASH_COLUMNS:
+            op.alter_column(
+                "entries",
+                column,
+                type_=sa.LargeBinary(length=16),
+                postgresql_using=f"decode(substr({column}, 1, 32), 'hex')",
+            )
+        return
+
+    rows = _read_hashes(conn)
+
+    with op.batch_alter_table("entries") as batch_op:
+        for column in HASH_COLUMNS:
+            batch_op.alter_column(column, type_=sa.LargeBinary(length=16))
+
+    _write_hashes(
+        conn,
+        [
+            {
+                "id": row.id,
+                **{
+                    column: bytes.fromhex(value[:32]) if value else None
+                    for column, value in zip(HASH_COLUMNS, row[1:])
+                },
+            }
+            for row in rows
+        ],
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    dialect_name = conn.dialect.name
+
+    if dialect_name == "postgresql":
+        for column in HASH_COLUMNS:
+            op.alter_column(
+                "entries",
+                column,
+                type_=sa.String(length=64),
+                postgresql_using=f"encode({column}, 'hex')",
+            )
+        return
+
+    rows = _read_hashes(conn)
+
+    with op.batch_alter_table("entries") as batch_op:
+        for column in HASH_COLUMNS:
+            batch_op.alter_column(column, type_=sa.String(length=64))
+
+    _write_hashes(
+        conn,
+        [
+            {
+                "id": row.id,
+                **{
+                    column: bytes(value).hex() if value is not None else None
+                    for column, value in zip(HASH_COLUMNS, row[1:])
+                },
+            }
+            for row in rows
+        ],
+    )
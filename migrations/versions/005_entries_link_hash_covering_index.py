@@ -0,0 +1,53 @@
+"""Covering unique index for entries.link_hash
+
+- Replace ix_entries_link_hash with a unique index that INCLUDEs feed_id
+  and id on PostgreSQL, so dedup lookups are index-only scans
+- Drop the now redundant link_hash unique constraint on PostgreSQL
+- Other dialects get a plain unique index (SQLite indexes already carry
+  the rowid)
+
+Migration ID: 005
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "005"
+down_revision: Union[str, Sequence[str], None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    insp = sa.inspect(conn)
+
+    index_names = [idx["name"] for idx in insp.get_indexes("entries")]
+    if "ix_entries_link_hash" in index_names:
+        op.drop_index("ix_entries_link_hash", table_name="entries")
+
+    if conn.dialect.name == "postgresql":
+        for constraint in insp.get_unique_constraints("entries"):
+            if constraint["column_names"] == ["link_hash"]:
+                op.drop_constraint(constraint["name"], "entries", type_="unique")
+
+    op.create_index(
+        "ix_entries_link_hash",
+        "entries",
+        ["link_hash"],
+        unique=True,
+        postgresql_include=["feed_id", "id"],
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+
+    op.drop_index("ix_entries_link_hash", table_name="entries")
+
+    if conn.dialect.name == "postgresql":
+        op.create_unique_constraint("entries_link_hash_key", "entries", ["link_hash"])
+
+    op.create_index("ix_entries_link_hash", "entries", ["link_hash"], unique=False)
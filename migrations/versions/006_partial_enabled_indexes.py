@@ -0,0 +1,54 @@
+"""Partial indexes over enabled feeds and filter rules
+
+- ix_feeds_enabled_last_fetched, ix_feeds_enabled_errors and
+  ix_filter_rules_enabled_priority only index enabled rows on PostgreSQL
+  and SQLite; enabled moves from the index key to the predicate
+- MySQL has no partial indexes and gets plain indexes on the same keys
+
+Migration ID: 006
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "006"
+down_revision: Union[str, Sequence[str], None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, key column)
+PARTIAL_INDEXES = (
+    ("ix_feeds_enabled_last_fetched", "feeds", "last_fetched_at"),
+    ("ix_feeds_enabled_errors", "feeds", "fetch_error_count"),
+    ("ix_filter_rules_enabled_priority", "filter_rules", "priority"),
+)
+
+
+def _drop_if_exists(insp, name: str, table: str) -> None:
+    if name in [idx["name"] for idx in insp.get_indexes(table)]:
+        op.drop_index(name, table_name=table)
+
+
+def upgrade() -> None:
+    insp = sa.inspect(op.get_bind())
+
+    for name, table, column in PARTIAL_INDEXES:
+        _drop_if_exists(insp, name, table)
+        op.create_index(
+            name,
+            table,
+            [column],
+            unique=False,
+            postgresql_where=sa.text("enabled = true"),
+            sqlite_where=sa.text("enabled = 1"),
+        )
+
+
+def downgrade() -> None:
+    insp = sa.inspect(op.get_bind())
+
+    for name, table, column in PARTIAL_INDEXES:
+        _drop_if_exists(insp, name, table)
+        op.create_index(name, table, ["enabled", column], unique=False)
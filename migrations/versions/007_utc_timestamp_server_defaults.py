@@ -0,0 +1,56 @@
+"""Server-side UTC timestamp defaults
+
+- created_at/updated_at, entries.fetched_at and digest_logs.sent_at get a
+  server default of the current UTC time instead of a Python-side
+  datetime.utcnow() bound on every insert
+
+Migration ID: 007
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "007"
+down_revision: Union[str, Sequence[str], None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMP_COLUMNS = {
+    "feeds": ("created_at", "updated_at"),
+    "entries": ("fetched_at",),
+    "filter_rules": ("created_at", "updated_at"),
+    "categories": ("created_at", "updated_at"),
+    "digest_logs": ("sent_at",),
+}
+
+# Current UTC time per dialect, as rendered when this migration was written;
+# SQLite pads %f to the six fractional digits SQLAlchemy stores
+UTCNOW_SQL = {
+    "postgresql": "TIMEZONE('utc', CURRENT_TIMESTAMP)",
+    "sqlite": "(STRFTIME('%Y-%m-%d %H:%M:%f000', 'now'))",
+    "mysql": "(UTC_TIMESTAMP())",
+}
+
+
+def _utcnow_default() -> sa.TextClause:
+    dialect_name = op.get_context().dialect.name
+    return sa.text(UTCNOW_SQL.get(dialect_name, "CURRENT_TIMESTAMP"))
+
+
+def upgrade() -> None:
+    server_default = _utcnow_default()
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column, existing_type=sa.DateTime(), server_default=server_default
+                )
+
+
+def downgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(column, existing_type=sa.DateTime(), server_default=None)
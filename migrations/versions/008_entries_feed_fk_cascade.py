@@ -0,0 +1,40 @@
+"""Cascade entry deletes from feeds in the database
+
+- Recreate the entries.feed_id foreign key with ON DELETE CASCADE so
+  deleting a feed no longer requires loading its entries in the ORM
+
+Migration ID: 008
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "008"
+down_revision: Union[str, Sequence[str], None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Names the unnamed foreign key created by 001 on SQLite
+NAMING_CONVENTION = {"fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s"}
+
+
+def _recreate_feed_fk(ondelete: Union[str, None]) -> None:
+    insp = sa.inspect(op.get_bind())
+    name = "fk_entries_feed_id_feeds"
+    for fk in insp.get_foreign_keys("entries"):
+        if fk["constrained_columns"] == ["feed_id"] and fk["name"]:
+            name = fk["name"]
+
+    with op.batch_alter_table("entries", naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint(name, type_="foreignkey")
+        batch_op.create_foreign_key(name, "feeds", ["feed_id"], ["id"], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    _recreate_feed_fk("CASCADE")
+
+
+def downgrade() -> None:
+    _recreate_feed_fk(None)
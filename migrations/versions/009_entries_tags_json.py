@@ -0,0 +1,57 @@
+"""Store entries.tags as native JSON
+
+- entries.tags becomes JSONB on PostgreSQL (with a GIN index for tag
+  containment queries) and JSON elsewhere; existing values are already
+  JSON text, so no data rewrite is needed
+
+Migration ID: 009
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "009"
+down_revision: Union[str, Sequence[str], None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    if conn.dialect.name == "postgresql":
+        op.alter_column(
+            "entries",
+            "tags",
+            existing_type=sa.Text(),
+            type_=postgresql.JSONB(),
+            postgresql_using="tags::jsonb",
+        )
+        op.create_index(
+            "ix_entries_tags_gin", "entries", ["tags"], unique=False, postgresql_using="gin"
+        )
+        return
+
+    with op.batch_alter_table("entries") as batch_op:
+        batch_op.alter_column("tags", existing_type=sa.Text(), type_=sa.JSON())
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+
+    if conn.dialect.name == "postgresql":
+        op.drop_index("ix_entries_tags_gin", table_name="entries")
+        op.alter_column(
+            "entries",
+            "tags",
+            existing_type=postgresql.JSONB(),
+            type_=sa.Text(),
+            postgresql_using="tags::text",
+        )
+        return
+
+    with op.batch_alter_table("entries") as batch_op:
+        batch_op.alter_column("tags", existing_type=sa.JSON(), type_=sa.Text())
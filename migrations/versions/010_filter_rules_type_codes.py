@@ -0,0 +1,110 @@
+"""Store filter rule types as SMALLINT codes
+
+- Convert filter_rules.rule_type (keyword=1, regex=2, tag=3, language=4) and
+  filter_rules.match_type (include=1, exclude=2) from strings to SmallInteger
+- Rules with an unknown type abort the upgrade; fix or delete them first
+
+Migration ID: 010
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "010"
+down_revision: Union[str, Sequence[str], None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CODES = {
+    "rule_type": {"keyword": 1, "regex": 2, "tag": 3, "language": 4},
+    "match_type": {"include": 1, "exclude": 2},
+}
+
+
+def _read_types(conn) -> list:
+    return conn.execute(sa.text("SELECT id, rule_type, match_type FROM filter_rules")).fetchall()
+
+
+def _write_types(conn, rows: list) -> None:
+    if rows:
+        conn.execute(
+            sa.text(
+                "UPDATE filter_rules SET rule_type = :rule_type, match_type = :match_type "
+                "WHERE id = :id"
+            ),
+            rows,
+        )
+
+
+def _encode(column: str, value) -> int:
+    try:
+        return CODES[column][str(value).lower()]
+    except KeyError:
+        raise ValueError(f"filter_rules.{column} has unknown value {value!r}") from None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    if conn.dialect.name == "postgresql":
+        for column, codes in CODES.items():
+            cases = " ".join(f"WHEN '{name}' THEN {code}" for name, code in codes.items())
+            op.alter_column(
+                "filter_rules",
+                column,
+                type_=sa.SmallInteger(),
+                nullable=False,
+                postgresql_using=f"CASE lower({column}) {cases} END",
+            )
+        return
+
+    rows = [
+        {
+            "id": row.id,
+            "rule_type": _encode("rule_type", row.rule_type),
+            "match_type": _encode("match_type", row.match_type),
+        }
+        for row in _read_types(conn)
+    ]
+
+    with op.batch_alter_table("filter_rules") as batch_op:
+        for column in CODES:
+            batch_op.alter_column(column, type_=sa.SmallInteger(), nullable=False)
+
+    _write_types(conn, rows)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+
+    if conn.dialect.name == "postgresql":
+        for column, codes in CODES.items():
+            cases = " ".join(f"WHEN {code} THEN '{name}'" for name, code in codes.items())
+            op.alter_column(
+                "filter_rules",
+                column,
+                type_=sa.String(length=50),
+                nullable=True,
+                postgresql_using=f"CASE {column} {cases} END",
+            )
+        return
+
+    names = {
+        column: {code: name for name, code in codes.items()} for column, codes in CODES.items()
+    }
+    rows = [
+        {
+            "id": row.id,
+            "rule_type": names["rule_type"][row.rule_type],
+            "match_type": names["match_type"][row.match_type],
+        }
+        for row in _read_types(conn)
+    ]
+
+    with op.batch_alter_table("filter_rules") as batch_op:
+        for column in CODES:
+            batch_op.alter_column(column, type_=sa.String(length=50), nullable=True)
+
+    _write_types(conn, rows)
@@ -0,0 +1,51 @@
+"""Compute entries.reading_time_seconds in the database
+
+- Replace the Python-filled reading_time_seconds column with a stored
+  generated column derived from content (~1200 characters per minute,
+  at least 10 seconds, NULL without content)
+- Existing values are recomputed from content
+
+Migration ID: 011
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "011"
+down_revision: Union[str, Sequence[str], None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+READING_TIME_SQL = (
+    "CASE WHEN content IS NULL OR content = '' THEN NULL "
+    "WHEN LENGTH(content) < 200 THEN 10 "
+    "ELSE LENGTH(content) / 20 END"
+)
+
+
+def upgrade() -> None:
+    # A stored generated column cannot be added to SQLite with ALTER TABLE,
+    # so drop the plain column and rebuild the table with the generated one
+    with op.batch_alter_table("entries") as batch_op:
+        batch_op.drop_column("reading_time_seconds")
+
+    with op.batch_alter_table("entries", recreate="always") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "reading_time_seconds",
+                sa.Integer(),
+                sa.Computed(READING_TIME_SQL, persisted=True),
+                nullable=True,
+            )
+        )
+
+
+def downgrade() -> None:
+    # Generated values are lost; the Python-side calculation is gone too
+    with op.batch_alter_table("entries") as batch_op:
+        batch_op.drop_column("reading_time_seconds")
+
+    with op.batch_alter_table("entries") as batch_op:
+        batch_op.add_column(sa.Column("reading_time_seconds", sa.Integer(), nullable=True))
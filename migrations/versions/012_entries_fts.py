@@ -0,0 +1,55 @@
+"""Full-text search table over entries on SQLite
+
+- entries_fts: FTS5 external-content table over entries.title/content
+  with the trigram tokenizer (substring matches of 3+ characters)
+- Insert/delete/update triggers on entries keep it in sync; existing
+  entries are indexed with a rebuild
+- Other databases are unchanged and keep searching with LIKE
+- A later batch rebuild of entries (recreate) drops the triggers with the
+  old table, so such a migration has to create them again
+
+Migration ID: 012
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "012"
+down_revision: Union[str, Sequence[str], None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FTS_DDL = (
+    "CREATE VIRTUAL TABLE entries_fts USING fts5("
+    "title, content, content='entries', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER entries_fts_ai AFTER INSERT ON entries BEGIN "
+    "INSERT INTO entries_fts(rowid, title, content) "
+    "VALUES (new.id, new.title, new.content); END",
+    "CREATE TRIGGER entries_fts_ad AFTER DELETE ON entries BEGIN "
+    "INSERT INTO entries_fts(entries_fts, rowid, title, content) "
+    "VALUES ('delete', old.id, old.title, old.content); END",
+    "CREATE TRIGGER entries_fts_au AFTER UPDATE OF title, content ON entries BEGIN "
+    "INSERT INTO entries_fts(entries_fts, rowid, title, content) "
+    "VALUES ('delete', old.id, old.title, old.content); "
+    "INSERT INTO entries_fts(rowid, title, content) "
+    "VALUES (new.id, new.title, new.content); END",
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    for statement in FTS_DDL:
+        op.execute(statement)
+    op.execute("INSERT INTO entries_fts(entries_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    for trigger in ("entries_fts_ai", "entries_fts_ad", "entries_fts_au"):
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute("DROP TABLE IF EXISTS entries_fts")
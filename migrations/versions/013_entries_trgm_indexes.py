@@ -0,0 +1,43 @@
+"""Trigram indexes for entry search on PostgreSQL
+
+- Enables the pg_trgm extension and adds GIN trigram indexes on
+  entries.title and entries.content, so search's LIKE '%query%' is served
+  by an index instead of a full scan
+- SQLite searches through entries_fts (migration 012); other databases
+  are unchanged
+
+Migration ID: 013
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "013"
+down_revision: Union[str, Sequence[str], None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in ("title", "content"):
+        op.create_index(
+            f"ix_entries_{column}_trgm",
+            "entries",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for column in ("title", "content"):
+        op.drop_index(f"ix_entries_{column}_trgm", table_name="entries")
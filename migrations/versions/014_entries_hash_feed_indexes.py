@@ -0,0 +1,45 @@
+"""Composite (hash, feed_id) indexes for entry deduplication
+
+- Replace ix_entries_title_hash with ix_entries_title_hash_feed on
+  (title_hash, feed_id), so per-feed title lookups are resolved in the index
+- Add ix_entries_content_hash_feed on (content_hash, feed_id); content
+  hash lookups had no index in migrated databases
+- Lookups by hash alone keep using the leading column
+
+Migration ID: 014
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "014"
+down_revision: Union[str, Sequence[str], None] = "013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (new composite index, single-column index it replaces, hash column)
+HASH_INDEXES = (
+    ("ix_entries_title_hash_feed", "ix_entries_title_hash", "title_hash"),
+    ("ix_entries_content_hash_feed", "ix_entries_content_hash", "content_hash"),
+)
+
+
+def _drop_if_exists(insp, name: str, table: str) -> None:
+    if name in [idx["name"] for idx in insp.get_indexes(table)]:
+        op.drop_index(name, table_name=table)
+
+
+def upgrade() -> None:
+    insp = sa.inspect(op.get_bind())
+
+    for name, old_name, column in HASH_INDEXES:
+        _drop_if_exists(insp, old_name, "entries")
+        op.create_index(name, "entries", [column, "feed_id"], unique=False)
+
+
+def downgrade() -> None:
+    for name, _, _ in HASH_INDEXES:
+        op.drop_index(name, table_name="entries")
+    op.create_index("ix_entries_title_hash", "entries", ["title_hash"], unique=False)
@@ -37,6 +37,21 @@ class DatabaseConfig(BaseSettings):
     path: str = Field(
         default="data/spider_aggregation.db", description="Database file path (SQLite)"
     )
+    sqlite_pragmas: dict[str, str] = Field(
+        default={
+            "synchronous": "NORMAL",
+            "busy_timeout": "5000",
+            "cache_size": "-64000",
+            "temp_store": "MEMORY",
+            "mmap_size": "268435456",
+            "journal_size_limit": "67108864",
+        },
+        description="Extra PRAGMA settings applied to every SQLite connection",
+    )
+    skip_migrations: bool = Field(
+        default=False,
+        description="Skip the init_db migration check when Alembic is run externally",
+    )
 
     # PostgreSQL/MySQL configuration
     host: str | None = Field(default=None, description="Database host (PostgreSQL/MySQL)")
@@ -55,6 +70,9 @@ class DatabaseConfig(BaseSettings):
     echo: bool = Field(default=False, description="Echo SQL statements")
     pool_size: int = Field(default=5, ge=1, le=100, description="Connection pool size")
     max_overflow: int = Field(default=10, ge=0, description="Max overflow connections")
+    query_cache_size: int = Field(
+        default=1200, ge=0, description="Compiled SQL statement cache size per engine"
+    )
 
     @field_validator("type")
     @classmethod
@@ -122,6 +140,9 @@ class SchedulerConfig(BaseSettings):
 
     # Job execution settings
     max_workers: int = Field(default=3, ge=1, le=20, description="Maximum concurrent workers")
+    max_queue: int = Field(
+        default=0, ge=0, description="Maximum queued fetch runs (0 = max_workers * 4)"
+    )
     misfire_grace_time: int = Field(default=300, ge=0, description="Misfire grace time in seconds")
     coalesce: bool = Field(default=True, description="Coalesce misfired jobs")
 
@@ -155,6 +176,11 @@ class FetcherConfig(BaseSettings):
     follow_redirects: bool = Field(default=True)
     max_redirects: int = Field(default=5, ge=0, le=20)
 
+    # Async batch fetching
+    max_connections: int = Field(
+        default=100, ge=1, le=1000, description="Maximum concurrent connections for batch fetches"
+    )
+
     # Feed entry limits
     max_entries_per_feed: int = Field(
         default=0, ge=0, le=1000, description="Max entries to fetch per feed (0=unlimited)"
@@ -171,8 +197,9 @@ class DeduplicatorConfig(BaseSettings):
 
     enabled: bool = Field(default=True, description="Enable deduplication")
 
-    # Hash methods: md5, sha256
-    link_hash_method: str = Field(default="sha256", description="Hash method for links")
+    # Hash methods: md5, sha256, blake2b, blake3 (requires the fast-hash extra)
+    # Changing a method on an existing database makes stored hashes stop matching
+    link_hash_method: str = Field(default="md5", description="Hash method for links")
     title_hash_method: str = Field(default="md5", description="Hash method for titles")
     content_hash_method: str = Field(default="sha256", description="Hash method for content")
 
@@ -186,6 +213,16 @@ class DeduplicatorConfig(BaseSettings):
     check_by_title: bool = Field(default=True, description="Deduplicate by title similarity")
     check_by_content: bool = Field(default=False, description="Deduplicate by content hash")
 
+    @field_validator("link_hash_method", "title_hash_method", "content_hash_method")
+    @classmethod
+    def validate_hash_method(cls, v: str) -> str:
+        """Validate hash method."""
+        valid_methods = ["md5", "sha256", "blake2b", "blake3"]
+        v = v.lower().strip()
+        if v not in valid_methods:
+            raise ValueError(f"Invalid hash method: {v!r}. Must be one of {valid_methods}")
+        return v
+
 
 class LoggingConfig(BaseSettings):
     """Logging configuration."""
@@ -203,10 +240,23 @@ class LoggingConfig(BaseSettings):
     file_path: str = Field(default="logs/spider_aggregation.log", description="Log file path")
     rotation: str = Field(default="100 MB", description="Log rotation size")
     retention: str = Field(default="30 days", description="Log retention period")
+    queue_maxsize: int = Field(
+        default=10_000, ge=1, description="Maximum log records queued for the file writer"
+    )
+    overflow_policy: str = Field(
+        default="drop_oldest", description="File queue overflow policy when full"
+    )
+    batch_bytes: int = Field(default=65536, ge=1, description="Log file write batch size")
+    batch_interval_ms: int = Field(
+        default=250, ge=1, description="Maximum age of a log file write batch"
+    )
 
     # Console logging
     console_enabled: bool = Field(default=True, description="Enable console logging")
 
+    # Backend
+    backend: str = Field(default="loguru", description="Logging backend (loguru or picologging)")
+
     @field_validator("level")
     @classmethod
     def validate_level(cls, v: str) -> str:
@@ -217,6 +267,26 @@ class LoggingConfig(BaseSettings):
             raise ValueError(f"Log level must be one of {valid_levels}")
         return v
 
+    @field_validator("overflow_policy")
+    @classmethod
+    def validate_overflow_policy(cls, v: str) -> str:
+        """Validate file queue overflow policy."""
+        valid_policies = ["drop_oldest", "drop_newest", "block"]
+        v = v.lower()
+        if v not in valid_policies:
+            raise ValueError(f"Overflow policy must be one of {valid_policies}")
+        return v
+
+    @field_validator("backend")
+    @classmethod
+    def validate_backend(cls, v: str) -> str:
+        """Validate logging backend."""
+        valid_backends = ["loguru", "picologging"]
+        v = v.lower()
+        if v not in valid_backends:
+            raise ValueError(f"Logging backend must be one of {valid_backends}")
+        return v
+
     @field_validator("file_path")
     @classmethod
     def ensure_directory_exists(cls, v: str) -> str:
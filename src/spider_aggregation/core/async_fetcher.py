@@ -0,0 +1,204 @@
+"""
+Asynchronous RSS/Atom feed fetcher for batch pipelines.
+
+Multiplexes many outstanding feed requests on a single event loop using a
+shared httpx.AsyncClient connection pool, instead of one blocking request
+(and one fresh client) per feed.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+import httpx
+
+from spider_aggregation.config import get_config
+from spider_aggregation.core.fetcher import (
+    FetchResult,
+    FetchStats,
+    build_fetch_result,
+    conditional_headers,
+    describe_fetch_error,
+)
+from spider_aggregation.logger import get_logger
+from spider_aggregation.models import FeedModel
+
+logger = get_logger(__name__)
+
+
+class AsyncFeedFetcher:
+    """Async RSS/Atom feed fetcher sharing one connection pool across requests.
+
+    Database updates are left to the caller: results are returned as
+    FetchResult instances so they can be persisted on the caller's session.
+    Responses are turned into results by the same helpers as FeedFetcher.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        user_agent: Optional[str] = None,
+        max_connections: Optional[int] = None,
+    ):
+        """Initialize async feed fetcher.
+
+        Args:
+            timeout_seconds: Request timeout in seconds
+            max_retries: Maximum number of retry attempts
+            user_agent: User-Agent header for HTTP requests
+            max_connections: Maximum concurrent connections in the shared pool
+        """
+        config = get_config()
+
+        self.timeout_seconds = timeout_seconds or config.fetcher.timeout_seconds
+        self.max_retries = max_retries or config.fetcher.max_retries
+        self.user_agent = user_agent or config.fetcher.user_agent
+        self.retry_delay_seconds = config.fetcher.retry_delay_seconds
+        self.max_connections = max_connections or config.fetcher.max_connections
+
+        # HTTP client configuration
+        self.follow_redirects = config.fetcher.follow_redirects
+        self.max_redirects = config.fetcher.max_redirects
+
+        self.stats = FetchStats()
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the shared async HTTP client for a batch.
+
+        Returns:
+            httpx AsyncClient with a bounded connection pool
+        """
+        return httpx.AsyncClient(
+            timeout=self.timeout_seconds,
+            follow_redirects=self.follow_redirects,
+            max_redirects=self.max_redirects,
+            headers={"User-Agent": self.user_agent},
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+        )
+
+    async def fetch_url(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        feed_id: Optional[int] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        only_recent: bool = False,
+    ) -> FetchResult:
+        """Fetch a feed from URL using the shared client.
+
+        Args:
+            client: Shared async HTTP client
+            url: Feed URL to fetch
+            feed_id: Optional feed ID for the result
+            etag: Optional ETag for conditional request
+            last_modified: Optional Last-Modified for conditional request
+            max_entries: Maximum entries to return (None for unlimited)
+            only_recent: Drop entries older than the configured recent window
+
+        Returns:
+            FetchResult with entries or error
+        """
+        start_time = time.time()
+        feed_id = feed_id or 0
+
+        logger.debug(f"Fetching URL (async): {url}")
+
+        last_error = None
+        http_status = None
+        attempts = self.max_retries + 1
+
+        for attempt in range(attempts):
+            try:
+                # Only the first attempt is conditional
+                headers = conditional_headers(
+                    etag if not attempt else None, last_modified if not attempt else None
+                )
+                response = await client.get(url, headers=headers)
+                result = build_fetch_result(
+                    response, url, feed_id, start_time, max_entries, only_recent
+                )
+                self.stats.add_result(result)
+                return result
+
+            except Exception as e:
+                last_error, status, retry = describe_fetch_error(e, url, attempt, attempts)
+                http_status = status or http_status
+                if not retry:
+                    break
+
+            # Retry delay
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.retry_delay_seconds * (attempt + 1))
+
+        # All retries failed
+        result = FetchResult(
+            success=False,
+            feed_id=feed_id,
+            feed_url=url,
+            fetch_time_seconds=time.time() - start_time,
+            error=last_error or "Unknown error",
+            http_status=http_status,
+        )
+
+        self.stats.add_result(result)
+        return result
+
+    async def fetch_feed(self, client: httpx.AsyncClient, feed: FeedModel) -> FetchResult:
+        """Fetch a single feed using the shared client.
+
+        Args:
+            client: Shared async HTTP client
+            feed: FeedModel instance to fetch
+
+        Returns:
+            FetchResult with entries or error
+        """
+        max_entries = None
+        if feed.max_entries_per_fetch is not None and feed.max_entries_per_fetch > 0:
+            max_entries = feed.max_entries_per_fetch
+
+        return await self.fetch_url(
+            client,
+            feed.url,
+            feed_id=feed.id,
+            etag=feed.etag,
+            last_modified=feed.last_modified,
+            max_entries=max_entries,
+            only_recent=bool(feed.fetch_only_recent),
+        )
+
+    async def fetch_multiple(self, feeds: list[FeedModel]) -> list[FetchResult]:
+        """Fetch multiple feeds concurrently over one connection pool.
+
+        Args:
+            feeds: List of FeedModel instances to fetch
+
+        Returns:
+            List of FetchResult instances, in the same order as feeds
+        """
+        async with self._create_client() as client:
+            results = await asyncio.gather(
+                *(self.fetch_feed(client, feed) for feed in feeds),
+                return_exceptions=True,
+            )
+
+        fetch_results = []
+        for feed, result in zip(feeds, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Unexpected error fetching {feed.url}: {result}")
+                result = FetchResult(
+                    success=False,
+                    feed_id=feed.id,
+                    feed_url=feed.url,
+                    error=f"Unexpected error: {type(result).__name__}: {str(result)}",
+                    fetch_time_seconds=0.0,
+                )
+            fetch_results.append(result)
+
+        return fetch_results
@@ -58,6 +58,45 @@ class DedupResult:
         return f"DedupResult(is_duplicate={self.is_duplicate}, reason={self.reason})"
 
 
+class _PrefetchedLookups:
+    """Duplicate lookups answered from existing entries fetched for a whole batch.
+
+    Mirrors the EntryRepository lookups used by Deduplicator. A title hash
+    shared by several existing entries maps to only one of them, so a
+    title+content lookup whose content does not match that one still asks
+    the database.
+    """
+
+    def __init__(
+        self,
+        repo: EntryRepository,
+        by_link: dict[str, EntryModel],
+        by_title: dict[str, EntryModel],
+        by_content: dict[str, EntryModel],
+    ):
+        self.repo = repo
+        self.by_link = by_link
+        self.by_title = by_title
+        self.by_content = by_content
+
+    def get_by_link_hash(self, link_hash: str, feed_id: Optional[int] = None):
+        return self.by_link.get(link_hash)
+
+    def get_by_title_hash(self, title_hash: str, feed_id: Optional[int] = None):
+        return self.by_title.get(title_hash)
+
+    def get_by_content_hash(self, content_hash: str, feed_id: Optional[int] = None):
+        return self.by_content.get(content_hash)
+
+    def get_by_title_and_content(
+        self, title_hash: str, content_hash: str, feed_id: Optional[int] = None
+    ):
+        existing = self.by_title.get(title_hash)
+        if existing is None or existing.content_hash == content_hash:
+            return existing
+        return self.repo.get_by_title_and_content(title_hash, content_hash, feed_id)
+
+
 class Deduplicator:
     """Content deduplication system."""
 
@@ -79,6 +118,9 @@ class Deduplicator:
         self.enable_title_check = config.deduplicator.check_by_title
         self.enable_content_check = config.deduplicator.check_by_content
         self.similarity_threshold = config.deduplicator.title_similarity_threshold
+        self.link_hash_method = config.deduplicator.link_hash_method
+        self.title_hash_method = config.deduplicator.title_hash_method
+        self.content_hash_method = config.deduplicator.content_hash_method
 
         # Statistics
         self.stats = {
@@ -110,11 +152,79 @@ class Deduplicator:
             return DedupResult(is_duplicate=False, reason="No database session")
 
         repo = EntryRepository(self.session)
+        return self._check_duplicate(entry, feed_id, self.compute_hashes(entry), repo)
+
+    def check_duplicates(
+        self, entries: list[dict], feed_id: int, check_links: bool = True
+    ) -> list[DedupResult]:
+        """Check a batch of entries from one feed for duplicates.
+
+        Gives the same results as check_duplicate() for each entry, but the
+        existing entries are looked up with one query per hash kind for the
+        whole batch instead of one or more queries per entry.
+
+        Args:
+            entries: Parsed entry dictionaries
+            feed_id: Feed ID to check within
+            check_links: Look for existing links; callers inserting with
+                EntryRepository.bulk_create() can skip this, as the insert
+                itself ignores rows whose link already exists
 
-        # Extract hashes from entry
-        link_hash = compute_link_hash(entry.get("link"))
-        title_hash = compute_title_hash(entry.get("title"))
-        content_hash = compute_content_hash(entry.get("content") or entry.get("summary"))
+        Returns:
+            DedupResult for each entry, in order
+        """
+        if not self.session:
+            return [self.check_duplicate(entry, feed_id) for entry in entries]
+
+        repo = EntryRepository(self.session)
+        hashes = [self.compute_hashes(entry) for entry in entries]
+
+        def prefetch(kind: str, needed: bool, get_many) -> dict[str, EntryModel]:
+            values = [h[kind] for h in hashes if h[kind]]
+            return get_many(values, feed_id) if needed and values else {}
+
+        lookups = _PrefetchedLookups(
+            repo,
+            by_link=prefetch("link_hash", check_links, repo.get_many_by_link_hash),
+            by_title=prefetch(
+                "title_hash",
+                self.strategy == DedupStrategy.STRICT or self.enable_title_check,
+                repo.get_many_by_title_hash,
+            ),
+            by_content=prefetch(
+                "content_hash",
+                self.strategy == DedupStrategy.MEDIUM and self.enable_content_check,
+                repo.get_many_by_content_hash,
+            ),
+        )
+
+        results = []
+        for entry, entry_hashes in zip(entries, hashes):
+            self.stats["checks"] += 1
+            results.append(self._check_duplicate(entry, feed_id, entry_hashes, lookups))
+        return results
+
+    def _check_duplicate(
+        self,
+        entry: dict,
+        feed_id: int,
+        hashes: dict,
+        repo: "EntryRepository | _PrefetchedLookups",
+    ) -> DedupResult:
+        """Check one entry against existing entries found through repo.
+
+        Args:
+            entry: Parsed entry dictionary
+            feed_id: Feed ID to check within
+            hashes: The entry's hashes, from compute_hashes()
+            repo: EntryRepository, or the prefetched lookups of a batch
+
+        Returns:
+            DedupResult with duplicate status
+        """
+        link_hash = hashes["link_hash"]
+        title_hash = hashes["title_hash"]
+        content_hash = hashes["content_hash"]
 
         # Strategy 1: Check by link (most reliable)
         if link_hash:
@@ -208,8 +318,8 @@ class Deduplicator:
 
         repo = EntryRepository(self.session)
 
-        link_hash = compute_link_hash(entry.get("link"))
-        title_hash = compute_title_hash(entry.get("title"))
+        link_hash = compute_link_hash(entry.get("link"), self.link_hash_method)
+        title_hash = compute_title_hash(entry.get("title"), self.title_hash_method)
 
         if link_hash:
             existing = repo.get_by_link_hash_any_feed(link_hash, feed_ids)
@@ -241,9 +351,11 @@ class Deduplicator:
             Dictionary with link_hash, title_hash, content_hash
         """
         return {
-            "link_hash": compute_link_hash(entry.get("link")),
-            "title_hash": compute_title_hash(entry.get("title")),
-            "content_hash": compute_content_hash(entry.get("content") or entry.get("summary")),
+            "link_hash": compute_link_hash(entry.get("link"), self.link_hash_method),
+            "title_hash": compute_title_hash(entry.get("title"), self.title_hash_method),
+            "content_hash": compute_content_hash(
+                entry.get("content") or entry.get("summary"), self.content_hash_method
+            ),
         }
 
     def get_stats(self) -> dict:
@@ -212,6 +212,7 @@ def create_scheduler(
     session: Optional[Session] = None,
     max_workers: Optional[int] = None,
     db_manager=None,
+    max_queue: Optional[int] = None,
 ) -> "FeedScheduler":
     """Create a configured FeedScheduler instance.
 
@@ -219,6 +220,7 @@ def create_scheduler(
         session: Optional database session
         max_workers: Override maximum worker threads
         db_manager: Optional DatabaseManager instance
+        max_queue: Override maximum queued fetch runs
 
     Returns:
         Configured FeedScheduler instance
@@ -230,4 +232,5 @@ def create_scheduler(
         session=session,
         max_workers=max_workers or config.scheduler.max_workers,
         db_manager=db_manager,
+        max_queue=max_queue or config.scheduler.max_queue or None,
     )
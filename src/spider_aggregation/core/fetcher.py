@@ -4,7 +4,7 @@ RSS/Atom feed fetcher with error handling and retry logic.
 
 import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 from urllib.parse import urlparse
 
@@ -90,6 +90,193 @@ class FetchStats:
         return self.total_time_seconds / self.total_feeds
 
 
+def filter_recent_entries(entries: list, feed_url: str) -> list:
+    """Drop entries older than the configured recent-days window.
+
+    Entries without a published/updated date are kept.
+
+    Args:
+        entries: Parsed feedparser entries
+        feed_url: Feed URL (for logging)
+
+    Returns:
+        Entries within the recent period
+    """
+    recent_days = get_config().fetcher.fetch_recent_days
+    if recent_days <= 0:
+        return entries
+
+    cutoff_date = datetime.utcnow() - timedelta(days=recent_days)
+    original_count = len(entries)
+
+    # Filter entries that have published/updated dates within the recent period
+    filtered_entries = []
+    for e in entries:
+        # Try to get a date from the entry
+        entry_date = None
+        if e.get("published_parsed"):
+            entry_date = datetime(*e["published_parsed"][:6])
+        elif e.get("updated_parsed"):
+            entry_date = datetime(*e["updated_parsed"][:6])
+
+        # Keep entry if it has a valid date within the recent period, or if no date is available
+        if entry_date is None or entry_date >= cutoff_date:
+            filtered_entries.append(e)
+
+    if len(filtered_entries) < original_count:
+        logger.info(
+            f"Filtered {original_count - len(filtered_entries)} old entries from {feed_url} (older than {recent_days} days)"
+        )
+
+    return filtered_entries
+
+
+def conditional_headers(etag: Optional[str], last_modified: Optional[str]) -> dict:
+    """Build the conditional request headers for a feed fetch.
+
+    Args:
+        etag: ETag from the previous response
+        last_modified: Last-Modified from the previous response
+
+    Returns:
+        Dictionary of If-None-Match / If-Modified-Since headers
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def build_fetch_result(
+    response: httpx.Response,
+    url: str,
+    feed_id: int,
+    start_time: float,
+    max_entries: Optional[int] = None,
+    only_recent: bool = False,
+) -> FetchResult:
+    """Turn an HTTP response into a successful FetchResult.
+
+    Shared by FeedFetcher and AsyncFeedFetcher, so both handle 304 Not
+    Modified, entry limits and the recent-days filter the same way.
+
+    Args:
+        response: HTTP response for the feed URL
+        url: Feed URL
+        feed_id: Feed ID for the result
+        start_time: time.time() when the fetch started
+        max_entries: Maximum entries to return (None or 0 for unlimited)
+        only_recent: Drop entries older than the configured recent window
+
+    Returns:
+        FetchResult with entries, or without any for 304 Not Modified
+
+    Raises:
+        httpx.HTTPStatusError: On any other non-2xx status
+    """
+    http_status = response.status_code
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+
+    # Check for Not Modified
+    if http_status == 304:
+        logger.debug(f"Feed not modified: {url}")
+        return FetchResult(
+            success=True,
+            feed_id=feed_id,
+            feed_url=url,
+            entries_count=0,
+            fetch_time_seconds=time.time() - start_time,
+            http_status=http_status,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    response.raise_for_status()
+
+    # Parse with feedparser
+    parsed = feedparser.parse(response.content)
+    entries = parsed.get("entries", [])
+
+    # Apply max entries limit
+    if max_entries and max_entries > 0 and len(entries) > max_entries:
+        original_count = len(entries)
+        entries = entries[:max_entries]
+        logger.info(f"Limited {url} to {len(entries)} entries (original: {original_count})")
+
+    if only_recent:
+        entries = filter_recent_entries(entries, url)
+
+    # Get feed info
+    feed_info = {
+        "title": parsed.feed.get("title"),
+        "link": parsed.feed.get("link"),
+        "description": parsed.feed.get("description"),
+    }
+
+    fetch_time = time.time() - start_time
+
+    logger.info(f"Fetched {len(entries)} entries from {url} in {fetch_time:.2f}s")
+
+    return FetchResult(
+        success=True,
+        feed_id=feed_id,
+        feed_url=url,
+        entries_count=len(entries),
+        entries=entries,
+        fetch_time_seconds=fetch_time,
+        http_status=http_status,
+        etag=etag,
+        last_modified=last_modified,
+        feed_data=parsed,
+        feed_info=feed_info,
+    )
+
+
+def describe_fetch_error(
+    error: Exception, url: str, attempt: int, attempts: int
+) -> tuple[str, Optional[int], bool]:
+    """Classify an exception raised while fetching a feed.
+
+    Timeouts, network errors and server errors (5xx) are retried; client
+    errors (4xx) and unexpected exceptions are not.
+
+    Args:
+        error: Exception raised by the request or build_fetch_result()
+        url: Feed URL (for logging)
+        attempt: Zero-based attempt number
+        attempts: Total number of attempts
+
+    Returns:
+        Tuple of (error message, HTTP status or None, whether to retry)
+    """
+    if isinstance(error, httpx.TimeoutException):
+        logger.warning(f"Timeout fetching {url} (attempt {attempt + 1}/{attempts})")
+        return f"Timeout: {str(error)}", None, True
+
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        message = f"HTTP {status}: {str(error)}"
+
+        # Don't retry client errors (4xx)
+        if 400 <= status < 500:
+            logger.error(f"Client error fetching {url}: {message}")
+            return message, status, False
+
+        logger.warning(f"HTTP error fetching {url} (attempt {attempt + 1})")
+        return message, status, True
+
+    if isinstance(error, httpx.RequestError):
+        logger.warning(f"Network error fetching {url} (attempt {attempt + 1})")
+        return f"Request error: {str(error)}", None, True
+
+    message = f"Unexpected error: {type(error).__name__}: {str(error)}"
+    logger.error(f"Error fetching {url}: {message}")
+    return message, None, False
+
+
 class FeedFetcher:
     """RSS/Atom feed fetcher with retry logic and error handling."""
 
@@ -129,6 +316,7 @@ class FeedFetcher:
         etag: Optional[str] = None,
         last_modified: Optional[str] = None,
         max_entries: Optional[int] = None,
+        only_recent: bool = False,
     ) -> FetchResult:
         """Fetch a feed directly from URL without FeedModel.
 
@@ -138,6 +326,7 @@ class FeedFetcher:
             etag: Optional ETag for conditional request
             last_modified: Optional Last-Modified for conditional request
             max_entries: Maximum entries to return (None for unlimited)
+            only_recent: Drop entries older than the configured recent window
 
         Returns:
             FetchResult with entries or error
@@ -149,114 +338,38 @@ class FeedFetcher:
 
         last_error = None
         http_status = None
-        response_etag = None
-        response_last_modified = None
-        entries = []
+        attempts = self.max_retries + 1
 
-        for attempt in range(self.max_retries + 1):
+        for attempt in range(attempts):
             try:
-                # Fetch with HTTP client
-                http_result = self._fetch_http(
+                # Only the first attempt is conditional
+                response = self._fetch_http(
                     url,
                     etag=etag if not attempt else None,
                     last_modified=last_modified if not attempt else None,
                 )
-
-                http_status = http_result.status_code
-                response_etag = http_result.headers.get("ETag")
-                response_last_modified = http_result.headers.get("Last-Modified")
-
-                # Check for Not Modified
-                if http_status == 304:
-                    logger.debug(f"Feed not modified: {url}")
-                    return FetchResult(
-                        success=True,
-                        feed_id=feed_id,
-                        feed_url=url,
-                        entries_count=0,
-                        fetch_time_seconds=time.time() - start_time,
-                        http_status=http_status,
-                        etag=response_etag,
-                        last_modified=response_last_modified,
-                    )
-
-                # Parse with feedparser
-                parsed = feedparser.parse(http_result.content)
-                entries = parsed.get("entries", [])
-
-                # Apply max entries limit
-                if max_entries and max_entries > 0 and len(entries) > max_entries:
-                    original_count = len(entries)
-                    entries = entries[:max_entries]
-                    logger.info(
-                        f"Limited {url} to {len(entries)} entries (original: {original_count})"
-                    )
-
-                # Get feed info
-                feed_info = {
-                    "title": parsed.feed.get("title"),
-                    "link": parsed.feed.get("link"),
-                    "description": parsed.feed.get("description"),
-                }
-
-                fetch_time = time.time() - start_time
-
-                logger.info(f"Fetched {len(entries)} entries from {url} in {fetch_time:.2f}s")
-
-                result = FetchResult(
-                    success=True,
-                    feed_id=feed_id,
-                    feed_url=url,
-                    entries_count=len(entries),
-                    entries=entries,
-                    fetch_time_seconds=fetch_time,
-                    http_status=http_status,
-                    etag=response_etag,
-                    last_modified=response_last_modified,
-                    feed_data=parsed,
-                    feed_info=feed_info,
+                result = build_fetch_result(
+                    response, url, feed_id, start_time, max_entries, only_recent
                 )
-
                 self.stats.add_result(result)
                 return result
 
-            except httpx.TimeoutException as e:
-                last_error = f"Timeout: {str(e)}"
-                logger.warning(
-                    f"Timeout fetching {url} (attempt {attempt + 1}/{self.max_retries + 1})"
-                )
-
-            except httpx.HTTPStatusError as e:
-                last_error = f"HTTP {e.response.status_code}: {str(e)}"
-                http_status = e.response.status_code
-
-                # Don't retry client errors (4xx)
-                if 400 <= e.response.status_code < 500:
-                    logger.error(f"Client error fetching {url}: {last_error}")
-                    break
-
-                logger.warning(f"HTTP error fetching {url} (attempt {attempt + 1})")
-
-            except httpx.RequestError as e:
-                last_error = f"Request error: {str(e)}"
-                logger.warning(f"Network error fetching {url} (attempt {attempt + 1})")
-
             except Exception as e:
-                last_error = f"Unexpected error: {type(e).__name__}: {str(e)}"
-                logger.error(f"Error fetching {url}: {last_error}")
-                break
+                last_error, status, retry = describe_fetch_error(e, url, attempt, attempts)
+                http_status = status or http_status
+                if not retry:
+                    break
 
             # Retry delay
             if attempt < self.max_retries:
                 time.sleep(self.retry_delay_seconds * (attempt + 1))
 
         # All retries failed
-        fetch_time = time.time() - start_time
         result = FetchResult(
             success=False,
             feed_id=feed_id,
             feed_url=url,
-            fetch_time_seconds=fetch_time,
+            fetch_time_seconds=time.time() - start_time,
             error=last_error or "Unknown error",
             http_status=http_status,
         )
@@ -273,174 +386,24 @@ class FeedFetcher:
         Returns:
             FetchResult with entries or error
         """
-        start_time = time.time()
-        feed_id = feed.id
-        feed_url = feed.url
-
-        logger.debug(f"Fetching feed: {feed.name or feed_url} (ID: {feed_id})")
-
-        last_error = None
-        http_status = None
-        etag = None
-        last_modified = None
-        entries = []
-
-        for attempt in range(self.max_retries + 1):
-            try:
-                # Fetch with HTTP client first to get headers
-                http_result = self._fetch_http(
-                    feed_url,
-                    etag=feed.etag if not attempt else None,
-                    last_modified=feed.last_modified if not attempt else None,
-                )
-
-                http_status = http_result.status_code
-                etag = http_result.headers.get("ETag")
-                last_modified = http_result.headers.get("Last-Modified")
-
-                # Check for Not Modified
-                if http_status == 304:
-                    logger.debug(f"Feed not modified: {feed_url}")
-                    return FetchResult(
-                        success=True,
-                        feed_id=feed_id,
-                        feed_url=feed_url,
-                        entries_count=0,
-                        fetch_time_seconds=time.time() - start_time,
-                        http_status=http_status,
-                        etag=etag,
-                        last_modified=last_modified,
-                    )
-
-                # Parse with feedparser
-                parsed = feedparser.parse(http_result.content)
-                entries = parsed.get("entries", [])
-
-                # Apply max entries limit from feed settings
-                # Handle None case and treat 0 as no limit
-                max_entries = None
-                if feed.max_entries_per_fetch is not None and feed.max_entries_per_fetch > 0:
-                    max_entries = feed.max_entries_per_fetch
-
-                if max_entries and len(entries) > max_entries:
-                    original_count = len(entries)
-                    entries = entries[:max_entries]
-                    logger.info(
-                        f"Limited feed {feed_url} to {len(entries)} entries (original: {original_count})"
-                    )
-
-                # Apply date filter if feed.fetch_only_recent is enabled
-                if feed.fetch_only_recent:
-                    config = get_config()
-                    recent_days = config.fetcher.fetch_recent_days
-                    if recent_days > 0:
-                        from datetime import datetime, timedelta
-
-                        cutoff_date = datetime.utcnow() - timedelta(days=recent_days)
-                        original_count = len(entries)
-
-                        # Filter entries that have published/updated dates within the recent period
-                        filtered_entries = []
-                        for e in entries:
-                            # Try to get a date from the entry
-                            entry_date = None
-                            if e.get("published_parsed"):
-                                entry_date = datetime(*e["published_parsed"][:6])
-                            elif e.get("updated_parsed"):
-                                entry_date = datetime(*e["updated_parsed"][:6])
-
-                            # Keep entry if it has a valid date within the recent period, or if no date is available
-                            if entry_date is None or entry_date >= cutoff_date:
-                                filtered_entries.append(e)
-
-                        entries = filtered_entries
-                        if len(entries) < original_count:
-                            logger.info(
-                                f"Filtered {original_count - len(entries)} old entries from {feed_url} (older than {recent_days} days)"
-                            )
-
-                # Get feed info
-                feed_info = {
-                    "title": parsed.feed.get("title"),
-                    "link": parsed.feed.get("link"),
-                    "description": parsed.feed.get("description"),
-                }
-
-                fetch_time = time.time() - start_time
-
-                logger.info(
-                    f"Fetched {len(entries)} entries from {feed.name or feed_url} "
-                    f"in {fetch_time:.2f}s"
-                )
-
-                result = FetchResult(
-                    success=True,
-                    feed_id=feed_id,
-                    feed_url=feed_url,
-                    entries_count=len(entries),
-                    entries=entries,
-                    fetch_time_seconds=fetch_time,
-                    http_status=http_status,
-                    etag=etag,
-                    last_modified=last_modified,
-                    feed_data=parsed,
-                    feed_info=feed_info,
-                )
-
-                self.stats.add_result(result)
-
-                # Update feed in database if session provided
-                if self.session:
-                    self._update_feed_after_success(feed, result, etag, last_modified)
-
-                return result
-
-            except httpx.TimeoutException as e:
-                last_error = f"Timeout: {str(e)}"
-                logger.warning(
-                    f"Timeout fetching {feed_url} (attempt {attempt + 1}/{self.max_retries + 1})"
-                )
-
-            except httpx.HTTPStatusError as e:
-                last_error = f"HTTP {e.response.status_code}: {str(e)}"
-                http_status = e.response.status_code
-
-                # Don't retry client errors (4xx)
-                if 400 <= e.response.status_code < 500:
-                    logger.error(f"Client error fetching {feed_url}: {last_error}")
-                    break
-
-                logger.warning(f"HTTP error fetching {feed_url} (attempt {attempt + 1})")
-
-            except httpx.RequestError as e:
-                last_error = f"Request error: {str(e)}"
-                logger.warning(f"Network error fetching {feed_url} (attempt {attempt + 1})")
-
-            except Exception as e:
-                last_error = f"Unexpected error: {type(e).__name__}: {str(e)}"
-                logger.error(f"Error fetching {feed_url}: {last_error}")
-                break
-
-            # Retry delay
-            if attempt < self.max_retries:
-                time.sleep(self.retry_delay_seconds * (attempt + 1))
-
-        # All retries failed
-        fetch_time = time.time() - start_time
-        result = FetchResult(
-            success=False,
-            feed_id=feed_id,
-            feed_url=feed_url,
-            fetch_time_seconds=fetch_time,
-            error=last_error or "Unknown error",
-            http_status=http_status,
+        logger.debug(f"Fetching feed: {feed.name or feed.url} (ID: {feed.id})")
+
+        # Handle None case and treat 0 as no limit
+        max_entries = None
+        if feed.max_entries_per_fetch is not None and feed.max_entries_per_fetch > 0:
+            max_entries = feed.max_entries_per_fetch
+
+        result = self.fetch_url(
+            feed.url,
+            feed_id=feed.id,
+            etag=feed.etag,
+            last_modified=feed.last_modified,
+            max_entries=max_entries,
+            only_recent=bool(feed.fetch_only_recent),
         )
 
-        self.stats.add_result(result)
-
-        # Update feed error status in database if session provided
-        if self.session:
-            self._update_feed_after_error(feed, result)
+        # Update feed in database if session provided
+        self.update_feed_after_fetch(feed, result)
 
         return result
 
@@ -458,28 +421,37 @@ class FeedFetcher:
             last_modified: Optional Last-Modified for conditional request
 
         Returns:
-            httpx Response
+            httpx Response; the status is checked by build_fetch_result()
 
         Raises:
             httpx.TimeoutException: On timeout
-            httpx.HTTPStatusError: On HTTP error
             httpx.RequestError: On network error
         """
-        headers = {"User-Agent": self.user_agent}
-
-        if etag:
-            headers["If-None-Match"] = etag
-        if last_modified:
-            headers["If-Modified-Since"] = last_modified
+        headers = {"User-Agent": self.user_agent, **conditional_headers(etag, last_modified)}
 
         with httpx.Client(
             timeout=self.timeout_seconds,
             follow_redirects=self.follow_redirects,
             max_redirects=self.max_redirects,
         ) as client:
-            response = client.get(url, headers=headers)
-            response.raise_for_status()
-            return response
+            return client.get(url, headers=headers)
+
+    def update_feed_after_fetch(self, feed: FeedModel, result: FetchResult) -> None:
+        """Record a fetch result on the feed, if the fetcher has a session.
+
+        A 304 Not Modified counts as a successful fetch.
+
+        Args:
+            feed: FeedModel instance that was fetched
+            result: FetchResult for the feed
+        """
+        if not self.session:
+            return
+
+        if result.success:
+            self._update_feed_after_success(feed, result, result.etag, result.last_modified)
+        else:
+            self._update_feed_after_error(feed, result)
 
     def _update_feed_after_success(
         self,
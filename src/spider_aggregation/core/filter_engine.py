@@ -4,7 +4,6 @@ Filter engine for applying filter rules to entries.
 Supports keyword, regex, tag, and language filtering with include/exclude logic.
 """
 
-import json
 import re
 from functools import lru_cache
 from typing import Optional
@@ -15,6 +14,14 @@ from spider_aggregation.models.entry import EntryModel
 
 logger = get_logger(__name__)
 
+# Try to import Hyperscan for multi-pattern keyword/regex matching
+try:
+    import hyperscan
+
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
 
 class FilterResult:
     """Result of filtering an entry."""
@@ -60,6 +67,7 @@ class FilterEngine:
 
         # Pre-compile regex patterns
         self._compile_regex_patterns()
+        self._compile_multi_pattern_db()
 
         logger.info(f"FilterEngine initialized with {len(self.rules)} rules")
 
@@ -74,6 +82,109 @@ class FilterEngine:
                 except re.error as e:
                     logger.warning(f"Invalid regex pattern in rule '{rule.name}': {e}")
 
+    def _compile_multi_pattern_db(self) -> None:
+        """Compile all keyword and regex rules into a single Hyperscan database.
+
+        Keywords are added as escaped literals. One scan of each text field
+        then reports every matching rule, instead of running each pattern
+        separately. Falls back to the per-rule path when Hyperscan is not
+        installed or rejects a pattern.
+        """
+        self._hs_db = None
+        self._hs_rule_ids: list[int] = []
+
+        if not HYPERSCAN_AVAILABLE:
+            return
+
+        rule_ids = []
+        expressions = []
+        for rule in self.rules:
+            if rule.rule_type == "keyword":
+                rule_ids.append(rule.id)
+                expressions.append(re.escape(rule.pattern).encode("utf-8"))
+            elif rule.id in self._regex_cache:
+                rule_ids.append(rule.id)
+                expressions.append(self._regex_cache[rule.id].pattern.encode("utf-8"))
+
+        if not rule_ids:
+            return
+
+        flags = (
+            hyperscan.HS_FLAG_CASELESS
+            | hyperscan.HS_FLAG_UTF8
+            | hyperscan.HS_FLAG_SINGLEMATCH
+            | hyperscan.HS_FLAG_ALLOWEMPTY
+        )
+
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=expressions,
+                ids=list(range(len(rule_ids))),
+                elements=len(rule_ids),
+                flags=[flags] * len(rule_ids),
+            )
+        except hyperscan.error as e:
+            logger.debug(f"Hyperscan cannot compile filter rules, using per-rule fallback: {e}")
+            return
+
+        self._hs_db = db
+        self._hs_rule_ids = rule_ids
+
+    def _scan_rules(self, fields: tuple[str, ...]) -> set[int]:
+        r"""Find all keyword and regex rules matching an entry in one scan per field.
+
+        Fields are scanned separately, as regex rules are matched field by
+        field, so ``^``/``$`` and patterns such as ``\s`` cannot match across
+        the boundary between title, summary and content.
+
+        Args:
+            fields: Non-empty searchable text fields of the entry
+
+        Returns:
+            Set of IDs of the rules that matched
+        """
+        matched: set[int] = set()
+
+        def on_match(pattern_id: int, start: int, end: int, flags: int, context) -> None:
+            matched.add(self._hs_rule_ids[pattern_id])
+
+        for text in fields:
+            self._hs_db.scan(text.encode("utf-8"), match_event_handler=on_match)
+
+        return matched
+
+    @staticmethod
+    def _entry_fields(entry: EntryModel) -> tuple[str, ...]:
+        """Get the non-empty title, summary and content of an entry.
+
+        Args:
+            entry: Entry to read text from
+
+        Returns:
+            Tuple of searchable text fields
+        """
+        return tuple(x for x in (entry.title, entry.summary, entry.content) if x)
+
+    @staticmethod
+    def _entry_haystack(entry: EntryModel) -> str:
+        """Get the joined title, summary and content of an entry.
+
+        Used for keyword rules, which are literals and so match the joined
+        text exactly as they match each field. Uses the precomputed
+        ``haystack`` of ``EntryData`` when available.
+
+        Args:
+            entry: Entry to read text from
+
+        Returns:
+            Newline-joined searchable text
+        """
+        haystack = getattr(entry, "haystack", None)
+        if haystack is not None:
+            return haystack
+        return "\n".join(x for x in (entry.title, entry.summary, entry.content) if x)
+
     def _match_regex(self, pattern: re.Pattern, text: Optional[str]) -> bool:
         """Match a regex pattern against text.
 
@@ -115,28 +226,21 @@ class FilterEngine:
             return False
         return self._match_keyword_cached(pattern, text.lower())
 
-    def _match_tag(self, pattern: str, tags_json: Optional[str]) -> bool:
+    def _match_tag(self, pattern: str, tags: Optional[list[str]]) -> bool:
         """Match a tag pattern against entry tags.
 
         Args:
             pattern: Tag pattern to match
-            tags_json: JSON string of tags
+            tags: List of tags
 
         Returns:
             True if tag matches
         """
-        if not tags_json:
+        if not tags:
             return False
 
-        try:
-            tags = json.loads(tags_json)
-            if not isinstance(tags, list):
-                return False
-
-            pattern_lower = pattern.lower()
-            return any(pattern_lower in tag.lower() for tag in tags)
-        except json.JSONDecodeError, TypeError:
-            return False
+        pattern_lower = pattern.lower()
+        return any(pattern_lower in tag.lower() for tag in tags)
 
     def _match_language(self, pattern: str, language: Optional[str]) -> bool:
         """Match a language pattern.
@@ -152,35 +256,44 @@ class FilterEngine:
             return False
         return pattern.lower() == language.lower()
 
-    def _rule_matches(self, rule: FilterRuleModel, entry: EntryModel) -> bool:
+    def _rule_matches(
+        self,
+        rule: FilterRuleModel,
+        entry: EntryModel,
+        scan_matches: Optional[set[int]] = None,
+        haystack: Optional[str] = None,
+        fields: Optional[tuple[str, ...]] = None,
+    ) -> bool:
         """Check if a rule matches an entry.
 
         Args:
             rule: Filter rule to check
             entry: Entry to check against
+            scan_matches: Keyword/regex rule IDs already matched by the Hyperscan scan
+            haystack: Joined searchable text of the entry, built if not given
+            fields: Searchable text fields of the entry, read if not given
 
         Returns:
             True if the rule matches the entry
         """
+        if scan_matches is not None and rule.rule_type in ("keyword", "regex"):
+            return rule.id in scan_matches
+
         if rule.rule_type == "keyword":
-            # Check in title and content
-            title_match = self._match_keyword(rule.pattern, entry.title)
-            content_match = self._match_keyword(rule.pattern, entry.content) or self._match_keyword(
-                rule.pattern, entry.summary
-            )
-            return title_match or content_match
+            # Check in title, summary and content
+            if haystack is None:
+                haystack = self._entry_haystack(entry)
+            return self._match_keyword(rule.pattern, haystack)
 
         elif rule.rule_type == "regex":
-            # Check in title and content
+            # Check in title, summary and content, each on its own
             pattern = self._regex_cache.get(rule.id)
             if not pattern:
                 return False
 
-            title_match = self._match_regex(pattern, entry.title)
-            content_match = self._match_regex(pattern, entry.content) or self._match_regex(
-                pattern, entry.summary
-            )
-            return title_match or content_match
+            if fields is None:
+                fields = self._entry_fields(entry)
+            return any(self._match_regex(pattern, text) for text in fields)
 
         elif rule.rule_type == "tag":
             return self._match_tag(rule.pattern, entry.tags)
@@ -207,12 +320,15 @@ class FilterEngine:
         matched_rules = []
         has_include_rules = any(r.match_type == "include" for r in self.rules)
         matched_include = False
+        haystack = self._entry_haystack(entry)
+        fields = self._entry_fields(entry)
+        scan_matches = self._scan_rules(fields) if self._hs_db is not None else None
 
         for rule in self.rules:
             if not rule.enabled:
                 continue
 
-            if self._rule_matches(rule, entry):
+            if self._rule_matches(rule, entry, scan_matches, haystack, fields):
                 matched_rules.append(rule.name)
 
                 if rule.match_type == "exclude":
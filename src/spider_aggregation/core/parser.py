@@ -60,13 +60,8 @@ class ContentParser:
             "updated_at": self._parse_date(raw_entry.get("updated")),
             "tags": self._extract_tags(raw_entry),
             "language": self._detect_language(raw_entry),
-            "reading_time_seconds": None,
         }
 
-        # Calculate reading time
-        if parsed["content"]:
-            parsed["reading_time_seconds"] = self._calculate_reading_time(parsed["content"])
-
         return parsed
 
     def _normalize_title(self, title: Optional[str]) -> Optional[str]:
@@ -445,33 +440,6 @@ class ContentParser:
 
         return None
 
-    def _calculate_reading_time(self, content: str) -> int:
-        """Calculate estimated reading time in seconds.
-
-        Args:
-            content: Content text
-
-        Returns:
-            Reading time in seconds
-        """
-        if not content:
-            return 0
-
-        # Count words (approximate)
-        # Split by whitespace to get word count
-        words = content.split()
-        word_count = len(words)
-
-        # Average reading speed: ~200-250 words per minute
-        # For Chinese: ~400-500 characters per minute (we use word_count which underestimates)
-        # For English: ~200-250 words per minute
-        words_per_minute = 200
-
-        reading_time_minutes = word_count / words_per_minute
-        reading_time_seconds = int(reading_time_minutes * 60)
-
-        return max(10, reading_time_seconds)  # Minimum 10 seconds
-
 
 class FeedMetadataParser:
     """Parser for feed metadata."""
@@ -4,11 +4,18 @@ Task scheduler for automated feed fetching.
 Uses APScheduler to manage periodic jobs for fetching RSS/Atom feeds.
 """
 
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable, Optional
 
-from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED, JobEvent
+from apscheduler.events import (
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_MAX_INSTANCES,
+    JobEvent,
+)
+from apscheduler.executors.base import MaxInstancesReachedError
 from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -48,10 +55,60 @@ class SchedulerStats:
     total_executions: int = 0
     successful_executions: int = 0
     failed_executions: int = 0
+    skipped_executions: int = 0
     last_execution_time: Optional[datetime] = None
     uptime_seconds: float = 0.0
 
 
+class JobQueueFullError(MaxInstancesReachedError):
+    """Raised when a job run is submitted while the work queue is full."""
+
+    def __init__(self, job, max_pending: int):
+        Exception.__init__(
+            self, f'Job "{job.id}" skipped: work queue is full ({max_pending} pending runs)'
+        )
+
+
+class BoundedThreadPoolExecutor(ThreadPoolExecutor):
+    """Thread pool executor with a bounded number of pending job runs.
+
+    The stock executor queues every submitted run without limit. Here at most
+    ``max_workers + max_queue`` runs may be running or waiting; further runs
+    are skipped (APScheduler reports them as EVENT_JOB_MAX_INSTANCES) and the
+    job simply fires again on its next interval.
+    """
+
+    def __init__(self, max_workers: int = 10, max_queue: Optional[int] = None, pool_kwargs=None):
+        """Initialize bounded executor.
+
+        Args:
+            max_workers: Maximum number of worker threads
+            max_queue: Maximum runs waiting for a worker (default max_workers * 4)
+            pool_kwargs: Keyword arguments for the underlying thread pool
+        """
+        super().__init__(max_workers=max_workers, pool_kwargs=pool_kwargs)
+        self.max_queue = max_queue or max_workers * 4
+        self.max_pending = max_workers + self.max_queue
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+
+    def _do_submit_job(self, job, run_times):
+        if not self._slots.acquire(blocking=False):
+            raise JobQueueFullError(job, self.max_pending)
+        try:
+            super()._do_submit_job(job, run_times)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _run_job_success(self, job_id, events):
+        self._slots.release()
+        super()._run_job_success(job_id, events)
+
+    def _run_job_error(self, job_id, exc, traceback=None):
+        self._slots.release()
+        super()._run_job_error(job_id, exc, traceback)
+
+
 class FeedScheduler:
     """Scheduler for automated feed fetching."""
 
@@ -60,6 +117,7 @@ class FeedScheduler:
         session: Optional[Session] = None,
         max_workers: int = 3,
         db_manager=None,
+        max_queue: Optional[int] = None,
     ):
         """Initialize feed scheduler.
 
@@ -67,17 +125,23 @@ class FeedScheduler:
             session: Optional database session for feed operations
             max_workers: Maximum number of concurrent worker threads
             db_manager: Optional DatabaseManager for creating sessions in jobs
+            max_queue: Maximum fetch runs waiting for a worker (default max_workers * 4)
         """
         config = get_config()
 
         self.session = session
         self.db_manager = db_manager
         self.max_workers = max_workers
+        self.max_queue = max_queue or max_workers * 4
         self.fetch_interval_minutes = config.scheduler.min_interval_minutes
 
-        # Create background scheduler with thread pool executor
+        # Create background scheduler with a bounded thread pool executor
         self.scheduler = BackgroundScheduler(
-            executors={"default": ThreadPoolExecutor(max_workers=max_workers)},
+            executors={
+                "default": BoundedThreadPoolExecutor(
+                    max_workers=max_workers, max_queue=self.max_queue
+                )
+            },
             timezone=config.scheduler.timezone,
         )
 
@@ -92,6 +156,7 @@ class FeedScheduler:
         # Add event listeners
         self.scheduler.add_listener(self._on_job_executed, EVENT_JOB_EXECUTED)
         self.scheduler.add_listener(self._on_job_error, EVENT_JOB_ERROR)
+        self.scheduler.add_listener(self._on_job_skipped, EVENT_JOB_MAX_INSTANCES)
 
     def start(self) -> None:
         """Start the scheduler."""
@@ -464,11 +529,24 @@ class FeedScheduler:
             self._job_errors[job_id] = error_msg
             logger.error(f"Job {job_id} failed: {error_msg}")
 
+    def _on_job_skipped(self, event: JobEvent) -> None:
+        """Handle job run skipped because its previous run is still active.
+
+        Runs rejected by a full work queue (JobQueueFullError) are reported
+        through the same event.
+
+        Args:
+            event: Job event
+        """
+        self.stats.skipped_executions += 1
+        logger.warning(f"Job {event.job_id} skipped: its previous run is still active")
+
 
 def create_scheduler(
     session: Optional[Session] = None,
     max_workers: int = 3,
     db_manager=None,
+    max_queue: Optional[int] = None,
 ) -> FeedScheduler:
     """Create a configured FeedScheduler instance.
 
@@ -476,8 +554,11 @@ def create_scheduler(
         session: Optional database session
         max_workers: Maximum number of concurrent worker threads
         db_manager: Optional DatabaseManager for creating sessions in jobs
+        max_queue: Maximum fetch runs waiting for a worker
 
     Returns:
         Configured FeedScheduler instance
     """
-    return FeedScheduler(session=session, max_workers=max_workers, db_manager=db_manager)
+    return FeedScheduler(
+        session=session, max_workers=max_workers, db_manager=db_manager, max_queue=max_queue
+    )
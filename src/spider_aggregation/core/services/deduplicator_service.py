@@ -45,6 +45,21 @@ class DeduplicatorService:
         """
         return self._deduplicator.check_duplicate(parsed_entry, feed_id)
 
+    def check_duplicates(
+        self, parsed_entries: list[dict], feed_id: int, check_links: bool = True
+    ) -> list["DedupResult"]:
+        """Check a batch of entries from one feed, with one lookup per hash kind.
+
+        Args:
+            parsed_entries: Parsed entry data
+            feed_id: Feed ID
+            check_links: Look for existing links (not needed before bulk_create)
+
+        Returns:
+            DedupResult for each entry, in order
+        """
+        return self._deduplicator.check_duplicates(parsed_entries, feed_id, check_links)
+
 
 def create_deduplicator_service(
     session: Optional[Session] = None,
@@ -69,6 +69,33 @@ class FetcherService:
             max_entries=max_entries if max_entries > 0 else None,
         )
 
+    async def fetch_many_async(self, feeds: list) -> list["FetchResult"]:
+        """Fetch many feeds concurrently on the running event loop.
+
+        Requests share one async connection pool. When the service has a
+        database session, feed status is updated after all fetches finish.
+
+        Args:
+            feeds: List of FeedModel instances to fetch
+
+        Returns:
+            List of FetchResult instances, in the same order as feeds
+        """
+        from spider_aggregation.core.async_fetcher import AsyncFeedFetcher
+
+        async_fetcher = AsyncFeedFetcher(
+            timeout_seconds=self._fetcher.timeout_seconds,
+            max_retries=self._fetcher.max_retries,
+            user_agent=self._fetcher.user_agent,
+        )
+        results = await async_fetcher.fetch_multiple(feeds)
+
+        for feed, result in zip(feeds, results):
+            self._fetcher.stats.add_result(result)
+            self._fetcher.update_feed_after_fetch(feed, result)
+
+        return results
+
     def fetch_feeds_to_fetch(self, session: Session) -> list:
         """Get list of feeds that need to be fetched.
 
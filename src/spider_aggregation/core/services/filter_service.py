@@ -4,7 +4,7 @@ Facade for content filtering operations.
 Provides unified interface for filtering entries based on rules.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Optional
 
 from spider_aggregation.logger import get_logger
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from spider_aggregation.core.filter_engine import FilterResult
 
 
-@dataclass
+@dataclass(slots=True)
 class EntryData:
     """Data class for entry filtering.
 
@@ -25,13 +25,13 @@ class EntryData:
     content: str = ""
     summary: str = ""
     link: str = ""
-    tags: list[str] = None
+    tags: list[str] = field(default_factory=list)
     language: str = ""
+    haystack: str = field(init=False, default="", repr=False, compare=False)
 
-    def __post_init__(self):
-        """Initialize default values."""
-        if self.tags is None:
-            self.tags = []
+    def __post_init__(self) -> None:
+        """Join the searchable text fields once so rules scan a single string."""
+        self.haystack = "\n".join(x for x in (self.title, self.summary, self.content) if x)
 
     @classmethod
     def from_dict(cls, data: dict) -> "EntryData":
@@ -51,13 +51,14 @@ class EntryData:
                 tags = json.loads(tags)
             except json.JSONDecodeError, TypeError:
                 tags = []
+        tags = tags or []
 
         return cls(
             title=data.get("title", ""),
             content=data.get("content", ""),
             summary=data.get("summary", ""),
             link=data.get("link", ""),
-            tags=tags if tags else [],
+            tags=tags,
             language=data.get("language", ""),
         )
 
@@ -79,13 +80,14 @@ class EntryData:
                 tags = json.loads(tags)
             except json.JSONDecodeError, TypeError:
                 tags = []
+        tags = tags or []
 
         return cls(
             title=getattr(entry, "title", ""),
             content=getattr(entry, "content", ""),
             summary=getattr(entry, "summary", ""),
             link=getattr(entry, "link", ""),
-            tags=tags if tags else [],
+            tags=tags,
             language=getattr(entry, "language", ""),
         )
 
@@ -105,8 +107,24 @@ class FilterService:
         from spider_aggregation.core.factories import create_filter_engine
 
         self._engine = create_filter_engine(rules=rules)
+        self._rules_key: Optional[tuple] = None
         self._logger = get_logger(__name__)
 
+    def _refresh_engine(self, rules: list) -> None:
+        """Rebuild the engine only when the rule set has changed.
+
+        Compiling the rules (and their Hyperscan database) is far more
+        expensive than filtering one entry, so the engine is kept while the
+        (id, updated_at) pairs of the enabled rules stay the same.
+
+        Args:
+            rules: Current enabled FilterRuleModel instances
+        """
+        rules_key = tuple((rule.id, rule.updated_at) for rule in rules)
+        if rules_key != self._rules_key:
+            self._engine = self._engine.__class__(rules=rules)
+            self._rules_key = rules_key
+
     def apply(self, parsed_entry: dict, filter_rule_repo) -> "FilterResult":
         """Apply filter rules to an entry.
 
@@ -124,8 +142,8 @@ class FilterService:
         if not rules:
             return FilterResult(passed=True, matched_rules=[])
 
-        # Reload engine with current rules
-        self._engine = self._engine.__class__(rules=rules)
+        # Reload engine if the rules changed
+        self._refresh_engine(rules)
 
         # Create EntryData from parsed entry dictionary
         entry_data = EntryData.from_dict(parsed_entry)
@@ -148,8 +166,8 @@ class FilterService:
         if not rules:
             return FilterResult(passed=True, matched_rules=[])
 
-        # Reload engine with current rules
-        self._engine = self._engine.__class__(rules=rules)
+        # Reload engine if the rules changed
+        self._refresh_engine(rules)
 
         # Create EntryData from EntryModel
         entry_data = EntryData.from_model(entry)
@@ -162,6 +180,7 @@ class FilterService:
             rules: New list of FilterRuleModel instances
         """
         self._engine.reload_rules(rules)
+        self._rules_key = None
 
 
 def create_filter_service(rules: Optional[list] = None) -> FilterService:
@@ -50,20 +50,29 @@ class ParserService:
         Returns:
             Parsed entry dict with normalized data
         """
+        from spider_aggregation.config import get_config
         from spider_aggregation.utils.hash_utils import (
             compute_title_hash,
             compute_link_hash,
             compute_content_hash,
         )
 
+        dedup_config = get_config().deduplicator
+
         parsed = self._parser.parse_entry(entry_data)
         # Add feed_id to the parsed result
         parsed["feed_id"] = feed_id
 
         # Add hash fields for deduplication
-        parsed["title_hash"] = compute_title_hash(parsed.get("title")) or ""
-        parsed["link_hash"] = compute_link_hash(parsed.get("link")) or ""
-        parsed["content_hash"] = compute_content_hash(parsed.get("content"))
+        parsed["title_hash"] = (
+            compute_title_hash(parsed.get("title"), dedup_config.title_hash_method) or ""
+        )
+        parsed["link_hash"] = (
+            compute_link_hash(parsed.get("link"), dedup_config.link_hash_method) or ""
+        )
+        parsed["content_hash"] = compute_content_hash(
+            parsed.get("content"), dedup_config.content_hash_method
+        )
 
         # Keep tags as list - EntryRepository will handle JSON serialization
         # The ContentParser returns tags as a list, which is what EntryCreate expects
@@ -22,6 +22,7 @@ class SchedulerService:
         session: Optional[Session] = None,
         max_workers: Optional[int] = None,
         db_manager=None,
+        max_queue: Optional[int] = None,
     ):
         """Initialize scheduler service.
 
@@ -29,6 +30,7 @@ class SchedulerService:
             session: Optional database session
             max_workers: Maximum worker threads
             db_manager: Optional DatabaseManager instance
+            max_queue: Maximum queued fetch runs (default max_workers * 4)
         """
         from spider_aggregation.core.factories import create_scheduler
 
@@ -36,6 +38,7 @@ class SchedulerService:
             session=session,
             max_workers=max_workers,
             db_manager=db_manager,
+            max_queue=max_queue,
         )
         self._logger = get_logger(__name__)
 
@@ -81,6 +84,7 @@ def create_scheduler_service(
     session: Optional[Session] = None,
     max_workers: Optional[int] = None,
     db_manager=None,
+    max_queue: Optional[int] = None,
 ) -> SchedulerService:
     """Create a SchedulerService instance.
 
@@ -88,6 +92,7 @@ def create_scheduler_service(
         session: Optional database session
         max_workers: Maximum worker threads
         db_manager: Optional DatabaseManager
+        max_queue: Maximum queued fetch runs
 
     Returns:
         Configured SchedulerService
@@ -96,4 +101,5 @@ def create_scheduler_service(
         session=session,
         max_workers=max_workers,
         db_manager=db_manager,
+        max_queue=max_queue,
     )
@@ -4,6 +4,7 @@ Facade for content summarization operations.
 Provides unified interface for generating content summaries.
 """
 
+import asyncio
 from typing import Optional
 
 from spider_aggregation.logger import get_logger
@@ -45,6 +46,20 @@ class SummarizerService:
         """
         return self._summarizer.summarize(content)
 
+    async def summarize_async(self, content: str) -> str:
+        """Generate a summary without blocking the event loop.
+
+        The summarizer (and the AI SDK behind it) is synchronous, so the call
+        runs in a worker thread; many summaries can be awaited concurrently.
+
+        Args:
+            content: Input content
+
+        Returns:
+            Summary string
+        """
+        return await asyncio.to_thread(self._summarizer.summarize, content)
+
 
 def create_summarizer_service(
     method: Optional[str] = None,
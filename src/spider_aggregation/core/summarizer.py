@@ -4,7 +4,9 @@ Summarizer for generating article summaries.
 Supports extractive summarization (rule-based) and AI summarization (Zhipu AI).
 """
 
+import heapq
 import re
+from array import array
 from typing import Optional
 from dataclasses import dataclass
 
@@ -22,6 +24,14 @@ except ImportError:
     ZHIPUAI_AVAILABLE = False
     logger.warning("zhipuai not available, AI summarization disabled")
 
+# Zhipu AI clients keyed by API key, shared across summarizer instances so
+# the underlying HTTP connection pool is reused between calls
+_ZHIPU_CLIENTS: dict[str, "ZhipuAI"] = {}
+
+# Sentence boundary patterns used by ExtractiveSummarizer
+_CJK_BOUNDARY_RE = re.compile(r"([。！？\n]+)")
+_EN_BOUNDARY_RE = re.compile(r"[.!?]+\s+")
+
 
 @dataclass
 class SummaryResult:
@@ -65,26 +75,31 @@ class ExtractiveSummarizer:
         # Simple sentence splitting using regex
         # This handles English and basic Chinese sentence boundaries
 
-        # Chinese sentence boundaries
-        sentences = re.split(r"([。！？\n]+)", text)
-
-        # Rejoin punctuation with sentences
-        result = []
-        for i in range(0, len(sentences) - 1, 2):
-            sentence = sentences[i] + (sentences[i + 1] if i + 1 < len(sentences) else "")
-            sentence = sentence.strip()
-            if sentence:
-                result.append(sentence)
-
-        # Handle remaining text
-        if len(sentences) % 2 == 1:
-            remaining = sentences[-1].strip()
-            if remaining:
-                result.append(remaining)
+        if text.isascii():
+            # ASCII fast path: the only possible Chinese-style boundary is a
+            # newline, so plain str.split gives the same result as the regex
+            result = [s for s in (line.strip() for line in text.split("\n")) if s]
+        else:
+            # Chinese sentence boundaries
+            sentences = _CJK_BOUNDARY_RE.split(text)
+
+            # Rejoin punctuation with sentences
+            result = []
+            for i in range(0, len(sentences) - 1, 2):
+                sentence = sentences[i] + (sentences[i + 1] if i + 1 < len(sentences) else "")
+                sentence = sentence.strip()
+                if sentence:
+                    result.append(sentence)
+
+            # Handle remaining text
+            if len(sentences) % 2 == 1:
+                remaining = sentences[-1].strip()
+                if remaining:
+                    result.append(remaining)
 
         # Also try English-style splitting
         if len(result) <= 1:
-            result = re.split(r"[.!?]+\s+", text)
+            result = _EN_BOUNDARY_RE.split(text)
             result = [s.strip() for s in result if s.strip()]
 
         return result
@@ -155,21 +170,17 @@ class ExtractiveSummarizer:
             summary = " ".join(sentences)
             return SummaryResult(success=True, summary=summary, method="extractive")
 
-        # Score sentences
-        scored_sentences = [
-            (s, self._score_sentence(s, i, len(sentences))) for i, s in enumerate(sentences)
-        ]
-
-        # Sort by score and select top sentences
-        scored_sentences.sort(key=lambda x: x[1], reverse=True)
-        selected = scored_sentences[: self.max_sentences]
+        # Score sentences into a flat array indexed by position
+        total = len(sentences)
+        scores = array("d", (self._score_sentence(s, i, total) for i, s in enumerate(sentences)))
 
-        # Re-sort by original position
-        selected_with_pos = [(s, sentences.index(s), score) for s, score in selected]
-        selected_with_pos.sort(key=lambda x: x[1])
+        # Select top sentence positions (ties keep document order), then
+        # restore original order
+        top_positions = heapq.nlargest(self.max_sentences, range(total), key=scores.__getitem__)
+        top_positions.sort()
 
         # Join sentences
-        summary = " ".join(s for s, _, _ in selected_with_pos)
+        summary = " ".join(sentences[i] for i in top_positions)
 
         return SummaryResult(success=True, summary=summary, method="extractive")
 
@@ -206,7 +217,9 @@ class AISummarizer:
             logger.warning("ZHIPUAI_API_KEY not set, AI summarization unavailable")
             self._client = None
         else:
-            self._client = ZhipuAI(api_key=api_key)
+            self._client = _ZHIPU_CLIENTS.get(api_key) or _ZHIPU_CLIENTS.setdefault(
+                api_key, ZhipuAI(api_key=api_key)
+            )
             logger.info(f"AI Summarizer initialized with model: {model}")
 
     def _build_prompt(self, text: str) -> str:
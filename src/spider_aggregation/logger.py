@@ -2,16 +2,334 @@
 Logging configuration for spider aggregation.
 
 Uses loguru for advanced logging capabilities with rotation and retention.
+Optionally, the C-implemented picologging backend can be selected with
+``LOG_BACKEND=picologging``; it writes through a dedicated listener thread.
 """
 
+import copy
+import queue
+import re
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
-from loguru import logger as _logger
-
 from spider_aggregation.config import get_config
 
+# Try to import picologging (optional C logging backend)
+try:
+    import picologging as _pl
+    import picologging.handlers as _pl_handlers
+
+    PICOLOGGING_AVAILABLE = True
+except ImportError:
+    PICOLOGGING_AVAILABLE = False
+
+# Stdlib-style format used by the picologging backend
+_PICO_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s - %(message)s"
+
+# Number of rotated files kept by the picologging backend
+_PICO_BACKUP_COUNT = 10
+
+_LEVEL_NUMBERS = {
+    "TRACE": 5,
+    "DEBUG": 10,
+    "INFO": 20,
+    "SUCCESS": 25,
+    "WARNING": 30,
+    "ERROR": 40,
+    "CRITICAL": 50,
+}
+
+_SIZE_UNITS = {"B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3}
+
+
+def _parse_size(value: str) -> int:
+    """Convert a loguru size rotation (e.g. "100 MB") to bytes.
+
+    Args:
+        value: Size string
+
+    Returns:
+        Size in bytes, or 0 if the value is not a size (e.g. "1 day")
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMG]?B)\s*", value.upper())
+    if not match:
+        return 0
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2)])
+
+
+class _PicoLogger:
+    """Adapter exposing the loguru calls used in this project over picologging."""
+
+    __slots__ = ("_logger",)
+
+    def __init__(self, name: Optional[str] = None):
+        self._logger = _pl.getLogger(name or "spider_aggregation")
+
+    def bind(self, **kwargs) -> "_PicoLogger":
+        name = kwargs.get("name")
+        return _PicoLogger(name) if name else self
+
+    def _log(self, level: str, msg: str, args: tuple, kwargs: dict) -> None:
+        if args or kwargs:
+            msg = msg.format(*args, **kwargs)
+        self._logger.log(_LEVEL_NUMBERS[level], msg)
+
+    def trace(self, msg: str, *args, **kwargs) -> None:
+        self._log("TRACE", msg, args, kwargs)
+
+    def debug(self, msg: str, *args, **kwargs) -> None:
+        self._log("DEBUG", msg, args, kwargs)
+
+    def info(self, msg: str, *args, **kwargs) -> None:
+        self._log("INFO", msg, args, kwargs)
+
+    def success(self, msg: str, *args, **kwargs) -> None:
+        self._log("SUCCESS", msg, args, kwargs)
+
+    def warning(self, msg: str, *args, **kwargs) -> None:
+        self._log("WARNING", msg, args, kwargs)
+
+    def error(self, msg: str, *args, **kwargs) -> None:
+        self._log("ERROR", msg, args, kwargs)
+
+    def critical(self, msg: str, *args, **kwargs) -> None:
+        self._log("CRITICAL", msg, args, kwargs)
+
+    def exception(self, msg: str, *args, **kwargs) -> None:
+        if args or kwargs:
+            msg = msg.format(*args, **kwargs)
+        self._logger.exception(msg)
+
+
+# The loguru logger, imported on first use (see _LazyLogger)
+_loguru_logger = None
+
+
+def _resolve_loguru():
+    """Import loguru on first use and return its logger."""
+    global _loguru_logger
+
+    if _loguru_logger is None:
+        from loguru import logger as _imported_logger
+
+        _loguru_logger = _imported_logger
+    return _loguru_logger
+
+
+class _LazyLogger:
+    """Proxy for the configured logger that defers choosing and loading it.
+
+    Selecting the backend reads the configuration and the loguru backend
+    imports loguru, so both wait for the first log call: importing this module
+    (e.g. for a migration, which never logs) neither loads the configuration
+    nor imports loguru, even though most modules create their logger with
+    ``get_logger(__name__)`` at import time. ``bind`` returns another proxy
+    until the proxy is used. On first use the module-level proxy replaces
+    itself with the real logger, so later calls through the convenience
+    functions go straight to the backend.
+    """
+
+    __slots__ = ("_extra", "_target")
+
+    def __init__(self, **extra):
+        self._extra = extra
+        self._target = None
+
+    def _resolve(self):
+        if self._target is None:
+            real_logger = _PicoLogger() if _backend() == "picologging" else _resolve_loguru()
+            self._target = real_logger.bind(**self._extra) if self._extra else real_logger
+        return self._target
+
+    def bind(self, **kwargs):
+        if self._target is None:
+            return _LazyLogger(**self._extra, **kwargs)
+        return self._target.bind(**kwargs)
+
+    def __getattr__(self, name: str):
+        global _logger, logger
+
+        target = self._resolve()
+        if _logger is self:
+            _logger = logger = target
+        return getattr(target, name)
+
+
+def _select_backend() -> str:
+    """Select the logging backend from configuration.
+
+    Returns:
+        "picologging" if configured and installed, otherwise "loguru"
+    """
+    backend = get_config().logging.backend
+    if backend == "picologging" and not PICOLOGGING_AVAILABLE:
+        _resolve_loguru().warning("picologging not available, falling back to loguru")
+        return "loguru"
+    return backend
+
+
+# Selected logging backend, resolved on first use (see _backend)
+_BACKEND: Optional[str] = None
+
+
+def _backend() -> str:
+    """Get the logging backend, selecting it on the first call."""
+    global _BACKEND
+
+    if _BACKEND is None:
+        _BACKEND = _select_backend()
+    return _BACKEND
+
+
+class _BoundedQueueSink:
+    """Loguru sink handing formatted records to a writer thread.
+
+    Records go through a bounded queue so a slow disk cannot grow memory
+    without limit. When the queue is full the overflow policy decides:
+    "drop_oldest" discards the oldest queued record, "drop_newest" discards
+    the incoming one, and "block" waits for space.
+
+    The writer coalesces records and writes them in one call once the batch
+    reaches ``batch_bytes`` characters or is ``batch_interval_ms`` old.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        write,
+        close,
+        maxsize: int,
+        overflow_policy: str,
+        batch_bytes: int = 65536,
+        batch_interval_ms: int = 250,
+    ):
+        self._write = write
+        self._close = close
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._overflow_policy = overflow_policy
+        self._batch_bytes = batch_bytes
+        self._batch_interval = batch_interval_ms / 1000
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, message: str) -> None:
+        if self._overflow_policy == "block":
+            self._queue.put(message)
+            return
+
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self.dropped += 1
+            if self._overflow_policy == "drop_newest":
+                return
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._queue.put_nowait(message)
+            except queue.Full:
+                pass
+
+    def _run(self) -> None:
+        batch: list[str] = []
+        batch_size = 0
+        deadline = 0.0
+
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if batch else None
+            try:
+                message = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                message = None
+
+            if message is not None and message is not self._STOP:
+                if not batch:
+                    deadline = time.monotonic() + self._batch_interval
+                batch.append(message)
+                batch_size += len(message)
+                if batch_size < self._batch_bytes:
+                    continue
+
+            if batch:
+                self._write("".join(batch))
+                batch.clear()
+                batch_size = 0
+
+            if message is self._STOP:
+                break
+
+    def stop(self) -> None:
+        """Drain pending records, stop the writer thread and close the file."""
+        self._queue.put(self._STOP)
+        self._thread.join()
+        self._close()
+
+
+_logger = _LazyLogger()
+
+# Listener thread of the picologging backend
+_pico_listener = None
+
+# Independent loguru logger owning the rotating file sink; records reach it
+# from the writer thread of _BoundedQueueSink
+_file_logger = None
+
+
+def _setup_picologging(
+    level: str,
+    log_file: str,
+    rotation: str,
+    console_enabled: bool,
+    file_enabled: bool,
+) -> None:
+    """Configure picologging with a queue handler and a listener thread.
+
+    Callers only enqueue records; formatting and file I/O happen on the
+    listener thread.
+    """
+    global _pico_listener
+
+    if _pico_listener is not None:
+        _pico_listener.stop()
+        _pico_listener = None
+
+    formatter = _pl.Formatter(_PICO_FORMAT)
+    handlers = []
+
+    if console_enabled:
+        console_handler = _pl.StreamHandler(sys.stderr)
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
+
+    if file_enabled:
+        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+        file_handler = _pl_handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=_parse_size(rotation),
+            backupCount=_PICO_BACKUP_COUNT,
+            encoding="utf-8",
+        )
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    root = _pl.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.setLevel(_LEVEL_NUMBERS[level])
+
+    if handlers:
+        log_queue = queue.Queue()
+        root.addHandler(_pl_handlers.QueueHandler(log_queue))
+        _pico_listener = _pl_handlers.QueueListener(log_queue, *handlers)
+        _pico_listener.start()
+
 
 def setup_logger(
     level: Optional[str] = None,
@@ -19,6 +337,10 @@ def setup_logger(
     rotation: Optional[str] = None,
     retention: Optional[str] = None,
     format: Optional[str] = None,
+    maxsize: Optional[int] = None,
+    overflow_policy: Optional[str] = None,
+    batch_bytes: Optional[int] = None,
+    batch_interval_ms: Optional[int] = None,
 ) -> None:
     """Configure the logger with file and console handlers.
 
@@ -28,7 +350,14 @@ def setup_logger(
         rotation: Log rotation setting (e.g., "100 MB", "1 day")
         retention: Log retention setting (e.g., "30 days", "1 week")
         format: Log format string
+        maxsize: Maximum records queued for the file writer thread
+        overflow_policy: What to do when the file queue is full
+            ("drop_oldest", "drop_newest" or "block")
+        batch_bytes: Flush the file batch once it reaches this many characters
+        batch_interval_ms: Flush the file batch once it is this old
     """
+    global _file_logger
+
     config = get_config()
     log_config = config.logging
 
@@ -38,13 +367,33 @@ def setup_logger(
     rotation = rotation or log_config.rotation
     retention = retention or log_config.retention
     format = format or log_config.format
+    maxsize = maxsize or log_config.queue_maxsize
+    overflow_policy = overflow_policy or log_config.overflow_policy
+    batch_bytes = batch_bytes or log_config.batch_bytes
+    batch_interval_ms = batch_interval_ms or log_config.batch_interval_ms
+
+    if _backend() == "picologging":
+        _setup_picologging(
+            level,
+            log_file,
+            rotation,
+            console_enabled=log_config.console_enabled,
+            file_enabled=log_config.file_enabled,
+        )
+        return
+
+    loguru_logger = _resolve_loguru()
 
     # Remove default handler
-    _logger.remove()
+    loguru_logger.remove()
+
+    # Copy the (now handler-less) logger to get an independent file logger
+    if _file_logger is None:
+        _file_logger = copy.deepcopy(loguru_logger)
 
     # Add console handler if enabled
     if log_config.console_enabled:
-        _logger.add(
+        loguru_logger.add(
             sys.stderr,
             format=format,
             level=level,
@@ -59,15 +408,33 @@ def setup_logger(
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        _logger.add(
+        # Records are formatted by the caller and written in batches by a
+        # writer thread through a bounded queue (loguru's enqueue=True pickles
+        # every record through an unbounded multiprocessing queue instead)
+        _file_logger.remove()
+        file_handler_id = _file_logger.add(
             log_file,
-            format=format,
-            level=level,
+            format="{message}",
+            level=0,
             rotation=rotation,
             retention=retention,
             compression="zip",
             encoding="utf-8",
-            enqueue=True,  # Thread-safe logging
+        )
+        raw_file_logger = _file_logger.opt(raw=True)
+
+        loguru_logger.add(
+            _BoundedQueueSink(
+                write=raw_file_logger.info,
+                close=lambda: _file_logger.remove(file_handler_id),
+                maxsize=maxsize,
+                overflow_policy=overflow_policy,
+                batch_bytes=batch_bytes,
+                batch_interval_ms=batch_interval_ms,
+            ),
+            format=format,
+            level=level,
+            colorize=False,
             backtrace=True,
             diagnose=True,
         )
@@ -4,10 +4,106 @@ Base class for SQLAlchemy ORM models.
 This module is imported by all model modules to avoid circular imports.
 """
 
+from enum import IntEnum
+from typing import Optional
+
+from sqlalchemy import DateTime, LargeBinary, SmallInteger
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import TypeDecorator
 
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy ORM models."""
 
     pass
+
+
+class HexDigest(TypeDecorator):
+    """Digest stored as raw bytes and exposed as a hexadecimal string.
+
+    Halves the column and index size compared to storing the hex text,
+    while the rest of the code keeps working with hex strings.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if value is None or isinstance(value, bytes):
+            return value
+        try:
+            return bytes.fromhex(value)
+        except ValueError:
+            raise ValueError(f"Invalid hex digest: {value!r}") from None
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return bytes(value).hex()
+
+
+class EnumCode(TypeDecorator):
+    """IntEnum member stored as a SMALLINT and exposed by its lowercase name.
+
+    Columns with a handful of fixed values compare and index as 2-byte
+    integers, while the rest of the code (and the API) keeps using names
+    such as "keyword" or "include".
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[IntEnum], *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.enum_class = enum_class
+
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        if isinstance(value, int):
+            return int(self.enum_class(value))
+        try:
+            return int(self.enum_class[value.upper()])
+        except KeyError:
+            raise ValueError(f"Invalid {self.enum_class.__name__}: {value!r}") from None
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return self.enum_class(value).name.lower()
+
+
+class UtcNow(FunctionElement):
+    """Current UTC timestamp evaluated by the database.
+
+    Used as server_default/onupdate so inserts and updates do not carry a
+    Python-computed timestamp parameter.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(UtcNow)
+def _utcnow_default(element, compiler, **kw) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(UtcNow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw) -> str:
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(UtcNow, "sqlite")
+def _utcnow_sqlite(element, compiler, **kw) -> str:
+    # CURRENT_TIMESTAMP only has second precision on SQLite, and %f only
+    # gives milliseconds; pad to the six fractional digits SQLAlchemy's
+    # DateTime stores so server- and client-side values compare as equal
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+@compiles(UtcNow, "mysql")
+def _utcnow_mysql(element, compiler, **kw) -> str:
+    return "(UTC_TIMESTAMP())"
@@ -9,7 +9,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import Boolean, DateTime, Integer, String, Table, Text, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from spider_aggregation.models.base import Base
+from spider_aggregation.models.base import Base, UtcNow
 
 if TYPE_CHECKING:
     from spider_aggregation.models.feed import FeedModel
@@ -28,9 +28,9 @@ class CategoryModel(Base):
     enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UtcNow(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=UtcNow(), onupdate=UtcNow(), nullable=False
     )
 
     # Relationship to Feeds (many-to-many)
@@ -40,6 +40,9 @@ class CategoryModel(Base):
         back_populates="categories",
     )
 
+    # Fetch server-generated timestamps in the INSERT/UPDATE via RETURNING
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<CategoryModel(id={self.id}, name='{self.name}')>"
 
@@ -78,7 +81,7 @@ class CategoryUpdate(BaseModel):
 class CategoryResponse(CategoryBase):
     """Schema for category response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
     id: int
     created_at: datetime
@@ -88,7 +91,7 @@ class CategoryResponse(CategoryBase):
 class CategoryListResponse(BaseModel):
     """Schema for category list response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
     categories: list[CategoryResponse]
     total: int
@@ -9,7 +9,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from spider_aggregation.models.base import Base
+from spider_aggregation.models.base import Base, UtcNow
 
 if TYPE_CHECKING:
     from spider_aggregation.models.feed import FeedModel
@@ -28,11 +28,9 @@ class DigestLogModel(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
     # Send metadata
-    sent_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False, index=True
-    )
+    sent_at: Mapped[datetime] = mapped_column(DateTime, server_default=UtcNow(), nullable=False)
     status: Mapped[str] = mapped_column(
-        String(20), default="pending", nullable=False, index=True
+        String(20), default="pending", nullable=False
     )  # pending, success, failed
 
     # Content summary
@@ -84,7 +82,7 @@ class DigestLogUpdate(BaseModel):
 class DigestLogResponse(DigestLogBase):
     """Schema for digest log response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
     id: int
     sent_at: datetime
@@ -95,7 +93,7 @@ class DigestLogResponse(DigestLogBase):
 class DigestLogListResponse(BaseModel):
     """Schema for digest log list response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
     logs: list[DigestLogResponse]
     total: int
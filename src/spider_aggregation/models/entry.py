@@ -3,17 +3,38 @@ Entry data model for RSS/Atom feed entries.
 """
 
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Sequence, TYPE_CHECKING
 
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, Index, Boolean
+from sqlalchemy import (
+    DDL,
+    JSON,
+    Boolean,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from spider_aggregation.models.base import HexDigest, UtcNow
 from spider_aggregation.models.feed import Base, FeedModel
 
 if TYPE_CHECKING:
     from spider_aggregation.models.feed import FeedModel
 
+# Generated column expression for entries.reading_time_seconds
+READING_TIME_SQL = (
+    "CASE WHEN content IS NULL OR content = '' THEN NULL "
+    "WHEN LENGTH(content) < 200 THEN 10 "
+    "ELSE LENGTH(content) / 20 END"
+)
+
 
 class EntryModel(Base):
     """SQLAlchemy ORM model for Entry."""
@@ -24,6 +45,34 @@ class EntryModel(Base):
     __table_args__ = (
         Index("ix_entries_feed_published", "feed_id", "published_at"),
         Index("ix_entries_feed_fetched", "feed_id", "fetched_at"),
+        # Dedup lookups by link hash; on PostgreSQL the index also carries
+        # feed_id and id so the probe is an index-only scan (SQLite indexes
+        # already include the rowid)
+        Index(
+            "ix_entries_link_hash",
+            "link_hash",
+            unique=True,
+            postgresql_include=["feed_id", "id"],
+        ),
+        # Dedup lookups by title/content hash, usually within one feed; the
+        # feed_id is checked in the index instead of on each matching row
+        Index("ix_entries_title_hash_feed", "title_hash", "feed_id"),
+        Index("ix_entries_content_hash_feed", "content_hash", "feed_id"),
+        # Tag containment queries on PostgreSQL (tags @> '["python"]')
+        Index("ix_entries_tags_gin", "tags", postgresql_using="gin").ddl_if(dialect="postgresql"),
+        # Substring search (LIKE '%query%') on PostgreSQL via pg_trgm
+        Index(
+            "ix_entries_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_entries_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -46,26 +95,79 @@ class EntryModel(Base):
     # Timestamps
     published_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, index=True)
     fetched_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False, index=True
+        DateTime, server_default=UtcNow(), nullable=False, index=True
     )
 
-    # Deduplication fields
-    title_hash: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
-    link_hash: Mapped[str] = mapped_column(String(64), nullable=False, unique=True, index=True)
-    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, index=True)
+    # Deduplication fields (16-byte digests, hex strings in Python)
+    title_hash: Mapped[str] = mapped_column(HexDigest(16), nullable=False)
+    link_hash: Mapped[str] = mapped_column(HexDigest(16), nullable=False)
+    content_hash: Mapped[Optional[str]] = mapped_column(HexDigest(16), nullable=True)
 
     # Additional metadata
-    tags: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON string of tags
+    tags: Mapped[Optional[list[str]]] = mapped_column(
+        JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), "postgresql"),
+        nullable=True,
+    )
     language: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
-    reading_time_seconds: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    # Computed by the database from content: ~1200 characters per minute,
+    # at least 10 seconds, NULL without content
+    reading_time_seconds: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        Computed(READING_TIME_SQL, persisted=True),
+        nullable=True,
+    )
     enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
 
+    # Fetch server-generated columns (fetched_at) in the INSERT via RETURNING
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<EntryModel(id={self.id}, title='{self.title}', link='{self.link}')>"
 
 
+# Full-text index over entries.title/content on SQLite: an external-content
+# FTS5 table kept in sync by triggers. The trigram tokenizer matches any
+# substring of 3+ characters (like LIKE '%q%', case-insensitively), which
+# also works for CJK text that has no word boundaries.
+ENTRIES_FTS_TABLE = "entries_fts"
+
+ENTRIES_FTS_DDL = (
+    "CREATE VIRTUAL TABLE entries_fts USING fts5("
+    "title, content, content='entries', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER entries_fts_ai AFTER INSERT ON entries BEGIN "
+    "INSERT INTO entries_fts(rowid, title, content) "
+    "VALUES (new.id, new.title, new.content); END",
+    "CREATE TRIGGER entries_fts_ad AFTER DELETE ON entries BEGIN "
+    "INSERT INTO entries_fts(entries_fts, rowid, title, content) "
+    "VALUES ('delete', old.id, old.title, old.content); END",
+    "CREATE TRIGGER entries_fts_au AFTER UPDATE OF title, content ON entries BEGIN "
+    "INSERT INTO entries_fts(entries_fts, rowid, title, content) "
+    "VALUES ('delete', old.id, old.title, old.content); "
+    "INSERT INTO entries_fts(rowid, title, content) "
+    "VALUES (new.id, new.title, new.content); END",
+)
+
+for _statement in ENTRIES_FTS_DDL:
+    event.listen(EntryModel.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+# The triggers go with the entries table; the FTS table has to be dropped
+event.listen(
+    EntryModel.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS entries_fts").execute_if(dialect="sqlite"),
+)
+# The trigram indexes on PostgreSQL need the pg_trgm operator classes
+event.listen(
+    EntryModel.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
 # Pydantic models for API
 
+# Lowercase hex of whole bytes, at most the 16 bytes an entry hash column holds
+HEX_DIGEST_PATTERN = r"^(?:[0-9a-f]{2}){1,16}$"
+
 
 class EntryBase(BaseModel):
     """Base Entry schema."""
@@ -78,7 +180,6 @@ class EntryBase(BaseModel):
     published_at: Optional[datetime] = Field(None, description="Publication date")
     tags: Optional[list[str]] = Field(None, description="Entry tags")
     language: Optional[str] = Field(None, max_length=10, description="Content language")
-    reading_time_seconds: Optional[int] = Field(None, ge=0, description="Estimated reading time")
     enabled: bool = Field(True, description="Whether the entry is enabled (visible/active)")
 
 
@@ -86,12 +187,32 @@ class EntryCreate(EntryBase):
     """Schema for creating a new entry."""
 
     feed_id: int = Field(..., description="Feed ID")
-    title_hash: str = Field(..., max_length=64, description="Hash of title for deduplication")
-    link_hash: str = Field(..., max_length=64, description="Hash of link for deduplication")
+    title_hash: str = Field(
+        ..., pattern=HEX_DIGEST_PATTERN, description="Hash of title for deduplication"
+    )
+    link_hash: str = Field(
+        ..., pattern=HEX_DIGEST_PATTERN, description="Hash of link for deduplication"
+    )
     content_hash: Optional[str] = Field(
-        None, max_length=64, description="Hash of content for deduplication"
+        None, pattern=HEX_DIGEST_PATTERN, description="Hash of content for deduplication"
     )
 
+    @classmethod
+    def from_trusted(cls, **kwargs) -> "EntryCreate":
+        """Build an EntryCreate without running validators.
+
+        Only for data produced internally (e.g. ParserService output during
+        ingest), which is already normalized. API handlers must keep using the
+        validating constructor. Unknown keys are ignored.
+
+        Args:
+            **kwargs: Entry fields
+
+        Returns:
+            EntryCreate instance
+        """
+        return cls.model_construct(**kwargs)
+
 
 class EntryUpdate(BaseModel):
     """Schema for updating an entry."""
@@ -101,14 +222,13 @@ class EntryUpdate(BaseModel):
     content: Optional[str] = None
     tags: Optional[list[str]] = None
     language: Optional[str] = Field(None, max_length=10)
-    reading_time_seconds: Optional[int] = Field(None, ge=0)
     enabled: Optional[bool] = Field(None, description="Enable or disable entry")
 
 
 class EntryResponse(EntryBase):
     """Schema for entry response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
     id: int
     feed_id: int
@@ -116,14 +236,39 @@ class EntryResponse(EntryBase):
     title_hash: str
     link_hash: str
     content_hash: Optional[str] = None
+    reading_time_seconds: Optional[int] = Field(None, description="Estimated reading time")
 
 
 class EntryListResponse(BaseModel):
     """Schema for entry list response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
     entries: list[EntryResponse]
     total: int
     page: int
     page_size: int
+
+    @classmethod
+    def from_rows(
+        cls, rows: Sequence, total: int, page: int, page_size: int
+    ) -> "EntryListResponse":
+        """Build a list response from column rows without re-validation.
+
+        Args:
+            rows: Rows from ``EntryRepository.list_rows``
+            total: Total number of matching entries
+            page: Page number
+            page_size: Items per page
+
+        Returns:
+            EntryListResponse instance
+        """
+        fields = EntryResponse.model_fields
+        entries = [
+            EntryResponse.model_construct(
+                **{key: value for key, value in row._mapping.items() if key in fields}
+            )
+            for row in rows
+        ]
+        return cls.model_construct(entries=entries, total=total, page=page, page_size=page_size)
@@ -6,10 +6,21 @@ from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Table, Text, Index, ForeignKey
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Integer,
+    String,
+    Table,
+    Text,
+    Index,
+    ForeignKey,
+    text,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
-from spider_aggregation.models.base import Base
+from spider_aggregation.models.base import Base, UtcNow
 
 if TYPE_CHECKING:
     from spider_aggregation.models.entry import EntryModel
@@ -21,10 +32,20 @@ class FeedModel(Base):
 
     __tablename__ = "feeds"
 
-    # Composite indexes for common query patterns
+    # Partial indexes over enabled feeds, the only ones the scheduler queries
     __table_args__ = (
-        Index("ix_feeds_enabled_last_fetched", "enabled", "last_fetched_at"),
-        Index("ix_feeds_enabled_errors", "enabled", "fetch_error_count"),
+        Index(
+            "ix_feeds_enabled_last_fetched",
+            "last_fetched_at",
+            postgresql_where=text("enabled = true"),
+            sqlite_where=text("enabled = 1"),
+        ),
+        Index(
+            "ix_feeds_enabled_errors",
+            "fetch_error_count",
+            postgresql_where=text("enabled = true"),
+            sqlite_where=text("enabled = 1"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -46,9 +67,9 @@ class FeedModel(Base):
     )
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UtcNow(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=UtcNow(), onupdate=UtcNow(), nullable=False
     )
     last_fetched_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
@@ -61,20 +82,28 @@ class FeedModel(Base):
     etag: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     last_modified: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
-    # Relationship to Entries
+    # Relationship to Entries; never loaded implicitly (use selectinload), and
+    # deleting a feed leaves removing its entries to ON DELETE CASCADE
     entries: Mapped[list["EntryModel"]] = relationship(
         "EntryModel",
         back_populates="feed",
         cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
 
-    # Relationship to Categories (many-to-many)
+    # Relationship to Categories (many-to-many), loaded with the feed in one
+    # extra query per result set since feed responses always include them
     categories: Mapped[list["CategoryModel"]] = relationship(
         "CategoryModel",
         secondary="feed_categories",
         back_populates="feeds",
+        lazy="selectin",
     )
 
+    # Fetch server-generated timestamps in the INSERT/UPDATE via RETURNING
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<FeedModel(id={self.id}, url='{self.url}', name='{self.name}')>"
 
@@ -116,7 +145,20 @@ class FeedBase(BaseModel):
 class FeedCreate(FeedBase):
     """Schema for creating a new feed."""
 
-    pass
+    @classmethod
+    def from_trusted(cls, **kwargs) -> "FeedCreate":
+        """Build a FeedCreate without running validators.
+
+        Only for data produced internally. API handlers must keep using the
+        validating constructor. Unknown keys are ignored.
+
+        Args:
+            **kwargs: Feed fields
+
+        Returns:
+            FeedCreate instance
+        """
+        return cls.model_construct(**kwargs)
 
 
 class FeedUpdate(BaseModel):
@@ -133,7 +175,7 @@ class FeedUpdate(BaseModel):
 class FeedResponse(FeedBase):
     """Schema for feed response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
     id: int
     created_at: datetime
@@ -150,7 +192,7 @@ class FeedResponse(FeedBase):
 class FeedListResponse(BaseModel):
     """Schema for feed list response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
     feeds: list[FeedResponse]
     total: int
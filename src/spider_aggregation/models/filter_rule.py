@@ -1,13 +1,34 @@
 """Filter rule data model for content filtering."""
 
 from datetime import datetime
-from typing import Optional
+from enum import IntEnum
+from typing import Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column
 
-from spider_aggregation.models.base import Base
+from spider_aggregation.models.base import Base, EnumCode, UtcNow
+
+
+class RuleType(IntEnum):
+    """Stored codes of filter rule types."""
+
+    KEYWORD = 1
+    REGEX = 2
+    TAG = 3
+    LANGUAGE = 4
+
+
+class MatchType(IntEnum):
+    """Stored codes of filter rule match types."""
+
+    INCLUDE = 1
+    EXCLUDE = 2
+
+
+RuleTypeName = Literal["keyword", "regex", "tag", "language"]
+MatchTypeName = Literal["include", "exclude"]
 
 
 class FilterRuleModel(Base):
@@ -15,27 +36,37 @@ class FilterRuleModel(Base):
 
     __tablename__ = "filter_rules"
 
-    # Composite index for enabled rules query
-    __table_args__ = (Index("ix_filter_rules_enabled_priority", "enabled", "priority"),)
+    # Partial index for enabled rules query
+    __table_args__ = (
+        Index(
+            "ix_filter_rules_enabled_priority",
+            "priority",
+            postgresql_where=text("enabled = true"),
+            sqlite_where=text("enabled = 1"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(500), nullable=False)
     enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
-    # Rule configuration
+    # Rule configuration (SMALLINT codes, names in Python)
     rule_type: Mapped[str] = mapped_column(
-        String(50), nullable=False  # keyword, regex, tag, language
+        EnumCode(RuleType), nullable=False  # keyword, regex, tag, language
     )
-    match_type: Mapped[str] = mapped_column(String(50), nullable=False)  # include, exclude
+    match_type: Mapped[str] = mapped_column(EnumCode(MatchType), nullable=False)  # include, exclude
     pattern: Mapped[str] = mapped_column(Text, nullable=False)
     priority: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UtcNow(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=UtcNow(), onupdate=UtcNow(), nullable=False
     )
 
+    # Fetch server-generated timestamps in the INSERT/UPDATE via RETURNING
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<FilterRuleModel(id={self.id}, name='{self.name}', type='{self.rule_type}')>"
 
@@ -48,10 +79,8 @@ class FilterRuleBase(BaseModel):
 
     name: str = Field(..., max_length=500, description="Rule name")
     enabled: bool = Field(default=True, description="Whether the rule is enabled")
-    rule_type: str = Field(
-        ..., max_length=50, description="Rule type: keyword, regex, tag, language"
-    )
-    match_type: str = Field(..., max_length=50, description="Match type: include, exclude")
+    rule_type: RuleTypeName = Field(..., description="Rule type: keyword, regex, tag, language")
+    match_type: MatchTypeName = Field(..., description="Match type: include, exclude")
     pattern: str = Field(..., description="Pattern to match")
     priority: int = Field(default=0, ge=0, description="Rule priority (higher first)")
 
@@ -65,8 +94,8 @@ class FilterRuleUpdate(BaseModel):
 
     name: Optional[str] = Field(None, max_length=500)
     enabled: Optional[bool] = None
-    rule_type: Optional[str] = Field(None, max_length=50)
-    match_type: Optional[str] = Field(None, max_length=50)
+    rule_type: Optional[RuleTypeName] = None
+    match_type: Optional[MatchTypeName] = None
     pattern: Optional[str] = None
     priority: Optional[int] = Field(None, ge=0)
 
@@ -74,7 +103,7 @@ class FilterRuleUpdate(BaseModel):
 class FilterRuleResponse(FilterRuleBase):
     """Schema for filter rule response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
     id: int
     created_at: datetime
@@ -84,7 +113,7 @@ class FilterRuleResponse(FilterRuleBase):
 class FilterRuleListResponse(BaseModel):
     """Schema for filter rule list response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
     rules: list[FilterRuleResponse]
     total: int
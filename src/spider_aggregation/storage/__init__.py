@@ -5,16 +5,20 @@ from spider_aggregation.storage.database import (
     close_db,
     get_db,
     get_engine,
+    get_reader_engine,
     get_session,
     get_session_factory,
     init_db,
+    remove_session,
 )
 
 __all__ = [
     "DatabaseManager",
     "get_db",
     "get_session",
+    "remove_session",
     "get_engine",
+    "get_reader_engine",
     "get_session_factory",
     "init_db",
     "close_db",
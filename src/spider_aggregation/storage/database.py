@@ -4,21 +4,67 @@ Database connection and session management.
 
 from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, Generator, Optional
+from typing import Generator, Optional
 
-from sqlalchemy import Engine, create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import URL, Engine, create_engine
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
 
-from spider_aggregation.config import get_config
+from spider_aggregation.config import DatabaseConfig, get_config
 from spider_aggregation.models import Base
-
-if TYPE_CHECKING:
-    from spider_aggregation.config import DatabaseConfig
+from spider_aggregation.storage.dialects import get_dialect
+from spider_aggregation.utils.json_utils import ORJSON_AVAILABLE, dumps, loads
 
 # Global engine and session factory
 _engine: Optional[Engine] = None
 _session_factory: Optional[sessionmaker] = None
 
+# Engine and session factory for read-only sessions (may share _engine)
+_reader_engine: Optional[Engine] = None
+_reader_session_factory: Optional[sessionmaker] = None
+
+# Thread-local sessions handed out by get_session()
+_scoped_session: Optional[scoped_session] = None
+
+# Database URLs whose migration state init_db() has already checked
+_migrations_checked: set[URL] = set()
+
+
+def _build_engine(db_config: DatabaseConfig, engine_kwargs: Optional[dict] = None) -> Engine:
+    """Create an engine for a database configuration.
+
+    Args:
+        db_config: Database configuration
+        engine_kwargs: Reader engine kwargs from the dialect; builds a
+            read-only engine when given
+
+    Returns:
+        SQLAlchemy Engine instance
+    """
+    # Get appropriate dialect
+    dialect = get_dialect(db_config.type)
+    readonly = engine_kwargs is not None
+    if engine_kwargs is None:
+        engine_kwargs = dialect.get_engine_kwargs(db_config)
+
+    # JSON columns (entry tags) are encoded and decoded once per row; use the
+    # C encoder when it is installed
+    if ORJSON_AVAILABLE:
+        engine_kwargs = {
+            "json_serializer": dumps,
+            "json_deserializer": loads,
+            **engine_kwargs,
+        }
+
+    # Build URL using dialect
+    url = dialect.build_reader_url(db_config) if readonly else dialect.build_url(db_config)
+    engine = create_engine(url, **engine_kwargs)
+
+    # Set up dialect-specific events (e.g., SQLite PRAGMA)
+    dialect.setup_engine_events(engine, db_config, readonly=readonly)
+    dialect.prewarm_pool(engine)
+
+    return engine
+
 
 def get_engine() -> Engine:
     """Get or create the database engine.
@@ -29,28 +75,33 @@ def get_engine() -> Engine:
     global _engine
 
     if _engine is None:
-        config = get_config()
-        db_config: DatabaseConfig = config.database
+        _engine = _build_engine(get_config().database)
 
-        # Import dialect system
-        from spider_aggregation.storage.dialects import get_dialect
+    return _engine
 
-        # Get appropriate dialect
-        dialect = get_dialect(db_config.type)
 
-        # Build database URL using dialect
-        url = dialect.build_url(db_config)
+def get_reader_engine() -> Engine:
+    """Get or create the engine for read-only sessions.
 
-        # Get engine kwargs from dialect
-        engine_kwargs = dialect.get_engine_kwargs(db_config)
+    SQLite databases on disk get a separate engine whose pooled connections
+    open the file read-only, so reads run concurrently with the writer (WAL
+    mode).
+    Other backends share the main engine.
 
-        # Create engine
-        _engine = create_engine(url, **engine_kwargs)
+    Returns:
+        SQLAlchemy Engine instance
+    """
+    global _reader_engine
 
-        # Set up dialect-specific events (e.g., SQLite PRAGMA)
-        dialect.setup_engine_events(_engine)
+    if _reader_engine is None:
+        db_config = get_config().database
+        reader_kwargs = get_dialect(db_config.type).get_reader_engine_kwargs(db_config)
+        if reader_kwargs is None:
+            _reader_engine = get_engine()
+        else:
+            _reader_engine = _build_engine(db_config, reader_kwargs)
 
-    return _engine
+    return _reader_engine
 
 
 def get_session_factory() -> sessionmaker:
@@ -66,24 +117,47 @@ def get_session_factory() -> sessionmaker:
         _session_factory = sessionmaker(
             autocommit=False,
             autoflush=False,
+            expire_on_commit=False,
             bind=engine,
         )
 
     return _session_factory
 
 
+def get_reader_session_factory() -> sessionmaker:
+    """Get or create the session factory for read-only sessions.
+
+    Returns:
+        SQLAlchemy sessionmaker instance bound to the reader engine
+    """
+    global _reader_session_factory
+
+    if _reader_session_factory is None:
+        _reader_session_factory = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False,
+            bind=get_reader_engine(),
+        )
+
+    return _reader_session_factory
+
+
 @contextmanager
-def get_db() -> Generator[Session, None, None]:
+def get_db(readonly: bool = False) -> Generator[Session, None, None]:
     """Get a database session.
 
+    Args:
+        readonly: Use the reader engine; writes raise an error on SQLite
+
     Yields:
         SQLAlchemy Session instance
 
     Example:
-        >>> with get_db() as session:
+        >>> with get_db(readonly=True) as session:
         ...     feeds = session.query(FeedModel).all()
     """
-    session_factory = get_session_factory()
+    session_factory = get_reader_session_factory() if readonly else get_session_factory()
     session = session_factory()
 
     try:
@@ -97,9 +171,13 @@ def get_db() -> Generator[Session, None, None]:
 
 
 def get_session() -> Session:
-    """Get a database session without context manager.
+    """Get the current thread's database session without context manager.
 
-    The caller is responsible for closing the session.
+    Repeated calls from the same thread (e.g. a worker of a thread pool
+    processing many feeds) return the same session instead of building a new
+    one each time. The caller is responsible for committing and closing it;
+    a closed session is reused on the next call. Call remove_session() when
+    the thread is done with it.
 
     Returns:
         SQLAlchemy Session instance
@@ -111,8 +189,18 @@ def get_session() -> Session:
         ... finally:
         ...     session.close()
     """
-    session_factory = get_session_factory()
-    return session_factory()
+    global _scoped_session
+
+    if _scoped_session is None:
+        _scoped_session = scoped_session(get_session_factory())
+
+    return _scoped_session()
+
+
+def remove_session() -> None:
+    """Close and discard the current thread's session from get_session()."""
+    if _scoped_session is not None:
+        _scoped_session.remove()
 
 
 def init_db(drop_all: bool = False, use_migrations: bool = True) -> None:
@@ -127,12 +215,21 @@ def init_db(drop_all: bool = False, use_migrations: bool = True) -> None:
         For production use, always use Alembic migrations:
         - Fresh install: alembic upgrade head
         - Existing DB: alembic stamp head
+
+        The migration check runs once per database URL. Set
+        ``database.skip_migrations`` (DB_SKIP_MIGRATIONS) when Alembic is
+        managed externally to skip it entirely.
     """
     from spider_aggregation.logger import get_logger
 
     logger = get_logger(__name__)
 
+    if use_migrations and not drop_all and get_config().database.skip_migrations:
+        return
+
     engine = get_engine()
+    if use_migrations and not drop_all and engine.url in _migrations_checked:
+        return
 
     # For testing or development, allow drop_all + create_all
     if drop_all:
@@ -142,11 +239,11 @@ def init_db(drop_all: bool = False, use_migrations: bool = True) -> None:
         use_migrations = True
 
     if use_migrations:
-        # Check if alembic_version table exists
-        from sqlalchemy import inspect, text
+        # Check if alembic_version table exists (a single-table lookup rather
+        # than listing every table)
+        from sqlalchemy import inspect
 
-        inspector = inspect(engine)
-        has_alembic = "alembic_version" in inspector.get_table_names()
+        has_alembic = inspect(engine).has_table("alembic_version")
 
         if not has_alembic and not drop_all:
             # Fresh database with existing tables (created by old init_db)
@@ -175,6 +272,7 @@ def init_db(drop_all: bool = False, use_migrations: bool = True) -> None:
                 logger.warning(f"Could not run migrations: {e}, falling back to create_all")
                 Base.metadata.create_all(bind=engine)
         # else: alembic_version table exists, migrations are being managed by alembic CLI
+        _migrations_checked.add(engine.url)
     else:
         # Legacy behavior - directly create tables (not recommended for production)
         logger.warning("Using direct table creation (not recommended for production)")
@@ -183,7 +281,16 @@ def init_db(drop_all: bool = False, use_migrations: bool = True) -> None:
 
 def close_db() -> None:
     """Close the database connection and dispose of the engine."""
-    global _engine, _session_factory
+    global _engine, _session_factory, _scoped_session, _reader_engine, _reader_session_factory
+
+    if _scoped_session is not None:
+        _scoped_session.remove()
+        _scoped_session = None
+
+    if _reader_engine is not None and _reader_engine is not _engine:
+        _reader_engine.dispose()
+    _reader_engine = None
+    _reader_session_factory = None
 
     if _engine is not None:
         _engine.dispose()
@@ -195,7 +302,7 @@ def close_db() -> None:
 class DatabaseManager:
     """Database manager for context-managed database operations."""
 
-    def __init__(self, db_path: Optional[str] = None, db_config: Optional["DatabaseConfig"] = None):
+    def __init__(self, db_path: Optional[str] = None, db_config: Optional[DatabaseConfig] = None):
         """Initialize database manager.
 
         Args:
@@ -209,37 +316,22 @@ class DatabaseManager:
         self._custom_db_path = db_path
         self._custom_db_config = db_config
         self._engine: Optional[Engine] = None
+        self._session_factory: Optional[sessionmaker] = None
 
     @property
     def engine(self) -> Engine:
         """Get the database engine."""
         if self._engine is None:
             if self._custom_db_path:
-                # Legacy support: create SQLite engine from path
-                from spider_aggregation.storage.dialects import get_dialect
-
-                db_path = Path(self._custom_db_path)
-                db_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Create a minimal config for SQLite
-                from spider_aggregation.config import DatabaseConfig
-
-                db_config = DatabaseConfig(path=str(db_path), echo=False)
-                dialect = get_dialect("sqlite")
-
-                url = dialect.build_url(db_config)
-                engine_kwargs = dialect.get_engine_kwargs(db_config)
-                self._engine = create_engine(url, **engine_kwargs)
-                dialect.setup_engine_events(self._engine)
+                # Legacy support: create SQLite engine from path; the dialect
+                # creates the parent directory when building the URL
+                db_config = DatabaseConfig(
+                    type="sqlite", path=str(Path(self._custom_db_path)), echo=False
+                )
+                self._engine = _build_engine(db_config)
             elif self._custom_db_config:
                 # Use custom config
-                from spider_aggregation.storage.dialects import get_dialect
-
-                dialect = get_dialect(self._custom_db_config.type)
-                url = dialect.build_url(self._custom_db_config)
-                engine_kwargs = dialect.get_engine_kwargs(self._custom_db_config)
-                self._engine = create_engine(url, **engine_kwargs)
-                dialect.setup_engine_events(self._engine)
+                self._engine = _build_engine(self._custom_db_config)
             else:
                 # Use global config
                 self._engine = get_engine()
@@ -254,6 +346,9 @@ class DatabaseManager:
         """
         if drop_all:
             Base.metadata.drop_all(bind=self.engine)
+            # Every table was just dropped, so skip the per-table existence checks
+            Base.metadata.create_all(bind=self.engine, checkfirst=False)
+            return
 
         Base.metadata.create_all(bind=self.engine)
 
@@ -264,12 +359,14 @@ class DatabaseManager:
         Yields:
             SQLAlchemy Session instance
         """
-        session_factory = sessionmaker(
-            autocommit=False,
-            autoflush=False,
-            bind=self.engine,
-        )
-        session = session_factory()
+        if self._session_factory is None:
+            self._session_factory = sessionmaker(
+                autocommit=False,
+                autoflush=False,
+                expire_on_commit=False,
+                bind=self.engine,
+            )
+        session = self._session_factory()
 
         try:
             yield session
@@ -286,6 +383,8 @@ class DatabaseManager:
             self._engine.dispose()
             self._engine = None
 
+        self._session_factory = None
+
     def __enter__(self) -> "DatabaseManager":
         """Context manager entry."""
         return self
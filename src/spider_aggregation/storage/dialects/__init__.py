@@ -17,6 +17,9 @@ _DIALECT_REGISTRY: dict[str, type[BaseDialect]] = {
     "mysql": MySQLDialect,
 }
 
+# Dialects are stateless, so one shared instance per registered name
+_DIALECT_INSTANCES: dict[str, BaseDialect] = {}
+
 
 def get_dialect(name: str) -> BaseDialect:
     """Get a dialect instance by name.
@@ -26,7 +29,7 @@ def get_dialect(name: str) -> BaseDialect:
                "postgres" is accepted as an alias for "postgresql".
 
     Returns:
-        Dialect instance
+        Shared dialect instance
 
     Raises:
         ValueError: If dialect name is not supported
@@ -36,14 +39,18 @@ def get_dialect(name: str) -> BaseDialect:
         >>> url = dialect.build_url(config)
     """
     name_lower = name.lower()
+    dialect = _DIALECT_INSTANCES.get(name_lower)
+    if dialect is not None:
+        return dialect
+
     if name_lower not in _DIALECT_REGISTRY:
         supported = ", ".join(sorted(set(_DIALECT_REGISTRY.keys())))
         raise ValueError(
             f"Unsupported database dialect: {name!r}. " f"Supported dialects: {supported}"
         )
 
-    dialect_class = _DIALECT_REGISTRY[name_lower]
-    return dialect_class()
+    dialect = _DIALECT_INSTANCES[name_lower] = _DIALECT_REGISTRY[name_lower]()
+    return dialect
 
 
 def register_dialect(name: str, dialect_class: type[BaseDialect]) -> None:
@@ -57,6 +64,7 @@ def register_dialect(name: str, dialect_class: type[BaseDialect]) -> None:
         This allows extending MindWeaver with custom database backends.
     """
     _DIALECT_REGISTRY[name.lower()] = dialect_class
+    _DIALECT_INSTANCES.pop(name.lower(), None)
 
 
 def get_supported_dialects() -> list[str]:
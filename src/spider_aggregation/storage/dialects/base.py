@@ -1,6 +1,7 @@
 """Abstract base dialect for database backends."""
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from sqlalchemy import Engine, event
 from sqlalchemy.pool import Pool
@@ -18,6 +19,11 @@ class BaseDialect(ABC):
     and event handling.
     """
 
+    # Capability flags, overridden as class attributes by subclasses
+    supports_json: bool = False  # JSON column types natively supported
+    supports_array: bool = False  # ARRAY column types natively supported
+    requires_cascade_type: bool = False  # CASCADE needs explicit type (e.g., PostgreSQL)
+
     @abstractmethod
     def build_url(self, config: "DatabaseConfig") -> str:  # noqa: F821
         """Build database URL from configuration.
@@ -72,11 +78,49 @@ class BaseDialect(ABC):
         """
         ...
 
-    def setup_engine_events(self, engine: Engine) -> None:
+    def get_reader_engine_kwargs(self, config: "DatabaseConfig") -> Optional[dict]:  # noqa: F821
+        """Get engine kwargs for a separate engine serving read-only sessions.
+
+        Args:
+            config: Database configuration object
+
+        Returns:
+            Dictionary of keyword arguments for create_engine(), or None if
+            read-only sessions should share the main engine
+
+        Note:
+            Base implementation returns None. Server databases already serve
+            concurrent readers from the main pool.
+        """
+        return None
+
+    def build_reader_url(self, config: "DatabaseConfig") -> str:  # noqa: F821
+        """Build the database URL for the read-only engine.
+
+        Args:
+            config: Database configuration object
+
+        Returns:
+            SQLAlchemy database URL string
+
+        Note:
+            Base implementation returns build_url(). Only used when
+            get_reader_engine_kwargs() asks for a separate engine.
+        """
+        return self.build_url(config)
+
+    def setup_engine_events(
+        self,
+        engine: Engine,
+        config: Optional["DatabaseConfig"] = None,  # noqa: F821
+        readonly: bool = False,
+    ) -> None:
         """Set up dialect-specific engine event listeners.
 
         Args:
             engine: SQLAlchemy engine instance
+            config: Database configuration (for dialect-specific settings)
+            readonly: Whether the engine only serves read-only sessions
 
         Note:
             Base implementation does nothing. Subclasses can override
@@ -84,6 +128,17 @@ class BaseDialect(ABC):
         """
         pass
 
+    def prewarm_pool(self, engine: Engine) -> None:
+        """Open the engine's pooled connections ahead of the first request.
+
+        Args:
+            engine: SQLAlchemy engine instance, with events already set up
+
+        Note:
+            Base implementation does nothing; connections are opened lazily.
+        """
+        pass
+
     def get_migration_kwargs(self) -> dict:
         """Get dialect-specific migration kwargs for Alembic.
 
@@ -120,30 +175,3 @@ class BaseDialect(ABC):
             Dialect name (e.g., "sqlite", "postgresql", "mysql")
         """
         ...
-
-    @property
-    def supports_json(self) -> bool:
-        """Check if dialect supports JSON column types.
-
-        Returns:
-            True if JSON is natively supported
-        """
-        return False
-
-    @property
-    def supports_array(self) -> bool:
-        """Check if dialect supports ARRAY column types.
-
-        Returns:
-            True if ARRAY is natively supported
-        """
-        return False
-
-    @property
-    def requires_cascade_type(self) -> bool:
-        """Check if CASCADE requires type specification.
-
-        Returns:
-            True if CASCADE needs explicit type (e.g., PostgreSQL)
-        """
-        return False
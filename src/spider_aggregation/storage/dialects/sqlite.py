@@ -1,7 +1,11 @@
 """SQLite dialect implementation."""
 
+import os
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from urllib.parse import quote
+from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import Engine, event
 from sqlalchemy.pool import QueuePool, StaticPool
@@ -11,6 +15,44 @@ from spider_aggregation.storage.dialects.base import BaseDialect
 if TYPE_CHECKING:
     from spider_aggregation.config import DatabaseConfig
 
+# Parent directories already created by build_url; engines are built per
+# DatabaseManager, so skip the stat/mkdir once a directory is known to exist
+_ensured_dirs: set[Path] = set()
+
+
+@lru_cache(maxsize=32)
+def _stat_path(path: Path) -> tuple[bool, bool]:
+    """Stat a database path once and remember the result.
+
+    Results are only cleared when build_url() creates directories, so a
+    path replaced by something else outside this process keeps its first
+    result.
+
+    Args:
+        path: Resolved database path
+
+    Returns:
+        Tuple of (exists, is_file)
+    """
+    try:
+        mode = Path(path).stat().st_mode
+    except FileNotFoundError:
+        return False, False
+    return True, stat.S_ISREG(mode)
+
+
+# Configured paths starting with these are SQLAlchemy URLs, not file paths
+_URL_PREFIXES = ("sqlite://", "sqlite+")
+
+
+def _is_memory_path(path: str) -> bool:
+    """Check whether a configured SQLite path refers to an in-memory database."""
+    return (
+        path.endswith(":memory:")
+        or path in ("sqlite://", "sqlite+pysqlite://")
+        or "mode=memory" in path
+    )
+
 
 class SQLiteDialect(BaseDialect):
     """SQLite database dialect.
@@ -22,9 +64,12 @@ class SQLiteDialect(BaseDialect):
     - Embedded database (no server required)
     - WAL mode for better concurrent read access
     - Foreign key constraints enabled
-    - StaticPool for single-threaded, QueuePool for multi-threaded
+    - StaticPool for in-memory databases, QueuePool for file databases
     """
 
+    supports_json = True  # JSON1 extension is commonly available
+    supports_array = False
+
     @property
     def name(self) -> str:
         """Get dialect name."""
@@ -47,12 +92,16 @@ class SQLiteDialect(BaseDialect):
         db_path = config.path
 
         # Already a URL, return as-is
-        if db_path.startswith("sqlite://"):
+        if db_path.startswith(_URL_PREFIXES):
             return db_path
 
         # Ensure directory exists
-        path_obj = Path(db_path)
-        path_obj.parent.mkdir(parents=True, exist_ok=True)
+        parent = Path(db_path).parent
+        if parent not in _ensured_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(parent)
+            # A cached stat may predate the directories just created
+            _stat_path.cache_clear()
 
         return f"sqlite:///{db_path}"
 
@@ -67,17 +116,32 @@ class SQLiteDialect(BaseDialect):
 
         Note:
             Uses QueuePool for better concurrency with ThreadPoolExecutor.
-            StaticPool causes issues with multiple threads.
+            StaticPool causes issues with multiple threads. Pooled connections
+            are checked before use and recycled hourly, so a connection left
+            broken (e.g. after the file was replaced or vacuumed externally)
+            is not handed out mid-transaction.
+
+            An in-memory database exists only inside its connection, so it
+            gets a StaticPool sharing one connection across threads; a pool
+            of several connections would each see a different, empty database.
         """
+        if _is_memory_path(config.path):
+            return {
+                "echo": config.echo,
+                "connect_args": {"check_same_thread": False},
+                "poolclass": StaticPool,
+                "query_cache_size": config.query_cache_size,
+            }
+
         return {
             "echo": config.echo,
-            "connect_args": {
-                "check_same_thread": False,  # Needed for SQLite
-                "timeout": 30,  # 30 second timeout for locks
-            },
+            "connect_args": {"check_same_thread": False},  # Needed for SQLite
             "poolclass": QueuePool,
             "pool_size": config.pool_size,
             "max_overflow": config.max_overflow,
+            "query_cache_size": config.query_cache_size,
+            "pool_pre_ping": True,  # Verify connections before use
+            "pool_recycle": 3600,  # Recycle connections after 1 hour
         }
 
     def get_pool_class(self) -> type[QueuePool]:
@@ -88,24 +152,143 @@ class SQLiteDialect(BaseDialect):
         """
         return QueuePool
 
-    def setup_engine_events(self, engine: Engine) -> None:
+    def get_reader_engine_kwargs(self, config: "DatabaseConfig") -> Optional[dict]:
+        """Get engine kwargs for the read-only engine.
+
+        Args:
+            config: Database configuration
+
+        Returns:
+            Dictionary of engine kwargs, or None for in-memory databases
+
+        Note:
+            In WAL mode readers do not block the writer or each other, so
+            read-only sessions get their own pool (up to 8 connections)
+            instead of queueing behind writers in the main pool. In-memory
+            databases are private to their connection and keep one engine.
+        """
+        if _is_memory_path(config.path):
+            return None
+
+        kwargs = self.get_engine_kwargs(config)
+        kwargs["pool_size"] = min(os.cpu_count() or 1, 8)
+        return kwargs
+
+    def build_reader_url(self, config: "DatabaseConfig") -> str:
+        """Build SQLite URL for the read-only engine.
+
+        Args:
+            config: Database configuration
+
+        Returns:
+            SQLAlchemy URL string opening the file with ``mode=ro``
+
+        Note:
+            Path-based configuration is opened as a read-only SQLite URI, so
+            writes are refused when the file is opened, not only by
+            query_only. URL-based configuration is returned unchanged.
+        """
+        url = self.build_url(config)
+        if config.path.startswith(_URL_PREFIXES):
+            return url
+        return f"sqlite:///file:{quote(config.path)}?mode=ro&uri=true"
+
+    def setup_engine_events(
+        self,
+        engine: Engine,
+        config: Optional["DatabaseConfig"] = None,
+        readonly: bool = False,
+    ) -> None:
         """Set up SQLite PRAGMA statements.
 
         Args:
             engine: SQLAlchemy engine
+            config: Database configuration providing extra ``sqlite_pragmas``
+            readonly: Reject writes on this engine's connections (query_only)
 
         Note:
-            Enables foreign keys and WAL mode for better concurrency.
+            Enables foreign keys and WAL mode for better concurrency. WAL is
+            persistent in the database file, so it is checked once on the
+            engine's first connection rather than on every pooled connection,
+            and skipped for in-memory databases, which cannot use it, and
+            for read-only engines, which rely on the writer having set it. The
+            default extra pragmas tune for the ingest workload: with WAL,
+            synchronous=NORMAL only syncs at checkpoints, lock waits give up
+            after busy_timeout (5 s), the page cache is 64 MB, temp tables
+            live in memory and reads go through a 256 MB memory map. Bulk
+            ingests and cleanups run as one transaction each, which can grow
+            the WAL file well past its usual size; journal_size_limit
+            truncates it back to 64 MB after the next checkpoint.
+
+            The per-connection statements are joined into one script, built
+            once here and run with a single executescript() call per new
+            connection.
+
+            pysqlite's own implicit transaction handling is switched off
+            (isolation_level=None) and BEGIN is emitted when SQLAlchemy starts
+            a transaction, so reads and SAVEPOINTs run inside the same SQLite
+            transaction instead of the driver's delayed BEGIN.
         """
+        pragmas = config.sqlite_pragmas if config is not None else {}
+        in_memory = config is not None and _is_memory_path(config.path)
+
+        statements = [
+            # Enable foreign key constraints
+            "PRAGMA foreign_keys=ON",
+            *(f"PRAGMA {name}={value}" for name, value in pragmas.items()),
+        ]
+        if readonly:
+            statements.append("PRAGMA query_only=ON")
+        script = ";\n".join(statements) + ";"
+
+        if not in_memory and not readonly:
+
+            @event.listens_for(engine, "first_connect")
+            def set_wal_mode(dbapi_conn, connection_record):
+                # Set WAL mode for better concurrent read access; switching
+                # takes a write lock, so only do it when not already enabled
+                (mode,) = dbapi_conn.execute("PRAGMA journal_mode").fetchone()
+                if mode.lower() != "wal":
+                    dbapi_conn.execute("PRAGMA journal_mode=WAL")
 
         @event.listens_for(engine, "connect")
         def set_sqlite_pragma(dbapi_conn, connection_record):
-            cursor = dbapi_conn.cursor()
-            # Enable foreign key constraints
-            cursor.execute("PRAGMA foreign_keys=ON")
-            # Set WAL mode for better concurrent read access
-            cursor.execute("PRAGMA journal_mode=WAL")
-            cursor.close()
+            # Disable pysqlite's implicit BEGIN; do_begin below emits it
+            dbapi_conn.isolation_level = None
+            dbapi_conn.executescript(script)
+
+        @event.listens_for(engine, "begin")
+        def do_begin(conn):
+            conn.exec_driver_sql("BEGIN")
+
+    def prewarm_pool(self, engine: Engine) -> None:
+        """Open every pooled connection once so PRAGMAs run at startup.
+
+        Args:
+            engine: SQLAlchemy engine, with events already set up
+
+        Note:
+            Opening a SQLite connection runs the connect script (and the WAL
+            check on the first one); doing it for the whole pool here keeps
+            that cost out of the first requests. The connections go straight
+            back to the pool. Only QueuePool engines are warmed; warming is
+            best effort, so a database that cannot be opened yet (e.g. the
+            read-only engine before the file exists) is left to connect lazily.
+        """
+        pool = engine.pool
+        if not isinstance(pool, QueuePool):
+            return
+
+        connections = []
+        try:
+            for _ in range(pool.size()):
+                connections.append(engine.raw_connection())
+        except engine.dialect.loaded_dbapi.Error:
+            # The pool raises the driver's own exception, not a wrapped DBAPIError
+            pass
+        finally:
+            for connection in connections:
+                connection.close()
 
     def get_migration_kwargs(self) -> dict:
         """Get Alembic migration kwargs.
@@ -125,25 +308,20 @@ class SQLiteDialect(BaseDialect):
 
         Returns:
             List of validation errors (empty if valid)
+
+        Note:
+            The path is stat()ed once per resolved path and the result is
+            cached until build_url() creates directories, so repeated
+            validation (e.g. on config reload) skips the stat.
         """
         errors = []
 
         # Check if path is accessible
         try:
-            db_path = Path(config.path)
-            if db_path.exists() and not db_path.is_file():
+            exists, is_file = _stat_path(Path(config.path).resolve())
+            if exists and not is_file:
                 errors.append(f"Database path exists but is not a file: {config.path}")
         except Exception as e:
             errors.append(f"Invalid database path: {e}")
 
         return errors
-
-    @property
-    def supports_json(self) -> bool:
-        """SQLite has limited JSON support (via JSON1 extension)."""
-        return True  # JSON1 extension is commonly available
-
-    @property
-    def supports_array(self) -> bool:
-        """SQLite does not support ARRAY types."""
-        return False
@@ -8,16 +8,232 @@ Mixins allow repositories to compose functionality through multiple
 inheritance while maintaining the Generic type system for type safety.
 """
 
-from datetime import datetime, timedelta
-from typing import TypeVar, Generic, Optional, TYPE_CHECKING, Any, Dict
-from sqlalchemy import asc, desc, func
+import json
+from datetime import datetime, timedelta, timezone
+from functools import cache
+from weakref import WeakKeyDictionary
+from typing import (
+    TypeVar,
+    Generic,
+    Optional,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+)
+from sqlalchemy import (
+    and_,
+    asc,
+    bindparam,
+    desc,
+    event,
+    exists,
+    func,
+    inspect,
+    literal_column,
+    or_,
+    select,
+    table,
+)
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.util import identity_key
+
+from spider_aggregation.models import CategoryModel, FeedModel, feed_categories
+from spider_aggregation.models.entry import ENTRIES_FTS_TABLE
+from spider_aggregation.utils.json_utils import dumps, loads
 
 if TYPE_CHECKING:
-    from sqlalchemy.orm import Session
-    from sqlalchemy import Select, Query
-    from spider_aggregation.models import EntryModel
+    from sqlalchemy.orm import ORMExecuteState, Session
+    from sqlalchemy import ColumnElement, Engine, Select
 
 ModelType = TypeVar("ModelType")
+T = TypeVar("T")
+
+# session.info key for per-session category query results
+_CATEGORY_CACHE_KEY = "entry_category_cache"
+
+# Longer category ID lists are sent to SQLite as one JSON array parameter
+# instead of one bound parameter per ID
+_MAX_EXPANDED_IDS = 500
+
+# The trigram tokenizer cannot match anything shorter than 3 characters
+_FTS_MIN_QUERY_LENGTH = 3
+
+# Entry ids whose title or content contains the ``fts_query`` phrase
+_ENTRIES_FTS_MATCH = (
+    select(literal_column("rowid"))
+    .select_from(table(ENTRIES_FTS_TABLE))
+    .where(literal_column(ENTRIES_FTS_TABLE).op("MATCH")(bindparam("fts_query")))
+)
+
+# Statements of set_categories_for_feed(), built once with bound parameters:
+# the feed's linked category ids, which of the ``ids`` exist, and the removal
+# of the ``ids`` links
+_FEED_CATEGORY_IDS = select(feed_categories.c.category_id).where(
+    feed_categories.c.feed_id == bindparam("feed_id")
+)
+_KNOWN_CATEGORY_IDS = select(CategoryModel.id).where(
+    CategoryModel.id.in_(bindparam("ids", expanding=True))
+)
+_UNLINK_CATEGORIES = feed_categories.delete().where(
+    feed_categories.c.feed_id == bindparam("feed_id"),
+    feed_categories.c.category_id.in_(bindparam("ids", expanding=True)),
+)
+
+# Whether each engine's database has the entries_fts table
+_fts_available: "WeakKeyDictionary[Engine, bool]" = WeakKeyDictionary()
+
+
+def _contains_pattern(query: str) -> str:
+    """Build a LIKE pattern matching query anywhere, with "/" as escape character."""
+    escaped = query.replace("/", "//").replace("%", "/%").replace("_", "/_")
+    return f"%{escaped}%"
+
+
+def _utcnow() -> datetime:
+    """Return the current UTC time as a naive datetime, as stored in the database."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _has_entries_fts(session: "Session") -> bool:
+    """Check whether the session's database has the entries_fts table.
+
+    The table only exists on SQLite (created with the entries table or by
+    migration 012); the lookup runs once per engine.
+
+    Args:
+        session: SQLAlchemy Session instance
+
+    Returns:
+        True if full-text search can be used
+    """
+    bind = session.get_bind()
+    if bind.dialect.name != "sqlite":
+        return False
+    available = _fts_available.get(bind)
+    if available is None:
+        available = inspect(session.connection()).has_table(ENTRIES_FTS_TABLE)
+        _fts_available[bind] = available
+    return available
+
+
+def _session_cache(session: "Session") -> dict:
+    """Get the category query result cache for a session.
+
+    Results are cached on ``session.info`` for the current transaction only:
+    the cache is dropped whenever the session flushes, whenever a statement
+    other than a SELECT runs through it (bulk and Core DML neither flush nor
+    mark the session dirty), and whenever a transaction ends, by commit,
+    rollback or close, since a reused session (e.g. a thread-local one) can
+    then see other sessions' commits.
+
+    Args:
+        session: SQLAlchemy Session instance
+
+    Returns:
+        Dict of cache key -> query result
+    """
+    cache = session.info.get(_CATEGORY_CACHE_KEY)
+    if cache is None:
+        cache = session.info[_CATEGORY_CACHE_KEY] = {}
+
+        def clear(*args: Any) -> None:
+            cache.clear()
+
+        def clear_on_write(orm_execute_state: "ORMExecuteState") -> None:
+            if not orm_execute_state.is_select:
+                cache.clear()
+
+        for name in ("after_flush", "after_transaction_end"):
+            event.listen(session, name, clear)
+        event.listen(session, "do_orm_execute", clear_on_write)
+    return cache
+
+
+@cache
+def _entry_category_statements(model: type) -> dict[str, "Select"]:
+    """Build the entry-category base statements for a model, once per class.
+
+    The category is a bound parameter (``category_id``, ``category_name``,
+    the expanding ``category_ids`` or the JSON array ``category_ids_json``),
+    so the same statement objects are reused on every call and SQLAlchemy's
+    compiled cache hits on the first lookup.
+
+    Category membership is an EXISTS on feed_categories correlated to the
+    entry's feed_id rather than a join, so the database can stop at the first
+    matching (feed_id, category_id) primary key row and an entry is returned
+    once even if its feed is in several of the requested categories.
+
+    Args:
+        model: Entry-like model class with a feed_id foreign key
+
+    Returns:
+        Dict of statement name -> Select
+    """
+    in_feed = feed_categories.c.feed_id == model.feed_id
+    json_ids = func.json_each(bindparam("category_ids_json")).table_valued("value")
+    return {
+        "id": select(model).where(
+            exists().where(in_feed, feed_categories.c.category_id == bindparam("category_id"))
+        ),
+        "name": select(model).where(
+            exists().where(
+                in_feed,
+                feed_categories.c.category_id == CategoryModel.id,
+                CategoryModel.name == bindparam("category_name"),
+            )
+        ),
+        "ids": select(model).where(
+            exists().where(
+                in_feed,
+                feed_categories.c.category_id.in_(bindparam("category_ids", expanding=True)),
+            )
+        ),
+        # SQLite only: SQL text stays the same whatever the number of IDs
+        "ids_json": select(model).where(
+            exists().where(
+                in_feed,
+                feed_categories.c.category_id.in_(select(json_ids.c.value)),
+            )
+        ),
+    }
+
+
+@cache
+def _model_columns(model: type) -> dict[str, Any]:
+    """Map a model's column attribute names to its attributes, once per class.
+
+    Args:
+        model: Mapped model class
+
+    Returns:
+        Dict of attribute name -> instrumented column attribute
+    """
+    return {attr.key: getattr(model, attr.key) for attr in inspect(model).column_attrs}
+
+
+def _order_column(model: type, order_by: str, *fallbacks: str) -> Any:
+    """Look up the column to order by among a model's columns.
+
+    Only mapped columns qualify, so a name that is not one (a typo, a
+    relationship or any other attribute, e.g. from a request parameter)
+    falls back to the first of ``fallbacks`` the model has.
+
+    Args:
+        model: Mapped model class
+        order_by: Field name to order by
+        *fallbacks: Field names to try in turn when order_by is no column
+
+    Returns:
+        Instrumented column attribute, or None if no name matches
+    """
+    columns = _model_columns(model)
+    for name in (order_by, *fallbacks):
+        if name in columns:
+            return columns[name]
+    return None
 
 
 class EntryCategoryQueryMixin(Generic[ModelType]):
@@ -25,7 +241,7 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
 
     This mixin provides methods for querying entries by category through
     the many-to-many feed-categories relationship. It encapsulates the
-    common join pattern: Entry -> Feed -> feed_categories -> Category.
+    common filter: Entry.feed_id EXISTS in feed_categories (-> Category).
 
     This mixin should be used with repositories that manage Entry-like
     models with a feed_id foreign key.
@@ -37,70 +253,67 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
     session: "Session"
     model: type[ModelType]
 
-    def _build_entry_category_query(self, category_id: int) -> "Select[tuple[ModelType]]":
-        """Build base query for entry-category filtering via feeds.
-
-        This method encapsulates the common join pattern used across all
-        category-based entry queries:
-
-        EntryModel -> FeedModel -> feed_categories -> CategoryModel
+    def _cached(self, key: tuple, load: Callable[[], T]) -> T:
+        """Return a cached query result for this session, loading it on a miss.
 
         Args:
-            category_id: Category ID to filter by
+            key: Method name and arguments identifying the query
+            load: Function running the query
 
         Returns:
-            SQLAlchemy query with joins applied
+            Query result (list results are returned as a fresh list)
         """
-        from spider_aggregation.models import feed_categories, FeedModel
+        session = self.session
+        if session.new or session.deleted or session.dirty:
+            # Pending writes are not visible to the cache; query directly
+            return load()
+
+        cache = _session_cache(session)
+        key = (self.model.__name__, *key)
+        if key not in cache:
+            cache[key] = load()
+        result = cache[key]
+        return list(result) if isinstance(result, list) else result
+
+    def _build_entry_category_query(self) -> "Select[tuple[ModelType]]":
+        """Build base query for entry-category filtering via feeds.
 
-        return (
-            self.session.query(self.model)
-            .join(FeedModel, self.model.feed_id == FeedModel.id)
-            .join(feed_categories)
-            .filter(feed_categories.c.category_id == category_id)
-        )
+        This method encapsulates the category filter used across all
+        category-based entry queries: an EXISTS on feed_categories for the
+        entry's feed_id.
 
-    def _build_entry_category_name_query(self, category_name: str) -> "Select[tuple[ModelType]]":
-        """Build base query for entry-category filtering by category name.
+        Returns:
+            Select with the filter applied, bound by the ``category_id`` parameter
+        """
+        return _entry_category_statements(self.model)["id"]
 
-        Args:
-            category_name: Category name to filter by
+    def _build_entry_category_name_query(self) -> "Select[tuple[ModelType]]":
+        """Build base query for entry-category filtering by category name.
 
         Returns:
-            SQLAlchemy query with joins applied
+            Select with the filter applied, bound by the ``category_name`` parameter
         """
-        from spider_aggregation.models import CategoryModel, feed_categories, FeedModel
-
-        return (
-            self.session.query(self.model)
-            .join(FeedModel, self.model.feed_id == FeedModel.id)
-            .join(feed_categories)
-            .join(CategoryModel)
-            .filter(CategoryModel.name == category_name)
-        )
+        return _entry_category_statements(self.model)["name"]
 
-    def _build_entry_categories_query(
-        self, category_ids: list[int]
-    ) -> Optional["Select[tuple[ModelType]]"]:
+    def _build_entry_categories_query(self) -> "Select[tuple[ModelType]]":
         """Build base query for entry filtering by multiple category IDs.
 
-        Args:
-            category_ids: List of category IDs to filter by
-
         Returns:
-            SQLAlchemy query with joins applied, or None if category_ids is empty
+            Select with the filter applied, bound by the ``category_ids`` parameter
         """
-        from spider_aggregation.models import feed_categories, FeedModel
+        return _entry_category_statements(self.model)["ids"]
 
-        if not category_ids:
-            return None
+    def _build_entry_categories_json_query(self) -> "Select[tuple[ModelType]]":
+        """Build base query for entry filtering by a JSON array of category IDs.
 
-        return (
-            self.session.query(self.model)
-            .join(FeedModel, self.model.feed_id == FeedModel.id)
-            .join(feed_categories)
-            .filter(feed_categories.c.category_id.in_(category_ids))
-        )
+        SQLite only; used for long ID lists so the SQL text does not grow
+        with (and vary by) the number of IDs.
+
+        Returns:
+            Select with the filter applied, bound by the ``category_ids_json``
+            parameter
+        """
+        return _entry_category_statements(self.model)["ids_json"]
 
     def _apply_ordering(
         self,
@@ -110,6 +323,10 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
     ) -> "Select[tuple[ModelType]]":
         """Apply ordering to a query.
 
+        Rows with equal values in the order column are ordered by id in the
+        same direction, so the order is total and keyset pagination can
+        resume from any row.
+
         Args:
             query: SQLAlchemy query
             order_by: Field name to order by
@@ -118,11 +335,76 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
         Returns:
             Query with ordering applied
         """
-        order_column = getattr(self.model, order_by, self.model.published_at)
+        order_column = _order_column(self.model, order_by, "published_at")
+        if order_desc:
+            return query.order_by(desc(order_column), desc(self.model.id))
+        else:
+            return query.order_by(asc(order_column), asc(self.model.id))
+
+    def _paginate(
+        self,
+        query: "Select[tuple[ModelType]]",
+        limit: int,
+        offset: int,
+        order_by: str,
+        order_desc: bool,
+        after_value: Any = None,
+        after_id: Optional[int] = None,
+    ) -> "Select[tuple[ModelType]]":
+        """Apply ordering and either keyset or offset pagination to a query.
+
+        With ``after_value`` set, the query starts after the row whose order
+        column is ``after_value`` (and id is ``after_id``, when given) instead
+        of skipping ``offset`` rows, so the database seeks straight to the
+        page rather than walking every skipped row. Rows with NULL in the
+        order column are never reached by keyset pagination.
+
+        Args:
+            query: SQLAlchemy query
+            limit: Maximum number of results
+            offset: Number of results to skip (ignored with ``after_value``)
+            order_by: Field name to order by
+            order_desc: True for descending, False for ascending
+            after_value: Order column value of the last row of the previous page
+            after_id: ID of the last row of the previous page
+
+        Returns:
+            Query with ordering and pagination applied
+        """
+        query = self._apply_ordering(query, order_by, order_desc).limit(limit)
+        if after_value is None:
+            return query.offset(offset)
+
+        order_column = _order_column(self.model, order_by, "published_at")
         if order_desc:
-            return query.order_by(desc(order_column))
+            after = order_column < after_value
+            if after_id is not None:
+                after = or_(after, and_(order_column == after_value, self.model.id < after_id))
         else:
-            return query.order_by(asc(order_column))
+            after = order_column > after_value
+            if after_id is not None:
+                after = or_(after, and_(order_column == after_value, self.model.id > after_id))
+        return query.where(after)
+
+    def _with_relations(
+        self, query: "Select[tuple[ModelType]]", load_relations: bool
+    ) -> "Select[tuple[ModelType]]":
+        """Eager-load each entry's feed (and its categories) when requested.
+
+        The feeds of a whole result set are fetched in one extra SELECT ... IN
+        query instead of one lazy load per entry; the feeds' categories follow
+        in one more through their ``selectin`` relationship.
+
+        Args:
+            query: SQLAlchemy query
+            load_relations: Whether to load the related feeds
+
+        Returns:
+            Query with loader options applied
+        """
+        if not load_relations:
+            return query
+        return query.options(selectinload(self.model.feed))
 
     def list_by_category(
         self,
@@ -131,6 +413,9 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
         offset: int = 0,
         order_by: str = "published_at",
         order_desc: bool = True,
+        after_value: Any = None,
+        after_id: Optional[int] = None,
+        load_relations: bool = False,
     ) -> list[ModelType]:
         """List entries by category ID (via feed relationship).
 
@@ -140,13 +425,64 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
             offset: Number of results to skip
             order_by: Field to order by
             order_desc: Sort in descending order
+            after_value: Keyset cursor, the order_by value of the last row
+                already seen (replaces offset)
+            after_id: ID of the last row already seen
+            load_relations: Also load each entry's feed and its categories
 
         Returns:
             List of model instances
         """
-        query = self._build_entry_category_query(category_id)
-        query = self._apply_ordering(query, order_by, order_desc)
-        return query.limit(limit).offset(offset).all()
+        query = self._paginate(
+            self._build_entry_category_query(),
+            limit,
+            offset,
+            order_by,
+            order_desc,
+            after_value,
+            after_id,
+        )
+        query = self._with_relations(query, load_relations)
+        return self._cached(
+            (
+                "list_by_category",
+                category_id,
+                limit,
+                offset,
+                order_by,
+                order_desc,
+                after_value,
+                after_id,
+                load_relations,
+            ),
+            lambda: list(self.session.scalars(query, {"category_id": category_id})),
+        )
+
+    def iter_by_category(
+        self,
+        category_id: int,
+        batch_size: int = 500,
+        order_by: str = "published_at",
+        order_desc: bool = True,
+    ) -> Iterator[ModelType]:
+        """Iterate over all entries of a category, fetching rows in batches.
+
+        Rows are streamed with ``yield_per``, so memory use is bounded by
+        ``batch_size`` rather than the size of the category. Results are not
+        cached.
+
+        Args:
+            category_id: Category ID
+            batch_size: Number of rows fetched from the database at a time
+            order_by: Field to order by
+            order_desc: Sort in descending order
+
+        Yields:
+            Model instances
+        """
+        query = self._apply_ordering(self._build_entry_category_query(), order_by, order_desc)
+        query = query.execution_options(yield_per=batch_size)
+        yield from self.session.scalars(query, {"category_id": category_id})
 
     def list_by_category_name(
         self,
@@ -155,6 +491,9 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
         offset: int = 0,
         order_by: str = "published_at",
         order_desc: bool = True,
+        after_value: Any = None,
+        after_id: Optional[int] = None,
+        load_relations: bool = False,
     ) -> list[ModelType]:
         """List entries by category name (via feed relationship).
 
@@ -164,13 +503,25 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
             offset: Number of results to skip
             order_by: Field to order by
             order_desc: Sort in descending order
+            after_value: Keyset cursor, the order_by value of the last row
+                already seen (replaces offset)
+            after_id: ID of the last row already seen
+            load_relations: Also load each entry's feed and its categories
 
         Returns:
             List of model instances
         """
-        query = self._build_entry_category_name_query(category_name)
-        query = self._apply_ordering(query, order_by, order_desc)
-        return query.limit(limit).offset(offset).all()
+        query = self._paginate(
+            self._build_entry_category_name_query(),
+            limit,
+            offset,
+            order_by,
+            order_desc,
+            after_value,
+            after_id,
+        )
+        query = self._with_relations(query, load_relations)
+        return list(self.session.scalars(query, {"category_name": category_name}))
 
     def list_by_categories(
         self,
@@ -179,6 +530,9 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
         offset: int = 0,
         order_by: str = "published_at",
         order_desc: bool = True,
+        after_value: Any = None,
+        after_id: Optional[int] = None,
+        load_relations: bool = False,
     ) -> list[ModelType]:
         """List entries by multiple category IDs (entries from feeds in any category).
 
@@ -188,15 +542,49 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
             offset: Number of results to skip
             order_by: Field to order by
             order_desc: Sort in descending order
+            after_value: Keyset cursor, the order_by value of the last row
+                already seen (replaces offset)
+            after_id: ID of the last row already seen
+            load_relations: Also load each entry's feed and its categories
 
         Returns:
             List of model instances
         """
-        query = self._build_entry_categories_query(category_ids)
-        if query is None:
+        if not category_ids:
             return []
-        query = self._apply_ordering(query, order_by, order_desc)
-        return query.limit(limit).offset(offset).all()
+        if (
+            len(category_ids) > _MAX_EXPANDED_IDS
+            and self.session.get_bind().dialect.name == "sqlite"
+        ):
+            base = self._build_entry_categories_json_query()
+            params = {"category_ids_json": dumps(list(category_ids))}
+        else:
+            base = self._build_entry_categories_query()
+            params = {"category_ids": category_ids}
+        query = self._paginate(
+            base,
+            limit,
+            offset,
+            order_by,
+            order_desc,
+            after_value,
+            after_id,
+        )
+        query = self._with_relations(query, load_relations)
+        return self._cached(
+            (
+                "list_by_categories",
+                tuple(category_ids),
+                limit,
+                offset,
+                order_by,
+                order_desc,
+                after_value,
+                after_id,
+                load_relations,
+            ),
+            lambda: list(self.session.scalars(query, params)),
+        )
 
     def count_by_category(self, category_id: int) -> int:
         """Count entries by category ID.
@@ -207,8 +595,11 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
         Returns:
             Number of entries in the category
         """
-        query = self._build_entry_category_query(category_id)
-        return query.count()
+        query = self._build_entry_category_query().with_only_columns(func.count(self.model.id))
+        return self._cached(
+            ("count_by_category", category_id),
+            lambda: self.session.scalar(query, {"category_id": category_id}),
+        )
 
     def search_by_category(
         self,
@@ -219,6 +610,11 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
     ) -> list[ModelType]:
         """Search entries by title or content within a category.
 
+        On SQLite the search goes through the entries_fts trigram index, so
+        only entries containing the query are looked at instead of scanning
+        every entry of the category. Queries shorter than 3 characters and
+        other databases use LIKE '%query%' (see _build_search_filter()).
+
         Args:
             query: Search query string
             category_id: Category ID
@@ -228,9 +624,39 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
         Returns:
             List of matching model instances
         """
-        q = self._build_entry_category_query(category_id)
-        q = q.filter((self.model.title.contains(query)) | (self.model.content.contains(query)))
-        return q.order_by(desc(self.model.published_at)).limit(limit).offset(offset).all()
+        condition, params = self._build_search_filter(query)
+        q = self._build_entry_category_query().where(condition)
+        q = q.order_by(desc(self.model.published_at)).limit(limit).offset(offset)
+        return list(self.session.scalars(q, {"category_id": category_id, **params}))
+
+    def _build_search_filter(self, query: str) -> tuple["ColumnElement[bool]", dict[str, Any]]:
+        """Build the condition matching entries whose title or content contains query.
+
+        On SQLite with the entries_fts table the condition is a lookup in the
+        trigram index; otherwise it is a case-insensitive LIKE '%query%' on
+        both columns (ILIKE on PostgreSQL, served by the pg_trgm indexes).
+        Either way the query is matched literally: FTS5 gets it as a quoted
+        phrase and LIKE wildcards in it are escaped.
+
+        Args:
+            query: Search query string
+
+        Returns:
+            Tuple of (condition, bound parameters the condition needs)
+        """
+        if (
+            len(query) >= _FTS_MIN_QUERY_LENGTH
+            and self.model.__tablename__ == "entries"
+            and _has_entries_fts(self.session)
+        ):
+            # Quote as an FTS5 phrase so the query is matched literally
+            fts_query = '"' + query.replace('"', '""') + '"'
+            return self.model.id.in_(_ENTRIES_FTS_MATCH), {"fts_query": fts_query}
+        pattern = _contains_pattern(query)
+        condition = self.model.title.ilike(pattern, escape="/") | self.model.content.ilike(
+            pattern, escape="/"
+        )
+        return condition, {}
 
     def get_recent_by_category(
         self, category_id: int, days: int = 7, limit: int = 100
@@ -245,11 +671,11 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
         Returns:
             List of recent model instances
         """
-        cutoff = datetime.utcnow() - timedelta(days=days)
-        q = self._build_entry_category_query(category_id)
-        q = q.filter(self.model.published_at >= cutoff)
-        q = q.order_by(desc(self.model.published_at))
-        return q.limit(limit).all()
+        cutoff = _utcnow() - timedelta(days=days)
+        q = self._build_entry_category_query()
+        q = q.where(self.model.published_at >= cutoff)
+        q = q.order_by(desc(self.model.published_at)).limit(limit)
+        return list(self.session.scalars(q, {"category_id": category_id}))
 
     def get_stats_by_category(self, category_id: int) -> dict:
         """Get entry statistics for a category.
@@ -263,28 +689,29 @@ class EntryCategoryQueryMixin(Generic[ModelType]):
                 - language_counts: Dict of language -> count
                 - most_recent: Most recent entry's published_at
         """
-        base_query = self._build_entry_category_query(category_id)
-        total = base_query.count()
-
-        # Count by language
-        language_counts = (
-            base_query.filter(self.model.language.isnot(None))
-            .with_entities(self.model.language, func.count(self.model.id))
+        # One pass over the entries: per-language counts and latest dates, with
+        # the NULL-language group included so the totals can be summed up
+        query = (
+            self._build_entry_category_query()
+            .with_only_columns(
+                self.model.language,
+                func.count(self.model.id),
+                func.max(self.model.published_at),
+            )
             .group_by(self.model.language)
-            .all()
         )
-
-        # Get most recent entry date
-        most_recent = (
-            base_query.filter(self.model.published_at.isnot(None))
-            .order_by(desc(self.model.published_at))
-            .first()
+        rows = self._cached(
+            ("get_stats_by_category", category_id),
+            lambda: self.session.execute(query, {"category_id": category_id}).all(),
         )
 
+        dates = [latest for _, _, latest in rows if latest is not None]
         return {
-            "total": total,
-            "language_counts": dict(language_counts) if language_counts else {},
-            "most_recent": most_recent.published_at if most_recent else None,
+            "total": sum(count for _, count, _ in rows),
+            "language_counts": {
+                language: count for language, count, _ in rows if language is not None
+            },
+            "most_recent": max(dates) if dates else None,
         }
 
 
@@ -295,8 +722,9 @@ class FilterQueryMixin(Generic[ModelType]):
     both simple equality filters (via **kwargs) and complex filter logic
     that cannot be expressed as simple key-value pairs.
 
-    Subclasses should override _apply_complex_filters() to implement
-    their specific filter logic.
+    Subclasses should list their complex filter keys in complex_filter_keys
+    and override _apply_complex_filters() to implement their specific
+    filter logic.
 
     Type Args:
         ModelType: The model type (typically FilterRuleModel or similar)
@@ -305,9 +733,39 @@ class FilterQueryMixin(Generic[ModelType]):
     session: "Session"
     model: type[ModelType]
 
+    # Filter keys handled by _apply_complex_filters() instead of equality
+    complex_filter_keys: ClassVar[frozenset[str]] = frozenset()
+
+    def _apply_filters(
+        self, query: "Select[tuple[ModelType]]", filters: Dict[str, Any]
+    ) -> "Select[tuple[ModelType]]":
+        """Apply simple equality filters and complex filters to a query.
+
+        Keys naming a model column are applied as equality filters and keys
+        in complex_filter_keys are passed to _apply_complex_filters(); other
+        keys are ignored.
+
+        Args:
+            query: SQLAlchemy query
+            filters: Dict with filter keys and values
+
+        Returns:
+            Query with all filters applied
+        """
+        complex_keys = self.complex_filter_keys
+        columns = _model_columns(self.model)
+        complex_filters = {}
+        for key, value in filters.items():
+            if key in complex_keys:
+                complex_filters[key] = value
+            elif value is not None and key in columns:
+                query = query.filter(columns[key] == value)
+
+        return self._apply_complex_filters(query, complex_filters)
+
     def _apply_complex_filters(
-        self, query: "Query[ModelType]", filters: Dict[str, Any]
-    ) -> "Query[ModelType]":
+        self, query: "Select[tuple[ModelType]]", filters: Dict[str, Any]
+    ) -> "Select[tuple[ModelType]]":
         """Apply non-equality based filters to a query.
 
         This method should be overridden in subclasses to implement
@@ -354,31 +812,17 @@ class FilterQueryMixin(Generic[ModelType]):
         Returns:
             List of model instances
         """
-        query = self.session.query(self.model)
-
-        # Apply simple equality filters
-        simple_filters = {
-            k: v
-            for k, v in filters.items()
-            if k not in self._get_complex_filter_keys() and v is not None
-        }
-        for key, value in simple_filters.items():
-            if hasattr(self.model, key):
-                query = query.filter(getattr(self.model, key) == value)
-
-        # Apply complex filters
-        complex_filters = {k: v for k, v in filters.items() if k in self._get_complex_filter_keys()}
-        query = self._apply_complex_filters(query, complex_filters)
+        query = self._apply_filters(select(self.model), filters)
 
         # Apply ordering
-        order_column = getattr(self.model, order_by, getattr(self.model, "created_at", None))
+        order_column = _order_column(self.model, order_by, "created_at")
         if order_column is not None:
             if order_desc:
                 query = query.order_by(desc(order_column))
             else:
                 query = query.order_by(asc(order_column))
 
-        return query.limit(limit).offset(offset).all()
+        return list(self.session.scalars(query.limit(limit).offset(offset)))
 
     def count(self, **filters: Any) -> int:
         """Count with complex filter support.
@@ -389,35 +833,10 @@ class FilterQueryMixin(Generic[ModelType]):
         Returns:
             Number of matching records
         """
-        query = self.session.query(self.model)
-
-        # Apply simple equality filters
-        simple_filters = {
-            k: v
-            for k, v in filters.items()
-            if k not in self._get_complex_filter_keys() and v is not None
-        }
-        for key, value in simple_filters.items():
-            if hasattr(self.model, key):
-                query = query.filter(getattr(self.model, key) == value)
+        query = self._apply_filters(select(self.model), filters)
 
-        # Apply complex filters
-        complex_filters = {k: v for k, v in filters.items() if k in self._get_complex_filter_keys()}
-        query = self._apply_complex_filters(query, complex_filters)
-
-        return query.count()
-
-    def _get_complex_filter_keys(self) -> set[str]:
-        """Return the set of keys that should be handled by complex filters.
-
-        This method should be overridden in subclasses to specify which
-        filter keys require complex filtering logic.
-
-        Returns:
-            Set of filter key names
-        """
-        # Base implementation returns empty set
-        return set()
+        query = query.with_only_columns(func.count(), maintain_column_froms=True)
+        return self.session.scalar(query)
 
 
 class CategoryRelationshipMixin:
@@ -432,12 +851,23 @@ class CategoryRelationshipMixin:
     - Removing a feed from a category (or category from a feed)
     - Setting all categories for a feed (replaces existing)
     - Clearing all categories from a feed
+
+    Each method flushes by default. Callers making several changes in a row
+    can pass ``flush=False`` and flush once at the end::
+
+        for category in categories:
+            repo.add_category_to_feed(feed, category, flush=False)
+        session.flush()
     """
 
     session: "Session"
 
     def add_category_to_feed(
-        self, feed: "FeedModel", category: "CategoryModel", update_timestamp: bool = True
+        self,
+        feed: FeedModel,
+        category: CategoryModel,
+        update_timestamp: bool = True,
+        flush: bool = True,
     ) -> None:
         """Add a category to a feed.
 
@@ -448,17 +878,21 @@ class CategoryRelationshipMixin:
             feed: FeedModel instance
             category: CategoryModel instance
             update_timestamp: Whether to update feed's updated_at timestamp
+            flush: Whether to flush the session afterwards
         """
-        from spider_aggregation.models import FeedModel
-
         if category not in feed.categories:
             feed.categories.append(category)
             if update_timestamp and hasattr(feed, "updated_at"):
-                feed.updated_at = datetime.utcnow()
-            self.session.flush()
+                feed.updated_at = _utcnow()
+            if flush:
+                self.session.flush()
 
     def remove_category_from_feed(
-        self, feed: "FeedModel", category: "CategoryModel", update_timestamp: bool = True
+        self,
+        feed: FeedModel,
+        category: CategoryModel,
+        update_timestamp: bool = True,
+        flush: bool = True,
     ) -> None:
         """Remove a category from a feed.
 
@@ -468,65 +902,101 @@ class CategoryRelationshipMixin:
             feed: FeedModel instance
             category: CategoryModel instance
             update_timestamp: Whether to update feed's updated_at timestamp
+            flush: Whether to flush the session afterwards
         """
-        from spider_aggregation.models import FeedModel
-
         if category in feed.categories:
             feed.categories.remove(category)
             if update_timestamp and hasattr(feed, "updated_at"):
-                feed.updated_at = datetime.utcnow()
-            self.session.flush()
+                feed.updated_at = _utcnow()
+            if flush:
+                self.session.flush()
 
     def set_categories_for_feed(
         self,
-        feed: "FeedModel",
+        feed: FeedModel,
         category_ids: list[int],
         update_timestamp: bool = True,
-        refresh: bool = True,
-    ) -> "FeedModel":
+        refresh: bool = False,
+        flush: bool = True,
+    ) -> FeedModel:
         """Set categories for a feed (replaces existing categories).
 
         This method replaces all existing categories for a feed with the
-        specified list of categories.
+        specified list of categories. Only the link rows that change are
+        deleted or inserted, with at most one statement each; if the set of
+        categories is unchanged nothing is written and the timestamp is left
+        alone. When the feed's categories are not loaded only their IDs are
+        read, from the link table.
 
         Args:
             feed: FeedModel instance
             category_ids: List of category IDs
             update_timestamp: Whether to update feed's updated_at timestamp
-            refresh: Whether to refresh the feed object before returning
+            refresh: Whether to reload the feed from the database before
+                returning; not needed to see the new categories, which are
+                reloaded on next access
+            flush: Whether to flush the session afterwards (always done
+                when refreshing, which would discard unflushed changes)
 
         Returns:
             Updated FeedModel instance
         """
-        from spider_aggregation.models import CategoryModel
+        if "categories" in inspect(feed).unloaded:
+            existing_ids = set(self.session.scalars(_FEED_CATEGORY_IDS, {"feed_id": feed.id}))
+        else:
+            existing_ids = {c.id for c in feed.categories}
+        new_ids = set(category_ids)
+        if new_ids == existing_ids:
+            return feed
+
+        removed_ids = existing_ids - new_ids
+        added_ids = new_ids - existing_ids
+        if added_ids:
+            # Unknown category IDs are ignored, as when loading the categories
+            added_ids = set(self.session.scalars(_KNOWN_CATEGORY_IDS, {"ids": list(added_ids)}))
+
+        # Write the link rows directly instead of going through the ORM
+        # collection diff, which deletes and re-inserts row by row
+        if removed_ids:
+            self.session.execute(_UNLINK_CATEGORIES, {"feed_id": feed.id, "ids": list(removed_ids)})
+        if added_ids:
+            self.session.execute(
+                feed_categories.insert(),
+                [{"feed_id": feed.id, "category_id": cid} for cid in added_ids],
+            )
 
-        # Fetch all category objects
-        categories = (
-            self.session.query(CategoryModel).filter(CategoryModel.id.in_(category_ids)).all()
-        )
+        # Reload both sides of the relationship on next access
+        self.session.expire(feed, ["categories"])
+        for cid in removed_ids | added_ids:
+            category = self.session.identity_map.get(identity_key(CategoryModel, cid))
+            if category is not None:
+                self.session.expire(category, ["feeds"])
 
-        # Replace existing categories
-        feed.categories = categories
         if update_timestamp and hasattr(feed, "updated_at"):
-            feed.updated_at = datetime.utcnow()
-        self.session.flush()
+            feed.updated_at = _utcnow()
+        if flush or refresh:
+            self.session.flush()
 
         if refresh:
             self.session.refresh(feed)
 
         return feed
 
-    def clear_categories_from_feed(self, feed: "FeedModel", update_timestamp: bool = True) -> None:
+    def clear_categories_from_feed(
+        self, feed: FeedModel, update_timestamp: bool = True, flush: bool = True
+    ) -> None:
         """Clear all categories from a feed.
 
         Args:
             feed: FeedModel instance
             update_timestamp: Whether to update feed's updated_at timestamp
+            flush: Whether to flush the session afterwards
         """
         feed.categories = []
         if update_timestamp and hasattr(feed, "updated_at"):
-            feed.updated_at = datetime.utcnow()
-        self.session.flush()
+            feed.updated_at = _utcnow()
+        if flush:
+            self.session.flush()
 
 
 class JSONFieldMixin(Generic[ModelType]):
@@ -539,13 +1009,20 @@ class JSONFieldMixin(Generic[ModelType]):
     Common use case: Tags stored as JSON strings in database but
     manipulated as lists in application code.
 
+    Subclasses list their JSON fields in json_fields.
+
     Type Args:
         ModelType: The model type (typically EntryModel or similar)
     """
 
+    # Field names stored as JSON strings
+    json_fields: ClassVar[frozenset[str]] = frozenset()
+
     def _serialize_json_field(self, field_name: str, value: Any) -> Optional[str]:
         """Serialize a value to JSON for storage.
 
+        Uses orjson when it is installed and the stdlib json module otherwise.
+
         Args:
             field_name: Name of the field (for logging/validation)
             value: Value to serialize (typically a list or dict)
@@ -555,16 +1032,15 @@ class JSONFieldMixin(Generic[ModelType]):
 
         Example:
             self._serialize_json_field("tags", ["python", "flask"])
-            # Returns: '["python", "flask"]'
+            # Returns: '["python","flask"]' (orjson) or '["python", "flask"]'
         """
         if value is None:
             return None
         if isinstance(value, str) and not value:
             return None
-        import json
 
         try:
-            return json.dumps(value)
+            return dumps(value)
         except (TypeError, ValueError) as e:
             # Log error but don't fail - store as string representation
             import warnings
@@ -595,15 +1071,16 @@ class JSONFieldMixin(Generic[ModelType]):
         value = getattr(self.model, field_name, None)
         if not value:
             return default if default is not None else []
-        import json
 
         try:
-            return json.loads(value)
+            return loads(value)
         except json.JSONDecodeError, TypeError:
             # If not valid JSON, return as-is or default
             return default if default is not None else value
 
-    def _serialize_json_fields(self, data: dict[str, Any], json_fields: set[str]) -> dict[str, Any]:
+    def _serialize_json_fields(
+        self, data: dict[str, Any], json_fields: Optional[frozenset[str]] = None
+    ) -> dict[str, Any]:
         """Serialize multiple JSON fields in a data dict.
 
         This is useful when preparing data for database operations.
@@ -611,6 +1088,7 @@ class JSONFieldMixin(Generic[ModelType]):
         Args:
             data: Dictionary of field names to values
             json_fields: Set of field names that should be JSON serialized
+                (defaults to the class's json_fields)
 
         Returns:
             Modified dictionary with JSON fields serialized
@@ -618,25 +1096,11 @@ class JSONFieldMixin(Generic[ModelType]):
         Example:
             data = {"title": "...", "tags": ["python", "flask"]}
             self._serialize_json_fields(data, {"tags"})
-            # data["tags"] is now: '["python", "flask"]'
+            # data["tags"] is now a JSON string of the list
         """
+        if json_fields is None:
+            json_fields = self.json_fields
         for field_name in json_fields:
             if field_name in data and data[field_name] is not None:
                 data[field_name] = self._serialize_json_field(field_name, data[field_name])
         return data
-
-    def get_json_fields(self) -> set[str]:
-        """Return the set of field names that should be JSON serialized.
-
-        This method should be overridden in subclasses to specify
-        which fields contain JSON data.
-
-        Returns:
-            Set of field names that need JSON serialization
-
-        Example override:
-            def get_json_fields(self):
-                return {"tags", "metadata", "custom_data"}
-        """
-        # Base implementation returns empty set
-        return set()
@@ -7,16 +7,28 @@ common database operations to eliminate code duplication across repositories.
 
 from abc import abstractmethod
 from datetime import datetime
-from typing import TypeVar, Generic, Optional, Type, Any
+from functools import cache
+from typing import TypeVar, Generic, Optional, Type, Any, TYPE_CHECKING
 
-from sqlalchemy import asc, desc
+from sqlalchemy import asc, bindparam, desc, func, select
 from sqlalchemy.orm import Session
 
+from spider_aggregation.storage.mixins import _order_column
+
+if TYPE_CHECKING:
+    from sqlalchemy import Select
+
 ModelType = TypeVar("ModelType")
 CreateSchemaType = TypeVar("CreateSchemaType")
 UpdateSchemaType = TypeVar("UpdateSchemaType")
 
 
+@cache
+def _by_id_statement(model: type) -> "Select":
+    """Build a model's lookup by the ``id`` parameter, once per class."""
+    return select(model).where(model.id == bindparam("id"))
+
+
 class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """Base repository with common CRUD operations.
 
@@ -52,7 +64,6 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         obj = self.model(**obj_data.model_dump())
         self.session.add(obj)
         self.session.flush()
-        self.session.refresh(obj)
         return obj
 
     def get_by_id(self, obj_id: int) -> Optional[ModelType]:
@@ -64,7 +75,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Model instance or None
         """
-        return self.session.query(self.model).filter(self.model.id == obj_id).first()
+        return self.session.scalars(_by_id_statement(self.model), {"id": obj_id}).first()
 
     def list(
         self,
@@ -94,18 +105,9 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 query = query.filter(getattr(self.model, key) == value)
 
         # Apply ordering
-        # Try to get the order_by column, fallback to common timestamp fields
-        if hasattr(self.model, order_by):
-            order_column = getattr(self.model, order_by)
-        elif hasattr(self.model, "created_at"):
-            order_column = self.model.created_at
-        elif hasattr(self.model, "fetched_at"):
-            order_column = self.model.fetched_at
-        elif hasattr(self.model, "id"):
-            order_column = self.model.id
-        else:
-            # No suitable column found, skip ordering
-            order_column = None
+        # Try to get the order_by column, fallback to common timestamp fields;
+        # with no suitable column, skip ordering
+        order_column = _order_column(self.model, order_by, "created_at", "fetched_at", "id")
 
         if order_column is not None:
             if order_desc:
@@ -124,14 +126,16 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Number of records
         """
-        query = self.session.query(self.model)
+        # SELECT count(*) FROM table directly; Query.count() would wrap the
+        # query in a subquery
+        query = select(func.count()).select_from(self.model)
 
         # Apply filters if provided
         for key, value in filters.items():
             if value is not None and hasattr(self.model, key):
-                query = query.filter(getattr(self.model, key) == value)
+                query = query.where(getattr(self.model, key) == value)
 
-        return query.count()
+        return self.session.scalar(query)
 
     def update(self, obj: ModelType, obj_data: UpdateSchemaType) -> ModelType:
         """Update a record.
@@ -153,7 +157,6 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             obj.updated_at = datetime.utcnow()
 
         self.session.flush()
-        self.session.refresh(obj)
         return obj
 
     def delete(self, obj: ModelType) -> None:
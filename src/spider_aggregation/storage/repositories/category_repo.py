@@ -5,15 +5,17 @@ Category repository for database operations.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import asc, desc
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, asc, bindparam, desc, func, or_, select
+from sqlalchemy.orm import Session, lazyload
 
-from spider_aggregation.models import CategoryModel
+from spider_aggregation.models import CategoryModel, feed_categories
 from spider_aggregation.models.category import CategoryCreate, CategoryUpdate
 from spider_aggregation.models.feed import FeedModel
 from spider_aggregation.storage.repositories.base import BaseRepository
 from spider_aggregation.storage.mixins import CategoryRelationshipMixin
 
+_BY_NAME = select(CategoryModel).where(CategoryModel.name == bindparam("name")).limit(1)
+
 
 class CategoryRepository(
     BaseRepository[CategoryModel, CategoryCreate, CategoryUpdate],
@@ -62,7 +64,6 @@ class CategoryRepository(
 
         self.session.add(category)
         self.session.flush()
-        self.session.refresh(category)
         return category
 
     def get_by_name(self, name: str) -> Optional[CategoryModel]:
@@ -74,7 +75,7 @@ class CategoryRepository(
         Returns:
             CategoryModel instance or None
         """
-        return self.session.query(CategoryModel).filter(CategoryModel.name == name).first()
+        return self.session.scalars(_BY_NAME, {"name": name}).first()
 
     def list(
         self, enabled_only: bool = False, limit: int = 1000, offset: int = 0
@@ -125,7 +126,6 @@ class CategoryRepository(
                 setattr(category, key, value)
 
         self.session.flush()
-        self.session.refresh(category)
         return category
 
     def add_feed_to_category(self, feed: FeedModel, category: CategoryModel) -> None:
@@ -158,14 +158,22 @@ class CategoryRepository(
         enabled_only: bool = False,
         limit: int = 1000,
         offset: int = 0,
+        load_relations: bool = True,
+        after_created_at: Optional[datetime] = None,
+        after_id: Optional[int] = None,
     ) -> list[FeedModel]:
-        """Get all feeds in a category.
+        """Get all feeds in a category, newest first.
 
         Args:
             category_id: Category ID
             enabled_only: Only return enabled feeds
             limit: Maximum number of results
-            offset: Number of results to skip
+            offset: Number of results to skip (ignored with after_created_at)
+            load_relations: Load the feeds' categories in one extra query;
+                when False they are left to lazy loading
+            after_created_at: Keyset cursor, created_at of the last feed of
+                the previous page
+            after_id: ID of the last feed of the previous page
 
         Returns:
             List of FeedModel instances
@@ -179,7 +187,20 @@ class CategoryRepository(
         if enabled_only:
             query = query.filter(FeedModel.enabled == True)
 
-        return query.order_by(desc(FeedModel.created_at)).limit(limit).offset(offset).all()
+        if not load_relations:
+            query = query.options(lazyload(FeedModel.categories))
+
+        if after_created_at is not None:
+            after = FeedModel.created_at < after_created_at
+            if after_id is not None:
+                after = or_(
+                    after, and_(FeedModel.created_at == after_created_at, FeedModel.id < after_id)
+                )
+            query = query.filter(after)
+            offset = 0
+
+        query = query.order_by(desc(FeedModel.created_at), desc(FeedModel.id))
+        return query.limit(limit).offset(offset).all()
 
     def get_feed_count_by_category(self, category_id: int, enabled_only: bool = False) -> int:
         """Count feeds in a category.
@@ -191,16 +212,19 @@ class CategoryRepository(
         Returns:
             Number of feeds in the category
         """
+        # Count the link rows; feeds are only joined to check enabled
         query = (
-            self.session.query(FeedModel)
-            .join(FeedModel.categories)
-            .filter(CategoryModel.id == category_id)
+            select(func.count())
+            .select_from(feed_categories)
+            .where(feed_categories.c.category_id == category_id)
         )
 
         if enabled_only:
-            query = query.filter(FeedModel.enabled == True)
+            query = query.join(FeedModel, FeedModel.id == feed_categories.c.feed_id).where(
+                FeedModel.enabled == True
+            )
 
-        return query.count()
+        return self.session.scalar(query)
 
     def set_categories_for_feed(self, feed: FeedModel, category_ids: list[int]) -> FeedModel:
         """Set categories for a feed (replaces existing categories).
@@ -214,5 +238,4 @@ class CategoryRepository(
         Returns:
             Updated FeedModel instance
         """
-        # Use mixin method, refresh for CategoryRepository usage
-        return self.set_categories_for_feed(feed, category_ids, update_timestamp=True, refresh=True)
+        return super().set_categories_for_feed(feed, category_ids, update_timestamp=True)
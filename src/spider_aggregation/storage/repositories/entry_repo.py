@@ -2,39 +2,137 @@
 Entry repository for database operations.
 """
 
+import csv
+import io
+import json
 from datetime import datetime, timedelta
-from typing import Optional
-
-from sqlalchemy import asc, desc, func
+from itertools import batched
+from typing import TYPE_CHECKING, Any, Iterator, Literal, Optional
+
+from sqlalchemy import (
+    Row,
+    bindparam,
+    delete,
+    desc,
+    func,
+    insert,
+    select,
+    text,
+    type_coerce,
+)
+from sqlalchemy.dialects.postgresql import JSONB, insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from spider_aggregation.models import EntryModel, FeedModel
 from spider_aggregation.models.entry import EntryCreate, EntryUpdate
 from spider_aggregation.storage.repositories.base import BaseRepository
-from spider_aggregation.storage.mixins import EntryCategoryQueryMixin, JSONFieldMixin
+from spider_aggregation.storage.mixins import EntryCategoryQueryMixin
+
+if TYPE_CHECKING:
+    from sqlalchemy import Select
+
+
+def _hash_lookups(*criteria) -> tuple["Select", "Select", "Select"]:
+    """Build the statements of one duplicate-detection lookup.
+
+    Returns the unrestricted variant and the variants restricted to the
+    ``feed_id`` parameter and to the expanding ``feed_ids`` parameter.
+    """
+    stmt = select(EntryModel).where(*criteria).limit(1)
+    return (
+        stmt,
+        stmt.where(EntryModel.feed_id == bindparam("feed_id")),
+        stmt.where(EntryModel.feed_id.in_(bindparam("feed_ids", expanding=True))),
+    )
+
+
+# Duplicate-detection lookups run once per incoming entry; the statements are
+# built once with bound parameters so every call hits the compiled SQL cache
+_BY_LINK_HASH = _hash_lookups(EntryModel.link_hash == bindparam("link_hash"))
+_BY_TITLE_HASH = _hash_lookups(EntryModel.title_hash == bindparam("title_hash"))
+_BY_CONTENT_HASH = _hash_lookups(EntryModel.content_hash == bindparam("content_hash"))
+_BY_TITLE_AND_CONTENT = _hash_lookups(
+    EntryModel.title_hash == bindparam("title_hash"),
+    EntryModel.content_hash == bindparam("content_hash"),
+)
+
+
+def _many_hash_lookups(column, entity=EntryModel) -> tuple["Select", "Select"]:
+    """Build the statements of one batched lookup, by the expanding ``hashes``.
+
+    Selects ``entity`` (whole entries by default). Returns the unrestricted
+    variant and the one restricted to ``feed_id``.
+    """
+    stmt = select(entity).where(column.in_(bindparam("hashes", expanding=True)))
+    return stmt, stmt.where(EntryModel.feed_id == bindparam("feed_id"))
+
+
+# bulk_create() switches to COPY on PostgreSQL (psycopg2) from this many entries
+COPY_MIN_ENTRIES = 10_000
+
+# Columns written by COPY: every EntryCreate field, in a fixed order
+_COPY_COLUMNS = tuple(EntryCreate.model_fields)
+_COPY_HASH_COLUMNS = frozenset({"title_hash", "link_hash", "content_hash"})
+
+
+def _copy_row(row: dict) -> list:
+    """Convert entry values to their PostgreSQL text form for COPY ... CSV.
+
+    None stays None and is written unquoted, which COPY reads as NULL.
+    """
+    values = []
+    for column in _COPY_COLUMNS:
+        value = row.get(column)
+        if value is None:
+            pass
+        elif column in _COPY_HASH_COLUMNS:
+            value = f"\\x{value}"
+        elif column == "tags":
+            value = json.dumps(value, ensure_ascii=False)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        values.append(value)
+    return values
+
+
+_MANY_BY_LINK_HASH = _many_hash_lookups(EntryModel.link_hash)
+_MANY_BY_TITLE_HASH = _many_hash_lookups(EntryModel.title_hash)
+_MANY_BY_CONTENT_HASH = _many_hash_lookups(EntryModel.content_hash)
+
+HashKind = Literal["link", "title", "content"]
+
+# Hash kind -> (column name, single lookups, batched lookups, batched lookups
+# of the hash column alone)
+_HASH_KINDS: dict[str, tuple[str, tuple, tuple, tuple]] = {
+    kind: (column.key, single, many, _many_hash_lookups(column, column))
+    for kind, column, single, many in (
+        ("link", EntryModel.link_hash, _BY_LINK_HASH, _MANY_BY_LINK_HASH),
+        ("title", EntryModel.title_hash, _BY_TITLE_HASH, _MANY_BY_TITLE_HASH),
+        ("content", EntryModel.content_hash, _BY_CONTENT_HASH, _MANY_BY_CONTENT_HASH),
+    )
+}
 
 
 class EntryRepository(
     BaseRepository[EntryModel, EntryCreate, EntryUpdate],
     EntryCategoryQueryMixin[EntryModel],
-    JSONFieldMixin[EntryModel],
 ):
     """Repository for Entry CRUD operations.
 
     Inherits common CRUD operations from BaseRepository.
     """
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: Session, batch_size: int = 1000) -> None:
         """Initialize repository with a database session.
 
         Args:
             session: SQLAlchemy Session instance
+            batch_size: Number of entries sent per statement by create_many()
+                and bulk_create()
         """
         super().__init__(session, EntryModel)
-
-    def get_json_fields(self) -> set[str]:
-        """Return JSON field names for EntryModel."""
-        return {"tags"}
+        self.batch_size = batch_size
 
     def create(self, entry_data: EntryCreate) -> EntryModel:
         """Create a new entry.
@@ -45,16 +143,268 @@ class EntryRepository(
         Returns:
             Created EntryModel instance
         """
-        # Convert data dict and handle JSON fields
-        data_dict = entry_data.model_dump()
-        data_dict = self._serialize_json_fields(data_dict, self.get_json_fields())
-
-        entry = EntryModel(**data_dict)
+        entry = EntryModel(**entry_data.model_dump())
         self.session.add(entry)
         self.session.flush()
-        self.session.refresh(entry)
         return entry
 
+    def create_many(self, entries: list[EntryCreate]) -> list[EntryModel]:
+        """Create entries in one multi-row INSERT ... RETURNING statement.
+
+        Unlike bulk_create(), duplicate links are not skipped and the created
+        instances are returned, with server defaults (fetched_at, computed
+        columns) filled in by the same statement instead of a refresh each.
+        Entries are sent batch_size at a time, and the VALUES lists are paged
+        by batch_size as well (insertmanyvalues_page_size), so each batch is
+        one statement unless it exceeds the dialect's bound parameter limit.
+
+        Args:
+            entries: Entry creation data
+
+        Returns:
+            Created EntryModel instances, in the order given
+        """
+        if not entries:
+            return []
+
+        returning = self.session.get_bind().dialect.insert_executemany_returning
+        stmt = (
+            insert(EntryModel)
+            .returning(EntryModel, sort_by_parameter_order=True)
+            .execution_options(insertmanyvalues_page_size=self.batch_size)
+        )
+        created = []
+        for batch in batched(entries, self.batch_size):
+            rows = [entry.model_dump() for entry in batch]
+            if returning:
+                created.extend(self.session.scalars(stmt, rows))
+            else:
+                # No RETURNING for executemany (MySQL): let the unit of work batch it
+                models = [EntryModel(**row) for row in rows]
+                self.session.add_all(models)
+                self.session.flush()
+                created.extend(models)
+        return created
+
+    def bulk_create(self, entries: list[EntryCreate]) -> int:
+        """Insert entries in one multi-row statement, skipping duplicate links.
+
+        Rows whose link_hash already exists are ignored by the database
+        (ON CONFLICT DO NOTHING / INSERT IGNORE), so link deduplication and
+        the insert happen in the same round trip. Entries are sent
+        batch_size at a time, one statement per batch as in create_many(),
+        so only one batch of row dicts is held at once.
+        On PostgreSQL with psycopg2, COPY_MIN_ENTRIES or more entries are
+        loaded with COPY instead (see _copy_create()).
+
+        Args:
+            entries: Entry creation data
+
+        Returns:
+            Number of entries actually inserted
+        """
+        if not entries:
+            return 0
+
+        dialect = self.session.get_bind().dialect
+        if dialect.driver == "psycopg2" and len(entries) >= COPY_MIN_ENTRIES:
+            return self._copy_create(entries)
+        if dialect.name == "postgresql":
+            stmt = postgresql_insert(EntryModel).on_conflict_do_nothing(
+                index_elements=["link_hash"]
+            )
+        elif dialect.name == "sqlite":
+            stmt = sqlite_insert(EntryModel).on_conflict_do_nothing(index_elements=["link_hash"])
+        else:
+            stmt = insert(EntryModel).prefix_with("IGNORE")
+        stmt = stmt.execution_options(insertmanyvalues_page_size=self.batch_size)
+
+        inserted = 0
+        for batch in batched(entries, self.batch_size):
+            rows = [entry.model_dump() for entry in batch]
+            if dialect.insert_executemany_returning:
+                result = self.session.execute(stmt.returning(EntryModel.id), rows)
+                inserted += len(result.all())
+            else:
+                inserted += self.session.execute(stmt, rows).rowcount
+        return inserted
+
+    def _copy_create(self, entries: list[EntryCreate]) -> int:
+        """Load entries with COPY, skipping duplicate links (PostgreSQL).
+
+        COPY has no ON CONFLICT, so the rows are copied into a temporary
+        staging table, batch_size at a time, and moved into entries with a
+        single INSERT ... SELECT ... ON CONFLICT DO NOTHING.
+
+        Args:
+            entries: Entry creation data
+
+        Returns:
+            Number of entries actually inserted
+        """
+        columns = ", ".join(_COPY_COLUMNS)
+        self.session.execute(
+            text(
+                f"CREATE TEMPORARY TABLE entries_copy ON COMMIT DROP AS "
+                f"SELECT {columns} FROM entries WITH NO DATA"
+            )
+        )
+        cursor = self.session.connection().connection.cursor()
+        try:
+            for batch in batched(entries, self.batch_size):
+                buffer = io.StringIO()
+                writer = csv.writer(buffer, quoting=csv.QUOTE_NOTNULL)
+                writer.writerows(_copy_row(entry.model_dump()) for entry in batch)
+                buffer.seek(0)
+                cursor.copy_expert(
+                    f"COPY entries_copy ({columns}) FROM STDIN WITH (FORMAT csv)", buffer
+                )
+        finally:
+            cursor.close()
+
+        result = self.session.execute(
+            text(
+                f"INSERT INTO entries ({columns}) SELECT {columns} FROM entries_copy "
+                f"ON CONFLICT (link_hash) DO NOTHING"
+            )
+        )
+        self.session.execute(text("DROP TABLE entries_copy"))
+        return result.rowcount
+
+    def _lookup(
+        self,
+        lookups: tuple["Select", "Select", "Select"],
+        params: dict,
+        feed_id: Optional[int] = None,
+        feed_ids: Optional[list[int]] = None,
+    ) -> Optional[EntryModel]:
+        """Run a duplicate-detection lookup, restricted to a feed or feeds if given."""
+        stmt = lookups[0]
+        if feed_id is not None:
+            stmt = lookups[1]
+            params["feed_id"] = feed_id
+        elif feed_ids:
+            stmt = lookups[2]
+            params["feed_ids"] = feed_ids
+        return self.session.scalars(stmt, params).first()
+
+    def _lookup_many(
+        self,
+        lookups: tuple["Select", "Select"],
+        key: str,
+        hashes: list[str],
+        feed_id: Optional[int] = None,
+    ) -> dict[str, EntryModel]:
+        """Run a batched lookup, one statement per batch_size hashes."""
+        stmt, params = lookups[0], {}
+        if feed_id is not None:
+            stmt, params = lookups[1], {"feed_id": feed_id}
+        found: dict[str, EntryModel] = {}
+        for batch in batched(dict.fromkeys(hashes), self.batch_size):
+            params["hashes"] = list(batch)
+            for entry in self.session.scalars(stmt, params):
+                found.setdefault(getattr(entry, key), entry)
+        return found
+
+    def _hash_kind(self, kind: HashKind) -> tuple[str, tuple, tuple, tuple]:
+        """Look up the column and statements of a hash kind."""
+        try:
+            return _HASH_KINDS[kind]
+        except KeyError:
+            supported = ", ".join(_HASH_KINDS)
+            raise ValueError(
+                f"Unsupported hash kind: {kind!r}. Supported kinds: {supported}"
+            ) from None
+
+    def get_by_hash(
+        self,
+        kind: HashKind,
+        value: str,
+        feed_id: Optional[int] = None,
+        feed_ids: Optional[list[int]] = None,
+    ) -> Optional[EntryModel]:
+        """Get an entry by one of its deduplication hashes.
+
+        The get_by_*_hash methods are shorthands for this; all of them run
+        the same prebuilt statements.
+
+        Args:
+            kind: Which hash to match: "link", "title" or "content"
+            value: Hash value
+            feed_id: Optional feed ID to restrict search
+            feed_ids: Optional list of feed IDs to restrict search (when no
+                feed_id is given)
+
+        Returns:
+            EntryModel instance or None
+
+        Raises:
+            ValueError: If kind is not a supported hash kind
+        """
+        column, lookups, _, _ = self._hash_kind(kind)
+        return self._lookup(lookups, {column: value}, feed_id=feed_id, feed_ids=feed_ids)
+
+    def get_many_by_hash(
+        self, kind: HashKind, values: list[str], feed_id: Optional[int] = None
+    ) -> dict[str, EntryModel]:
+        """Get entries for many values of one deduplication hash at once.
+
+        Args:
+            kind: Which hash to match: "link", "title" or "content"
+            values: Hash values
+            feed_id: Optional feed ID to restrict search
+
+        Returns:
+            Dict of hash -> EntryModel for the hashes that were found
+
+        Raises:
+            ValueError: If kind is not a supported hash kind
+        """
+        column, _, lookups, _ = self._hash_kind(kind)
+        return self._lookup_many(lookups, column, values, feed_id)
+
+    def existing_hashes(
+        self, kind: HashKind, values: list[str], feed_id: Optional[int] = None
+    ) -> set[str]:
+        """Return which of the given hashes already belong to an entry.
+
+        Only the hash column is read, one statement per batch_size hashes,
+        so callers can drop known entries before inserting without loading
+        them.
+
+        Args:
+            kind: Which hash to match: "link", "title" or "content"
+            values: Hash values
+            feed_id: Optional feed ID to restrict search
+
+        Returns:
+            Set of the given hashes that were found
+
+        Raises:
+            ValueError: If kind is not a supported hash kind
+        """
+        _, _, _, lookups = self._hash_kind(kind)
+        stmt, params = lookups[0], {}
+        if feed_id is not None:
+            stmt, params = lookups[1], {"feed_id": feed_id}
+        found: set[str] = set()
+        for batch in batched(dict.fromkeys(values), self.batch_size):
+            params["hashes"] = list(batch)
+            found.update(self.session.scalars(stmt, params))
+        return found
+
+    def exists_link_hashes(self, link_hashes: list[str], feed_id: Optional[int] = None) -> set[str]:
+        """Return which of the given link hashes already belong to an entry.
+
+        Args:
+            link_hashes: Hashes of the entry links
+            feed_id: Optional feed ID to restrict search
+
+        Returns:
+            Set of the given link hashes that were found
+        """
+        return self.existing_hashes("link", link_hashes, feed_id)
+
     def get_by_link_hash(
         self, link_hash: str, feed_id: Optional[int] = None
     ) -> Optional[EntryModel]:
@@ -67,10 +417,21 @@ class EntryRepository(
         Returns:
             EntryModel instance or None
         """
-        query = self.session.query(EntryModel).filter(EntryModel.link_hash == link_hash)
-        if feed_id is not None:
-            query = query.filter(EntryModel.feed_id == feed_id)
-        return query.first()
+        return self.get_by_hash("link", link_hash, feed_id=feed_id)
+
+    def get_many_by_link_hash(
+        self, link_hashes: list[str], feed_id: Optional[int] = None
+    ) -> dict[str, EntryModel]:
+        """Get entries for many link hashes at once.
+
+        Args:
+            link_hashes: Hashes of the entry links
+            feed_id: Optional feed ID to restrict search
+
+        Returns:
+            Dict of link hash -> EntryModel for the hashes that were found
+        """
+        return self.get_many_by_hash("link", link_hashes, feed_id)
 
     def get_by_link_hash_any_feed(
         self, link_hash: str, feed_ids: Optional[list[int]] = None
@@ -84,10 +445,7 @@ class EntryRepository(
         Returns:
             EntryModel instance or None
         """
-        query = self.session.query(EntryModel).filter(EntryModel.link_hash == link_hash)
-        if feed_ids:
-            query = query.filter(EntryModel.feed_id.in_(feed_ids))
-        return query.first()
+        return self.get_by_hash("link", link_hash, feed_ids=feed_ids)
 
     def get_by_title_hash(
         self, title_hash: str, feed_id: Optional[int] = None
@@ -101,10 +459,21 @@ class EntryRepository(
         Returns:
             EntryModel instance or None
         """
-        query = self.session.query(EntryModel).filter(EntryModel.title_hash == title_hash)
-        if feed_id is not None:
-            query = query.filter(EntryModel.feed_id == feed_id)
-        return query.first()
+        return self.get_by_hash("title", title_hash, feed_id=feed_id)
+
+    def get_many_by_title_hash(
+        self, title_hashes: list[str], feed_id: Optional[int] = None
+    ) -> dict[str, EntryModel]:
+        """Get entries for many title hashes at once.
+
+        Args:
+            title_hashes: Hashes of the entry titles
+            feed_id: Optional feed ID to restrict search
+
+        Returns:
+            Dict of title hash -> EntryModel for the hashes that were found
+        """
+        return self.get_many_by_hash("title", title_hashes, feed_id)
 
     def get_by_title_hash_any_feed(
         self, title_hash: str, feed_ids: Optional[list[int]] = None
@@ -118,10 +487,7 @@ class EntryRepository(
         Returns:
             EntryModel instance or None
         """
-        query = self.session.query(EntryModel).filter(EntryModel.title_hash == title_hash)
-        if feed_ids:
-            query = query.filter(EntryModel.feed_id.in_(feed_ids))
-        return query.first()
+        return self.get_by_hash("title", title_hash, feed_ids=feed_ids)
 
     def get_by_content_hash(
         self, content_hash: str, feed_id: Optional[int] = None
@@ -135,10 +501,21 @@ class EntryRepository(
         Returns:
             EntryModel instance or None
         """
-        query = self.session.query(EntryModel).filter(EntryModel.content_hash == content_hash)
-        if feed_id is not None:
-            query = query.filter(EntryModel.feed_id == feed_id)
-        return query.first()
+        return self.get_by_hash("content", content_hash, feed_id=feed_id)
+
+    def get_many_by_content_hash(
+        self, content_hashes: list[str], feed_id: Optional[int] = None
+    ) -> dict[str, EntryModel]:
+        """Get entries for many content hashes at once.
+
+        Args:
+            content_hashes: Hashes of the entry contents
+            feed_id: Optional feed ID to restrict search
+
+        Returns:
+            Dict of content hash -> EntryModel for the hashes that were found
+        """
+        return self.get_many_by_hash("content", content_hashes, feed_id)
 
     def get_by_title_and_content(
         self, title_hash: str, content_hash: str, feed_id: Optional[int] = None
@@ -153,12 +530,11 @@ class EntryRepository(
         Returns:
             EntryModel instance or None
         """
-        query = self.session.query(EntryModel).filter(
-            EntryModel.title_hash == title_hash, EntryModel.content_hash == content_hash
+        return self._lookup(
+            _BY_TITLE_AND_CONTENT,
+            {"title_hash": title_hash, "content_hash": content_hash},
+            feed_id=feed_id,
         )
-        if feed_id is not None:
-            query = query.filter(EntryModel.feed_id == feed_id)
-        return query.first()
 
     def list(
         self,
@@ -167,6 +543,8 @@ class EntryRepository(
         offset: int = 0,
         order_by: str = "published_at",
         order_desc: bool = True,
+        after_value: Any = None,
+        after_id: Optional[int] = None,
     ) -> list[EntryModel]:
         """List entries with optional filtering.
 
@@ -176,16 +554,157 @@ class EntryRepository(
             offset: Number of results to skip
             order_by: Field to order by
             order_desc: Sort in descending order
+            after_value: Keyset cursor, the order_by value of the last row
+                already seen (replaces offset)
+            after_id: ID of the last row already seen
 
         Returns:
             List of EntryModel instances
         """
-        filters = {}
+        query = select(EntryModel)
         if feed_id is not None:
-            filters["feed_id"] = feed_id
-        return super().list(
-            limit=limit, offset=offset, order_by=order_by, order_desc=order_desc, **filters
+            query = query.where(EntryModel.feed_id == feed_id)
+        query = self._paginate(query, limit, offset, order_by, order_desc, after_value, after_id)
+        return list(self.session.scalars(query))
+
+    def iter_all(
+        self,
+        feed_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        batch_size: int = 1000,
+        order_by: str = "published_at",
+        order_desc: bool = True,
+    ) -> Iterator[EntryModel]:
+        """Iterate over entries, fetching rows in batches.
+
+        Rows are streamed with ``yield_per``, so memory use is bounded by
+        ``batch_size`` rather than the number of entries, for exports and
+        other passes over the whole table.
+
+        Args:
+            feed_id: Filter by feed ID
+            limit: Maximum number of entries, or None for all
+            batch_size: Number of rows fetched from the database at a time
+            order_by: Field to order by
+            order_desc: Sort in descending order
+
+        Yields:
+            EntryModel instances
+        """
+        query = select(EntryModel)
+        if feed_id is not None:
+            query = query.where(EntryModel.feed_id == feed_id)
+        query = self._apply_ordering(query, order_by, order_desc).limit(limit)
+        yield from self.session.scalars(query.execution_options(yield_per=batch_size))
+
+    def list_with_count(
+        self,
+        feed_id: Optional[int] = None,
+        limit: int = 100,
+        offset: int = 0,
+        order_by: str = "published_at",
+        order_desc: bool = True,
+    ) -> tuple[list[EntryModel], int]:
+        """List a page of entries together with the total number of matches.
+
+        The total comes from a ``count(*) OVER ()`` column on the page query,
+        so paginated listings do not need a separate count() query.
+
+        Args:
+            feed_id: Filter by feed ID
+            limit: Maximum number of results
+            offset: Number of results to skip
+            order_by: Field to order by
+            order_desc: Sort in descending order
+
+        Returns:
+            Tuple of (list of EntryModel instances, total number of entries)
+        """
+        stmt = select(EntryModel, func.count().over())
+        if feed_id is not None:
+            stmt = stmt.where(EntryModel.feed_id == feed_id)
+        stmt = self._apply_ordering(stmt, order_by, order_desc)
+
+        rows = self.session.execute(stmt.limit(limit).offset(offset)).all()
+        return [entry for entry, _ in rows], self._page_total(rows, offset, feed_id)
+
+    def _page_total(self, rows: list[Row], offset: int, feed_id: Optional[int]) -> int:
+        """Get the total carried by the last column of a windowed page query.
+
+        A page past the end has no row to carry it, so it is counted instead.
+        """
+        if rows:
+            return rows[0][-1]
+        return self.count(feed_id=feed_id) if offset else 0
+
+    def _list_rows_statement(
+        self, feed_id: Optional[int], order_by: str, order_desc: bool
+    ) -> "Select":
+        """Build the plain-row listing query used by list_rows()."""
+        stmt = select(*EntryModel.__table__.columns, FeedModel.name.label("feed_name")).outerjoin(
+            FeedModel, EntryModel.feed_id == FeedModel.id
+        )
+
+        if feed_id is not None:
+            stmt = stmt.where(EntryModel.feed_id == feed_id)
+
+        return self._apply_ordering(stmt, order_by, order_desc)
+
+    def list_rows(
+        self,
+        feed_id: Optional[int] = None,
+        limit: int = 100,
+        offset: int = 0,
+        order_by: str = "published_at",
+        order_desc: bool = True,
+    ) -> list[Row]:
+        """List entries as plain column rows, bypassing ORM hydration.
+
+        Rows carry every entry column plus ``feed_name`` and are not tracked
+        by the session, so read-only listings skip identity-map and
+        attribute instrumentation work per entry.
+
+        Args:
+            feed_id: Filter by feed ID
+            limit: Maximum number of results
+            offset: Number of results to skip
+            order_by: Field to order by
+            order_desc: Sort in descending order
+
+        Returns:
+            List of Row objects with attribute access to entry columns
+        """
+        stmt = self._list_rows_statement(feed_id, order_by, order_desc)
+        return self.session.execute(stmt.limit(limit).offset(offset)).all()
+
+    def list_rows_with_count(
+        self,
+        feed_id: Optional[int] = None,
+        limit: int = 100,
+        offset: int = 0,
+        order_by: str = "published_at",
+        order_desc: bool = True,
+    ) -> tuple[list[Row], int]:
+        """List a page of plain entry rows together with the total number of matches.
+
+        Same rows as list_rows() plus a ``total`` column from
+        ``count(*) OVER ()``, so no separate count() query is needed.
+
+        Args:
+            feed_id: Filter by feed ID
+            limit: Maximum number of results
+            offset: Number of results to skip
+            order_by: Field to order by
+            order_desc: Sort in descending order
+
+        Returns:
+            Tuple of (list of Row objects, total number of entries)
+        """
+        stmt = self._list_rows_statement(feed_id, order_by, order_desc).add_columns(
+            func.count().over().label("total")
         )
+        rows = self.session.execute(stmt.limit(limit).offset(offset)).all()
+        return rows, self._page_total(rows, offset, feed_id)
 
     def count(self, feed_id: Optional[int] = None) -> int:
         """Count entries.
@@ -213,16 +732,25 @@ class EntryRepository(
         """
         update_data = entry_data.model_dump(exclude_unset=True)
 
-        # Handle JSON fields using mixin
-        update_data = self._serialize_json_fields(update_data, self.get_json_fields())
-
         for field, value in update_data.items():
             setattr(entry, field, value)
 
         self.session.flush()
-        self.session.refresh(entry)
         return entry
 
+    def _bulk_delete(self, *criteria) -> int:
+        """Delete the entries matching criteria with a single DELETE statement.
+
+        Matching entries already loaded in the session are not looked for or
+        removed from it (synchronize_session=False); they go stale until the
+        session commits or expires them.
+
+        Returns:
+            Number of entries deleted
+        """
+        stmt = delete(EntryModel).where(*criteria)
+        return self.session.execute(stmt.execution_options(synchronize_session=False)).rowcount
+
     def delete_by_ids(self, entry_ids: list[int]) -> int:
         """Delete entries by IDs in bulk.
 
@@ -234,13 +762,7 @@ class EntryRepository(
         """
         if not entry_ids:
             return 0
-        count = (
-            self.session.query(EntryModel)
-            .filter(EntryModel.id.in_(entry_ids))
-            .delete(synchronize_session=False)
-        )
-        self.session.flush()
-        return count
+        return self._bulk_delete(EntryModel.id.in_(entry_ids))
 
     def delete_by_feed(self, feed_id: int) -> int:
         """Delete all entries for a feed.
@@ -251,9 +773,7 @@ class EntryRepository(
         Returns:
             Number of entries deleted
         """
-        count = self.session.query(EntryModel).filter(EntryModel.feed_id == feed_id).delete()
-        self.session.flush()
-        return count
+        return self._bulk_delete(EntryModel.feed_id == feed_id)
 
     def search(
         self,
@@ -264,6 +784,9 @@ class EntryRepository(
     ) -> list[EntryModel]:
         """Search entries by title or content.
 
+        Uses the entries_fts trigram index on SQLite and LIKE '%query%',
+        backed by pg_trgm indexes, on PostgreSQL.
+
         Args:
             query: Search query string
             feed_id: Optional feed ID filter
@@ -273,14 +796,91 @@ class EntryRepository(
         Returns:
             List of matching EntryModel instances
         """
-        q = self.session.query(EntryModel).filter(
-            (EntryModel.title.contains(query)) | (EntryModel.content.contains(query))
+        condition, params = self._build_search_filter(query)
+        stmt = select(EntryModel).where(condition)
+
+        if feed_id is not None:
+            stmt = stmt.where(EntryModel.feed_id == feed_id)
+
+        stmt = stmt.order_by(desc(EntryModel.published_at)).limit(limit).offset(offset)
+        return list(self.session.scalars(stmt, params))
+
+    def search_rows_with_count(
+        self,
+        query: str,
+        feed_id: Optional[int] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> tuple[list[Row], int]:
+        """Search entries as plain column rows, with the total number of matches.
+
+        Same matching and order as search(), but the rows are those of
+        list_rows() (entry columns plus ``feed_name``), so search results are
+        not hydrated into ORM instances and the feed name needs no lazy load
+        per entry.
+
+        Args:
+            query: Search query string
+            feed_id: Optional feed ID filter
+            limit: Maximum number of results
+            offset: Number of results to skip
+
+        Returns:
+            Tuple of (list of Row objects, total number of matches)
+        """
+        condition, params = self._build_search_filter(query)
+        stmt = (
+            self._list_rows_statement(feed_id, "published_at", True)
+            .where(condition)
+            .add_columns(func.count().over().label("total"))
         )
+        rows = self.session.execute(stmt.limit(limit).offset(offset), params).all()
+        if rows or not offset:
+            return rows, rows[0].total if rows else 0
 
+        # A page past the end has no row to carry the total
+        count = select(func.count()).select_from(EntryModel).where(condition)
         if feed_id is not None:
-            q = q.filter(EntryModel.feed_id == feed_id)
+            count = count.where(EntryModel.feed_id == feed_id)
+        return rows, self.session.scalar(count, params)
+
+    def list_by_tag(
+        self,
+        tag: str,
+        feed_id: Optional[int] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[EntryModel]:
+        """List entries carrying a tag, matched by the database.
+
+        On PostgreSQL the match is a JSONB containment (tags @> '["tag"]')
+        served by the GIN index on tags; SQLite looks through each entry's
+        array with json_each and MySQL with JSON_CONTAINS.
+
+        Args:
+            tag: Tag to match exactly
+            feed_id: Optional feed ID filter
+            limit: Maximum number of results
+            offset: Number of results to skip
+
+        Returns:
+            List of matching EntryModel instances, newest first
+        """
+        dialect = self.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            has_tag = type_coerce(EntryModel.tags, JSONB).contains([tag])
+        elif dialect == "mysql":
+            has_tag = func.json_contains(EntryModel.tags, func.json_array(tag)) == 1
+        else:
+            tags = func.json_each(EntryModel.tags).table_valued("value")
+            has_tag = select(tags.c.value).where(tags.c.value == tag).exists()
+
+        stmt = select(EntryModel).where(has_tag)
+        if feed_id is not None:
+            stmt = stmt.where(EntryModel.feed_id == feed_id)
 
-        return q.order_by(desc(EntryModel.published_at)).limit(limit).offset(offset).all()
+        stmt = stmt.order_by(desc(EntryModel.published_at), desc(EntryModel.id))
+        return list(self.session.scalars(stmt.limit(limit).offset(offset)))
 
     def get_recent(
         self, feed_id: Optional[int] = None, days: int = 7, limit: int = 100
@@ -317,32 +917,26 @@ class EntryRepository(
         Returns:
             Dictionary with statistics
         """
-        q = self.session.query(EntryModel)
+        # One pass over the entries: per-language counts and latest dates, with
+        # the NULL-language group included so the totals can be summed up
+        stmt = select(
+            EntryModel.language,
+            func.count(EntryModel.id),
+            func.max(EntryModel.published_at),
+        ).group_by(EntryModel.language)
 
         if feed_id is not None:
-            q = q.filter(EntryModel.feed_id == feed_id)
+            stmt = stmt.where(EntryModel.feed_id == feed_id)
 
-        total = q.count()
-
-        # Count by language
-        language_counts = (
-            self.session.query(EntryModel.language, func.count(EntryModel.id))
-            .filter(EntryModel.language.isnot(None))
-            .group_by(EntryModel.language)
-            .all()
-        )
-
-        # Get most recent entry date
-        most_recent = (
-            q.filter(EntryModel.published_at.isnot(None))
-            .order_by(desc(EntryModel.published_at))
-            .first()
-        )
+        rows = self.session.execute(stmt).all()
 
+        dates = [latest for _, _, latest in rows if latest is not None]
         return {
-            "total": total,
-            "language_counts": dict(language_counts) if language_counts else {},
-            "most_recent": most_recent.published_at if most_recent else None,
+            "total": sum(count for _, count, _ in rows),
+            "language_counts": {
+                language: count for language, count, _ in rows if language is not None
+            },
+            "most_recent": max(dates) if dates else None,
         }
 
     def cleanup_old_entries(self, days: int = 90, feed_id: Optional[int] = None) -> int:
@@ -357,14 +951,11 @@ class EntryRepository(
         """
         cutoff = datetime.utcnow() - timedelta(days=days)
 
-        q = self.session.query(EntryModel).filter(EntryModel.fetched_at < cutoff)
-
+        criteria = [EntryModel.fetched_at < cutoff]
         if feed_id is not None:
-            q = q.filter(EntryModel.feed_id == feed_id)
+            criteria.append(EntryModel.feed_id == feed_id)
 
-        count = q.delete()
-        self.session.flush()
-        return count
+        return self._bulk_delete(*criteria)
 
     def count_by_date(self, date: datetime) -> int:
         """Count entries fetched on or after a specific date.
@@ -5,7 +5,7 @@ Feed repository for database operations.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import asc, desc
+from sqlalchemy import asc, bindparam, desc, select
 from sqlalchemy.orm import Session
 
 from spider_aggregation.models import FeedModel, CategoryModel
@@ -14,6 +14,8 @@ from spider_aggregation.storage.repositories.base import BaseRepository
 from spider_aggregation.storage.repositories.mixins import CategoryQueryMixin
 from spider_aggregation.storage.mixins import CategoryRelationshipMixin
 
+_BY_URL = select(FeedModel).where(FeedModel.url == bindparam("url")).limit(1)
+
 
 class FeedRepository(
     BaseRepository[FeedModel, FeedCreate, FeedUpdate],
@@ -43,7 +45,7 @@ class FeedRepository(
         Returns:
             FeedModel instance or None
         """
-        return self.session.query(FeedModel).filter(FeedModel.url == url).first()
+        return self.session.scalars(_BY_URL, {"url": url}).first()
 
     def list(
         self,
@@ -130,7 +132,6 @@ class FeedRepository(
 
         feed.updated_at = datetime.utcnow()
         self.session.flush()
-        self.session.refresh(feed)
         return feed
 
     def get_feeds_to_fetch(self, max_feeds: int = 50) -> list[FeedModel]:
@@ -177,7 +178,6 @@ class FeedRepository(
             feed.last_error_at = datetime.utcnow()
 
         self.session.flush()
-        self.session.refresh(feed)
         return feed
 
     def enable_feed(self, feed: FeedModel) -> FeedModel:
@@ -196,7 +196,6 @@ class FeedRepository(
         feed.updated_at = datetime.utcnow()
 
         self.session.flush()
-        self.session.refresh(feed)
         return feed
 
     # Category relationship methods (from CategoryRelationshipMixin)
@@ -210,10 +209,8 @@ class FeedRepository(
         Returns:
             List of CategoryModel instances
         """
-        # Load categories if not already loaded
-        if not feed.categories:
-            self.session.refresh(feed)
-
+        # Loaded with the feed, or on first access after set_categories()
+        # expired them
         return feed.categories
 
     def set_categories(self, feed: FeedModel, category_ids: list[int]) -> FeedModel:
@@ -4,11 +4,11 @@ Filter rule repository for database operations.
 
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import asc, desc
+from sqlalchemy import asc, bindparam, desc, select
 from sqlalchemy.orm import Session
 
 if TYPE_CHECKING:
-    from sqlalchemy.orm import Query
+    from sqlalchemy import Select
 
 from spider_aggregation.models.filter_rule import (
     FilterRuleModel,
@@ -18,6 +18,8 @@ from spider_aggregation.models.filter_rule import (
 from spider_aggregation.storage.repositories.base import BaseRepository
 from spider_aggregation.storage.mixins import FilterQueryMixin
 
+_BY_NAME = select(FilterRuleModel).where(FilterRuleModel.name == bindparam("name")).limit(1)
+
 
 class FilterRuleRepository(
     BaseRepository[FilterRuleModel, FilterRuleCreate, FilterRuleUpdate],
@@ -28,6 +30,8 @@ class FilterRuleRepository(
     Inherits common CRUD operations from BaseRepository.
     """
 
+    complex_filter_keys = frozenset({"rule_type", "match_type"})
+
     def __init__(self, session: Session) -> None:
         """Initialize repository with a database session.
 
@@ -45,13 +49,9 @@ class FilterRuleRepository(
         Returns:
             FilterRuleModel instance or None
         """
-        return self.session.query(FilterRuleModel).filter(FilterRuleModel.name == name).first()
-
-    def _get_complex_filter_keys(self) -> set[str]:
-        """Return filter keys that require complex handling."""
-        return {"rule_type", "match_type"}
+        return self.session.scalars(_BY_NAME, {"name": name}).first()
 
-    def _apply_complex_filters(self, query, filters: dict) -> "Query[FilterRuleModel]":
+    def _apply_complex_filters(self, query, filters: dict) -> "Select[tuple[FilterRuleModel]]":
         """Apply rule_type and match_type filters."""
         if "rule_type" in filters and filters["rule_type"] is not None:
             query = query.filter(FilterRuleModel.rule_type == filters["rule_type"])
@@ -170,6 +170,5 @@ class FilterRuleRepository(
         if rule:
             rule.enabled = not rule.enabled
             self.session.flush()
-            self.session.refresh(rule)
             return rule
         return None
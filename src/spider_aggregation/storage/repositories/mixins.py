@@ -7,7 +7,7 @@ shared across multiple repositories.
 
 from typing import TypeVar, Generic, Optional, List
 
-from sqlalchemy import desc
+from sqlalchemy import desc, exists, func, select
 
 ModelType = TypeVar("ModelType")
 
@@ -38,18 +38,18 @@ class CategoryQueryMixin(Generic[ModelType]):
             enabled_only: Only return enabled records
 
         Returns:
-            SQLAlchemy query object
+            SQLAlchemy Select statement
         """
         from spider_aggregation.models import feed_categories
 
         query = (
-            self.session.query(self.model)
+            select(self.model)
             .join(feed_categories, self.model.id == feed_categories.c.feed_id)
-            .filter(feed_categories.c.category_id == category_id)
+            .where(feed_categories.c.category_id == category_id)
         )
 
         if enabled_only and hasattr(self.model, "enabled"):
-            query = query.filter(self.model.enabled == True)
+            query = query.where(self.model.enabled == True)
 
         return query
 
@@ -71,13 +71,13 @@ class CategoryQueryMixin(Generic[ModelType]):
         Returns:
             List of model instances
         """
-        return (
+        query = (
             self._query_by_category(category_id, enabled_only)
             .order_by(desc(self.model.created_at))
             .limit(limit)
             .offset(offset)
-            .all()
         )
+        return list(self.session.scalars(query))
 
     def get_by_category_name(
         self,
@@ -100,16 +100,17 @@ class CategoryQueryMixin(Generic[ModelType]):
         from spider_aggregation.models import CategoryModel, feed_categories
 
         query = (
-            self.session.query(self.model)
+            select(self.model)
             .join(feed_categories, self.model.id == feed_categories.c.feed_id)
             .join(CategoryModel)
-            .filter(CategoryModel.name == category_name)
+            .where(CategoryModel.name == category_name)
         )
 
         if enabled_only and hasattr(self.model, "enabled"):
-            query = query.filter(self.model.enabled == True)
+            query = query.where(self.model.enabled == True)
 
-        return query.order_by(desc(self.model.created_at)).limit(limit).offset(offset).all()
+        query = query.order_by(desc(self.model.created_at)).limit(limit).offset(offset)
+        return list(self.session.scalars(query))
 
     def get_by_categories(
         self,
@@ -134,16 +135,20 @@ class CategoryQueryMixin(Generic[ModelType]):
         if not category_ids:
             return []
 
-        query = (
-            self.session.query(self.model)
-            .join(feed_categories, self.model.id == feed_categories.c.feed_id)
-            .filter(feed_categories.c.category_id.in_(category_ids))
+        # EXISTS rather than a join, so a record in several of the categories
+        # is returned once and LIMIT counts distinct records
+        query = select(self.model).where(
+            exists().where(
+                feed_categories.c.feed_id == self.model.id,
+                feed_categories.c.category_id.in_(category_ids),
+            )
         )
 
         if enabled_only and hasattr(self.model, "enabled"):
-            query = query.filter(self.model.enabled == True)
+            query = query.where(self.model.enabled == True)
 
-        return query.order_by(desc(self.model.created_at)).limit(limit).offset(offset).all()
+        query = query.order_by(desc(self.model.created_at)).limit(limit).offset(offset)
+        return list(self.session.scalars(query))
 
     def count_by_category(self, category_id: int, enabled_only: bool = False) -> int:
         """Count records by category ID.
@@ -155,4 +160,16 @@ class CategoryQueryMixin(Generic[ModelType]):
         Returns:
             Number of records in the category
         """
-        return self._query_by_category(category_id, enabled_only).count()
+        from spider_aggregation.models import feed_categories
+
+        if enabled_only and hasattr(self.model, "enabled"):
+            query = self._query_by_category(category_id, enabled_only)
+            return self.session.scalar(query.with_only_columns(func.count(self.model.id)))
+
+        # Each link row is one record; no join needed
+        query = (
+            select(func.count())
+            .select_from(feed_categories)
+            .where(feed_categories.c.category_id == category_id)
+        )
+        return self.session.scalar(query)
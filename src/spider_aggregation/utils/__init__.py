@@ -2,6 +2,7 @@
 
 from spider_aggregation.utils.hash_utils import (
     compute_content_hash,
+    compute_digest,
     compute_link_hash,
     compute_md5_hash,
     compute_sha256_hash,
@@ -10,6 +11,7 @@ from spider_aggregation.utils.hash_utils import (
 )
 
 __all__ = [
+    "compute_digest",
     "compute_md5_hash",
     "compute_sha256_hash",
     "compute_link_hash",
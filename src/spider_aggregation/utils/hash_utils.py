@@ -7,6 +7,49 @@ Provides consistent hashing for links, titles, and content to detect duplicates.
 import hashlib
 from typing import Optional
 
+# Try to import blake3 (optional fast hash backend)
+try:
+    import blake3
+
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Size in bytes of the dedup digests stored in the entries table
+DIGEST_SIZE = 16
+
+HASH_METHODS = ("md5", "sha256", "blake2b", "blake3")
+
+
+def compute_digest(data: str, method: str = "md5") -> str:
+    """Compute a 16-byte dedup digest of already normalized data.
+
+    Args:
+        data: Normalized data to hash
+        method: Hash method (md5, sha256, blake2b or blake3)
+
+    Returns:
+        Digest as a 32-character hexadecimal string
+
+    Raises:
+        ValueError: If the method is unknown
+        ImportError: If blake3 is requested but not installed
+    """
+    raw = data.encode("utf-8")
+
+    if method == "md5":
+        return hashlib.md5(raw).hexdigest()
+    if method == "sha256":
+        return hashlib.sha256(raw).hexdigest()[: DIGEST_SIZE * 2]
+    if method == "blake2b":
+        return hashlib.blake2b(raw, digest_size=DIGEST_SIZE).hexdigest()
+    if method == "blake3":
+        if not BLAKE3_AVAILABLE:
+            raise ImportError("blake3 is required for the blake3 hash method")
+        return blake3.blake3(raw).hexdigest(length=DIGEST_SIZE)
+
+    raise ValueError(f"Unknown hash method: {method!r}. Must be one of {list(HASH_METHODS)}")
+
 
 def compute_md5_hash(content: Optional[str]) -> Optional[str]:
     """Compute MD5 hash of content.
@@ -48,7 +91,7 @@ def compute_sha256_hash(content: Optional[str]) -> Optional[str]:
     return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
 
 
-def compute_link_hash(link: Optional[str]) -> Optional[str]:
+def compute_link_hash(link: Optional[str], method: str = "md5") -> Optional[str]:
     """Compute hash for link deduplication.
 
     Normalizes URL before hashing to handle common variations:
@@ -58,6 +101,7 @@ def compute_link_hash(link: Optional[str]) -> Optional[str]:
 
     Args:
         link: URL to hash
+        method: Hash method (see compute_digest)
 
     Returns:
         Hash as hexadecimal string, or None if link is invalid
@@ -87,10 +131,12 @@ def compute_link_hash(link: Optional[str]) -> Optional[str]:
     if not normalized or not normalized.startswith(("http://", "https://")):
         return None
 
-    return compute_md5_hash(normalized)
+    # Dropping the slash or query can expose trailing whitespace; strip it as
+    # the hashes stored before compute_digest() did
+    return compute_digest(normalized.rstrip(), method)
 
 
-def compute_title_hash(title: Optional[str]) -> Optional[str]:
+def compute_title_hash(title: Optional[str], method: str = "md5") -> Optional[str]:
     """Compute hash for title deduplication.
 
     Normalizes title before hashing:
@@ -100,6 +146,7 @@ def compute_title_hash(title: Optional[str]) -> Optional[str]:
 
     Args:
         title: Title to hash
+        method: Hash method (see compute_digest)
 
     Returns:
         Hash as hexadecimal string, or None if title is empty
@@ -113,10 +160,10 @@ def compute_title_hash(title: Optional[str]) -> Optional[str]:
     if not normalized:
         return None
 
-    return compute_md5_hash(normalized)
+    return compute_digest(normalized, method)
 
 
-def compute_content_hash(content: Optional[str]) -> Optional[str]:
+def compute_content_hash(content: Optional[str], method: str = "sha256") -> Optional[str]:
     """Compute hash for content deduplication.
 
     For content, we use a fingerprinting approach:
@@ -126,6 +173,7 @@ def compute_content_hash(content: Optional[str]) -> Optional[str]:
 
     Args:
         content: Content to hash
+        method: Hash method (see compute_digest)
 
     Returns:
         Hash as hexadecimal string, or None if content is empty
@@ -140,13 +188,14 @@ def compute_content_hash(content: Optional[str]) -> Optional[str]:
     normalized = " ".join(normalized.split())
 
     # For content, we use a fingerprint of first 500 chars
-    # This helps detect near-duplicates with minor changes
-    fingerprint = normalized[:500]
+    # This helps detect near-duplicates with minor changes; the cut can end
+    # on a space, which the stored hashes never included
+    fingerprint = normalized[:500].rstrip()
 
     if not fingerprint:
         return None
 
-    return compute_sha256_hash(fingerprint)
+    return compute_digest(fingerprint, method)
 
 
 def compute_similarity_hash(content: Optional[str], length: int = 200) -> Optional[str]:
@@ -0,0 +1,29 @@
+"""
+JSON encoding helpers.
+
+Uses orjson when it is installed and the stdlib json module otherwise, so
+storage and the web layer share one encoder choice.
+"""
+
+import json
+from typing import Any
+
+# Try to import orjson (optional C JSON encoder)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+if ORJSON_AVAILABLE:
+
+    def dumps(value: Any) -> str:
+        """Encode a value as a JSON string with orjson."""
+        return orjson.dumps(value).decode()
+
+    loads = orjson.loads
+else:
+    dumps = json.dumps
+    loads = json.loads
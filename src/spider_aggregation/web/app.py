@@ -2,7 +2,6 @@
 Flask application for mind-weaver web UI.
 """
 
-import json
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional, Any
@@ -15,6 +14,7 @@ from spider_aggregation.config import get_config
 from spider_aggregation.logger import get_logger
 from spider_aggregation.storage.database import DatabaseManager
 from spider_aggregation.web.serializers import (
+    OrjsonProvider,
     api_response,
     feed_to_dict,
     entry_to_dict,
@@ -47,6 +47,7 @@ def create_app(
         template_folder="templates",
         static_folder="static",
     )
+    app.json = OrjsonProvider(app)
 
     config = get_config()
     app.config["SECRET_KEY"] = config.web.secret_key
@@ -183,29 +184,22 @@ def create_app(
                 )
                 total = len(entries)  # Approximate
             else:
-                entries = entry_repo.list(
+                entries, total = entry_repo.list_with_count(
                     feed_id=feed_id,
                     limit=page_size,
                     offset=(page - 1) * page_size,
                     order_by="published_at",
                     order_desc=True,
                 )
-                total = entry_repo.count(feed_id=feed_id)
 
             # Get feeds for filter dropdown
             feeds = feed_repo.list(limit=1000)
             # Convert to dicts to avoid DetachedInstanceError
             feeds_data = [feed_to_dict(f) for f in feeds]
 
-            # Parse tags for display and expunge entries from session
+            # Prepare tags for display and expunge entries from session
             for entry in entries:
-                if entry.tags:
-                    try:
-                        entry.tags_list = json.loads(entry.tags)
-                    except json.JSONDecodeError, TypeError:
-                        entry.tags_list = []
-                else:
-                    entry.tags_list = []
+                entry.tags_list = entry.tags or []
                 # Expunge from session so data is preserved after session closes
                 session.expunge(entry)
 
@@ -291,14 +285,7 @@ def create_app(
             if not entry:
                 return "Entry not found", 404
 
-            # Parse tags
-            if entry.tags:
-                try:
-                    entry.tags_list = json.loads(entry.tags)
-                except json.JSONDecodeError, TypeError:
-                    entry.tags_list = []
-            else:
-                entry.tags_list = []
+            entry.tags_list = entry.tags or []
 
             # Expunge from session so it can be accessed after session closes
             session.expunge(entry)
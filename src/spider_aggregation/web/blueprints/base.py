@@ -320,7 +320,6 @@ class CRUDBlueprint(ABC):
             # Toggle enabled status
             item.enabled = not item.enabled
             session.flush()
-            session.refresh(item)
 
             return api_response(
                 success=True,
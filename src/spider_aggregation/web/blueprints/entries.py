@@ -221,33 +221,29 @@ class EntryBlueprint(CRUDBlueprint):
         with db_manager.session() as session:
             repo = self._get_repository(session)
 
-            # Handle search
+            # Read-only, so load plain rows (with feed_name joined in)
+            # instead of ORM instances
             if search_query:
-                entries = repo.search(
+                rows, total = repo.search_rows_with_count(
                     search_query,
                     feed_id=feed_id,
                     limit=page_size,
                     offset=(page - 1) * page_size,
                 )
-                total = len(entries)  # Approximate for search
             else:
-                # Normal list with pagination
-                entries = repo.list(
+                rows, total = repo.list_rows_with_count(
                     feed_id=feed_id,
                     limit=page_size,
                     offset=(page - 1) * page_size,
                     order_by=order_by,
                     order_desc=(order_direction == "desc"),
                 )
-                total = repo.count(feed_id=feed_id)
 
-            # Serialize entries with additional fields
             data = []
-            for entry in entries:
-                entry_dict = self.serialize(entry)
-                # Add feed_name for display
-                if entry.feed:
-                    entry_dict["feed_name"] = entry.feed.name
+            for row in rows:
+                entry_dict = self.serialize(row)
+                if row.feed_name is not None:
+                    entry_dict["feed_name"] = row.feed_name
                 data.append(entry_dict)
 
         # Return response with total count for pagination
@@ -152,14 +152,18 @@ class FeedBlueprint(CRUDBlueprint):
                     success=False, error=fetch_result.error or "获取订阅源失败", status=500
                 )
 
-            # Parse entries
-            entries_created = 0
-            for entry_data in fetch_result.entries:
-                parsed = parser.parse_entry(entry_data, feed_id=feed.id)
-
-                # Check for duplicates
-                duplicate = deduplicator.check_duplicate(parsed, entry_repo, feed_id=feed.id)
+            # Parse entries and check the whole batch for duplicates at once;
+            # existing links are skipped by bulk_create's ON CONFLICT DO NOTHING
+            parsed_entries = [
+                parser.parse_entry(entry_data, feed_id=feed.id)
+                for entry_data in fetch_result.entries
+            ]
+            duplicates = deduplicator.check_duplicates(
+                parsed_entries, feed_id=feed.id, check_links=False
+            )
 
+            new_entries = []
+            for parsed, duplicate in zip(parsed_entries, duplicates):
                 if duplicate.is_duplicate:
                     continue
 
@@ -168,12 +172,12 @@ class FeedBlueprint(CRUDBlueprint):
                 if not filter_result.allowed:
                     continue
 
-                # Create entry
                 from spider_aggregation.models import EntryCreate
 
-                entry_create = EntryCreate(**parsed)
-                entry_repo.create(entry_create)
-                entries_created += 1
+                new_entries.append(EntryCreate.from_trusted(**parsed))
+
+            # Create entries in one batch
+            entries_created = entry_repo.bulk_create(new_entries)
 
             # Update fetch info
             from datetime import datetime
@@ -244,8 +248,6 @@ class FeedBlueprint(CRUDBlueprint):
                 return api_response(success=False, error="未找到订阅源", status=404)
 
             repo.set_categories(feed, category_ids)
-            # Refresh to get updated categories
-            session.refresh(feed)
 
             from spider_aggregation.web.serializers import category_to_dict
 
@@ -201,16 +201,18 @@ class SchedulerBlueprint:
                         )
                         continue
 
-                    # Parse and store entries
-                    entries_created = 0
-                    for entry_data in fetch_result.entries:
-                        parsed = parser.parse_entry(entry_data, feed_id=feed.id)
-
-                        # Check for duplicates
-                        duplicate = deduplicator.check_duplicate(
-                            parsed, entry_repo, feed_id=feed.id
-                        )
+                    # Parse entries and check the whole batch for duplicates at once;
+                    # existing links are skipped by bulk_create's ON CONFLICT DO NOTHING
+                    parsed_entries = [
+                        parser.parse_entry(entry_data, feed_id=feed.id)
+                        for entry_data in fetch_result.entries
+                    ]
+                    duplicates = deduplicator.check_duplicates(
+                        parsed_entries, feed_id=feed.id, check_links=False
+                    )
 
+                    new_entries = []
+                    for parsed, duplicate in zip(parsed_entries, duplicates):
                         if duplicate.is_duplicate:
                             continue
 
@@ -219,12 +221,12 @@ class SchedulerBlueprint:
                         if not filter_result.allowed:
                             continue
 
-                        # Create entry
                         from spider_aggregation.models import EntryCreate
 
-                        entry_create = EntryCreate(**parsed)
-                        entry_repo.create(entry_create)
-                        entries_created += 1
+                        new_entries.append(EntryCreate.from_trusted(**parsed))
+
+                    # Create entries in one batch
+                    entries_created = entry_repo.bulk_create(new_entries)
 
                     # Update fetch info
                     from datetime import datetime
@@ -301,7 +303,7 @@ class SchedulerBlueprint:
         """
         from spider_aggregation.storage.database import DatabaseManager
         from spider_aggregation.models import DigestLogModel
-        from sqlalchemy import desc
+        from sqlalchemy import desc, func, select
 
         page = request.args.get("page", 1, type=int)
         page_size = request.args.get("page_size", 20, type=int)
@@ -310,7 +312,7 @@ class SchedulerBlueprint:
 
         with db_manager.session() as session:
             query = session.query(DigestLogModel).order_by(desc(DigestLogModel.sent_at))
-            total = query.count()
+            total = session.scalar(select(func.count()).select_from(DigestLogModel))
             logs = query.offset((page - 1) * page_size).limit(page_size).all()
 
             data = []
@@ -236,7 +236,7 @@ class SystemBlueprint:
 
         with db_manager.session() as session:
             entry_repo = EntryRepository(session)
-            entries = entry_repo.list(
+            entries = entry_repo.iter_all(
                 feed_id=feed_id,
                 limit=limit,
                 order_by="published_at",
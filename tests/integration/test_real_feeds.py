@@ -118,7 +118,6 @@ class TestRealRSSFeedIntegration:
                 content_hash=hashes["content_hash"],
                 tags=parsed.get("tags"),
                 language=parsed.get("language"),
-                reading_time_seconds=parsed.get("reading_time_seconds"),
             )
 
             entry = entry_repo.create(entry_data)
@@ -593,3 +593,22 @@ class TestEntryCategoryAPI:
         assert data["data"]["total"] == 3
         assert data["data"]["language_counts"]["en"] == 2
         assert data["data"]["language_counts"]["zh"] == 1
+
+
+class TestJSONProvider:
+    """Test the application JSON provider."""
+
+    def test_app_uses_orjson_provider(self, client):
+        """Test responses are encoded by OrjsonProvider (or its fallback)."""
+        from spider_aggregation.web.serializers import OrjsonProvider
+
+        app = client.application
+        assert isinstance(app.json, OrjsonProvider)
+
+        with app.app_context():
+            assert json.loads(app.json.dumps({"b": 1, "a": "技术"})) == {"a": "技术", "b": 1}
+            response = app.json.response(success=True, data=[1, 2])
+
+        assert response.mimetype == "application/json"
+        assert json.loads(response.get_data()) == {"success": True, "data": [1, 2]}
+        assert app.json.loads('{"tags": ["技术"]}') == {"tags": ["技术"]}
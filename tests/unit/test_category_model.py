@@ -6,9 +6,11 @@ import pytest
 from datetime import datetime
 
 from spider_aggregation.models import CategoryModel, CategoryCreate, CategoryUpdate, FeedModel, FeedCreate
+from spider_aggregation.models.category import CategoryResponse
 from spider_aggregation.storage.database import DatabaseManager
 from spider_aggregation.models.feed import Base, feed_categories
 from sqlalchemy.exc import IntegrityError
+from pydantic import ValidationError
 
 
 class TestCategoryModel:
@@ -100,6 +102,20 @@ class TestCategoryPydanticModels:
         assert schema.description is None
         assert schema.icon is None
 
+    def test_category_response_from_model(self):
+        """Test CategoryResponse is built from the ORM model and is immutable."""
+        now = datetime.utcnow()
+        category = CategoryModel(
+            id=1, name="测试", enabled=True, created_at=now, updated_at=now
+        )
+
+        response = CategoryResponse.model_validate(category)
+
+        assert response.id == 1
+        assert response.name == "测试"
+        with pytest.raises(ValidationError):
+            response.name = "新名称"
+
 
 class TestCategoryDatabaseOperations:
     """Test Category database operations using CategoryRepository."""
@@ -249,6 +265,53 @@ class TestCategoryDatabaseOperations:
         assert len(cat_feeds) == 1
         assert cat_feeds[0].id == feed.id
 
+    def test_get_feeds_by_category_keyset_pagination(self, db_session):
+        """Test paging through a category's feeds with a keyset cursor."""
+        from spider_aggregation.storage.repositories.category_repo import CategoryRepository
+        from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+
+        cat_repo = CategoryRepository(db_session)
+        feed_repo = FeedRepository(db_session)
+
+        cat = cat_repo.create(name="测试")
+        for i in range(5):
+            feed = feed_repo.create(FeedCreate(url=f"https://example.com/feed{i}"))
+            cat_repo.add_feed_to_category(feed, cat)
+
+        seen = []
+        page = cat_repo.get_feeds_by_category(cat.id, limit=2)
+        # Bounded, so a cursor that repeats rows fails instead of hanging
+        for _ in range(5):
+            if not page:
+                break
+            seen.extend(f.id for f in page)
+            last = page[-1]
+            page = cat_repo.get_feeds_by_category(
+                cat.id, limit=2, after_created_at=last.created_at, after_id=last.id
+            )
+
+        assert page == []
+        assert seen == [f.id for f in cat_repo.get_feeds_by_category(cat.id)]
+        assert len(seen) == 5
+
+    def test_set_categories_for_feed(self, db_session):
+        """Test replacing a feed's categories through the category repository."""
+        from spider_aggregation.storage.repositories.category_repo import CategoryRepository
+        from spider_aggregation.storage.repositories.feed_repo import FeedRepository
+
+        cat_repo = CategoryRepository(db_session)
+        feed_repo = FeedRepository(db_session)
+
+        cat1 = cat_repo.create(name="技术")
+        cat2 = cat_repo.create(name="新闻")
+        feed = feed_repo.create(FeedCreate(url="https://example.com/feed"))
+        cat_repo.add_feed_to_category(feed, cat1)
+
+        updated = cat_repo.set_categories_for_feed(feed, [cat2.id])
+
+        assert [c.id for c in updated.categories] == [cat2.id]
+        assert feed not in cat1.feeds
+
     def test_remove_feed_from_category(self, db_session):
         """Test removing a feed from a category."""
         from spider_aggregation.storage.repositories.category_repo import CategoryRepository
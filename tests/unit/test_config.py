@@ -108,7 +108,7 @@ class TestDeduplicatorConfig:
         """Test default deduplicator configuration."""
         config = DeduplicatorConfig()
         assert config.enabled is True
-        assert config.link_hash_method == "sha256"
+        assert config.link_hash_method == "md5"
         assert config.title_similarity_threshold == 0.85
 
     def test_validation(self):
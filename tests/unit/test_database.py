@@ -1,15 +1,23 @@
 """Integration tests for database layer."""
 
+from datetime import datetime
+
 import pytest
-from sqlalchemy import text
+from sqlalchemy import select, text
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import Session
 
 from spider_aggregation.models import FeedModel, EntryModel
 from spider_aggregation.models.feed import FeedCreate, FeedUpdate
-from spider_aggregation.models.entry import EntryCreate
+from spider_aggregation.models.entry import EntryCreate, EntryListResponse
 from spider_aggregation.storage.repositories.feed_repo import FeedRepository
-from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+from spider_aggregation.storage.repositories.entry_repo import (
+    _COPY_COLUMNS,
+    EntryRepository,
+    _copy_row,
+)
 from spider_aggregation.storage.database import DatabaseManager, init_db
+from spider_aggregation.utils.hash_utils import compute_title_hash
 
 
 @pytest.fixture
@@ -49,6 +57,40 @@ class TestFeedRepository:
         assert feed.enabled is True
         assert feed.fetch_error_count == 0
 
+    def test_create_feed_without_refresh(self, db_session: Session):
+        """Test create returns server defaults without re-selecting the row."""
+        from sqlalchemy import event
+
+        repo = FeedRepository(db_session)
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            feed = repo.create(FeedCreate(url="https://example.com/feed.xml", name="Test Feed"))
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        # BEGIN is emitted through the cursor too; only a re-select matters
+        assert not [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        assert any(s.lstrip().upper().startswith("INSERT") for s in statements)
+        assert feed.created_at is not None
+        assert feed.updated_at is not None
+
+    def test_server_default_timestamp_matches_bound_value(self, db_session: Session):
+        """Test a server-generated created_at compares equal to itself as a parameter."""
+        repo = FeedRepository(db_session)
+        feed = repo.create(FeedCreate(url="https://example.com/feed.xml", name="Test Feed"))
+
+        ids = db_session.scalars(
+            select(FeedModel.id).where(FeedModel.created_at == feed.created_at)
+        ).all()
+
+        assert ids == [feed.id]
+
     def test_get_by_id(self, db_session: Session):
         """Test getting a feed by ID."""
         repo = FeedRepository(db_session)
@@ -188,6 +230,185 @@ class TestEntryRepository:
         assert entry.link == "https://example.com/entry"
         assert entry.feed_id == feed.id
 
+    def test_entry_create_rejects_non_hex_hash(self, feed: FeedModel):
+        """Test hashes that cannot be stored as bytes fail validation."""
+        from pydantic import ValidationError
+
+        for bad in ("xyz123", "abc", "ABC123", "a" * 34):
+            with pytest.raises(ValidationError):
+                EntryCreate(
+                    feed_id=feed.id,
+                    title="Test Entry",
+                    link="https://example.com/entry",
+                    title_hash=bad,
+                    link_hash="def456",
+                )
+
+    def test_create_entry_with_invalid_trusted_hash(self, db_session: Session, feed: FeedModel):
+        """Test an unvalidated non-hex hash fails at flush with a clear message."""
+        from sqlalchemy.exc import StatementError
+
+        repo = EntryRepository(db_session)
+        entry_data = EntryCreate.from_trusted(
+            feed_id=feed.id,
+            title="Test Entry",
+            link="https://example.com/entry",
+            title_hash="xyz123",
+            link_hash="def456",
+        )
+
+        with pytest.raises(StatementError, match="Invalid hex digest: 'xyz123'"):
+            repo.create(entry_data)
+        db_session.rollback()
+
+    def test_create_entry_from_trusted(self, db_session: Session, feed: FeedModel):
+        """Test creating an entry from trusted parser output."""
+        repo = EntryRepository(db_session)
+        entry_data = EntryCreate.from_trusted(
+            feed_id=feed.id,
+            title="Test Entry",
+            link="https://example.com/entry",
+            title_hash="abc123",
+            link_hash="def456",
+            tags=["python"],
+            updated_at=None,  # Extra parser keys are ignored
+        )
+
+        entry = repo.create(entry_data)
+
+        assert entry.id is not None
+        assert entry.title == "Test Entry"
+        assert entry.enabled is True
+        assert entry.tags == ["python"]
+
+    def test_create_many(self, db_session: Session, feed: FeedModel):
+        """Test creating several entries in one statement."""
+        repo = EntryRepository(db_session)
+
+        entries = repo.create_many(
+            [
+                EntryCreate(
+                    feed_id=feed.id,
+                    title=f"Entry {i}",
+                    link=f"https://example.com/entry{i}",
+                    title_hash=f"a{i}",
+                    link_hash=f"b{i}",
+                    tags=["python"],
+                )
+                for i in range(3)
+            ]
+        )
+
+        assert [e.title for e in entries] == ["Entry 0", "Entry 1", "Entry 2"]
+        assert all(e.id is not None and e.fetched_at is not None for e in entries)
+        assert entries[0].tags == ["python"]
+        assert repo.count() == 3
+        assert repo.create_many([]) == []
+
+    def test_bulk_insert_batch_is_one_statement(self, db_session: Session, feed: FeedModel):
+        """Test a batch larger than SQLAlchemy's default page size is one INSERT."""
+        from sqlalchemy import event
+
+        repo = EntryRepository(db_session, batch_size=1500)
+        inserts = []
+
+        def count_inserts(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO entries"):
+                inserts.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", count_inserts)
+        try:
+            created = repo.bulk_create(
+                [
+                    EntryCreate.from_trusted(
+                        feed_id=feed.id,
+                        title=f"Entry {i}",
+                        link=f"https://example.com/entry{i}",
+                        title_hash=f"{i:032x}",
+                        link_hash=f"{i:032x}",
+                    )
+                    for i in range(1200)
+                ]
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", count_inserts)
+
+        assert created == 1200
+        assert len(inserts) == 1
+
+    def test_bulk_inserts_in_batches(self, db_session: Session, feed: FeedModel):
+        """Test bulk inserts larger than the batch size."""
+        repo = EntryRepository(db_session, batch_size=2)
+
+        def entry(i: int) -> EntryCreate:
+            return EntryCreate(
+                feed_id=feed.id,
+                title=f"Entry {i}",
+                link=f"https://example.com/entry{i}",
+                title_hash=f"a{i}",
+                link_hash=f"b{i}",
+            )
+
+        created = repo.create_many([entry(i) for i in range(5)])
+        assert [e.title for e in created] == [f"Entry {i}" for i in range(5)]
+
+        assert repo.bulk_create([entry(i) for i in range(3, 8)]) == 3
+        assert repo.count() == 8
+
+    def test_bulk_create_skips_duplicate_links(self, db_session: Session, feed: FeedModel):
+        """Test bulk insert ignores entries whose link hash already exists."""
+        repo = EntryRepository(db_session)
+        repo.create(
+            EntryCreate(
+                feed_id=feed.id,
+                title="Existing",
+                link="https://example.com/existing",
+                title_hash="a0",
+                link_hash="b0",
+            )
+        )
+
+        created = repo.bulk_create(
+            [
+                EntryCreate.from_trusted(
+                    feed_id=feed.id,
+                    title=f"Entry {i}",
+                    link=f"https://example.com/entry{i}",
+                    title_hash=f"a{i}",
+                    link_hash=f"b{i}",
+                    tags=["python"],
+                )
+                for i in range(3)
+            ]
+        )
+
+        assert created == 2
+        assert repo.count() == 3
+        entry = repo.get_by_link_hash("b1")
+        assert entry.fetched_at is not None
+        assert entry.tags == ["python"]
+
+    def test_copy_row(self):
+        """Test entries are converted to PostgreSQL's text form for COPY."""
+        row = EntryCreate(
+            feed_id=1,
+            title="Entry",
+            link="https://example.com/entry",
+            published_at=datetime(2024, 1, 2, 3, 4, 5),
+            tags=["python"],
+            title_hash="a0",
+            link_hash="b0",
+        ).model_dump()
+
+        values = dict(zip(_COPY_COLUMNS, _copy_row(row)))
+
+        assert values["title"] == "Entry"
+        assert values["published_at"] == "2024-01-02T03:04:05"
+        assert values["tags"] == '["python"]'
+        assert values["title_hash"] == "\\xa0"
+        assert values["content_hash"] is None
+
     def test_get_by_id(self, db_session: Session, feed: FeedModel):
         """Test getting an entry by ID."""
         repo = EntryRepository(db_session)
@@ -222,6 +443,65 @@ class TestEntryRepository:
         assert found is not None
         assert found.link == "https://example.com/entry"
 
+    def test_get_by_hash_restricted_to_feeds(self, db_session: Session, feed: FeedModel):
+        """Test hash lookups restricted to one feed or a list of feeds."""
+        repo = EntryRepository(db_session)
+        repo.create(
+            EntryCreate(
+                feed_id=feed.id,
+                title="Test Entry",
+                link="https://example.com/entry",
+                title_hash="abc123",
+                link_hash="def456",
+                content_hash="0123",
+            )
+        )
+        other_feed = feed.id + 1
+
+        assert repo.get_by_link_hash("def456", feed_id=feed.id) is not None
+        assert repo.get_by_link_hash("def456", feed_id=other_feed) is None
+        assert repo.get_by_link_hash_any_feed("def456", [other_feed, feed.id]) is not None
+        assert repo.get_by_link_hash_any_feed("def456", [other_feed]) is None
+        assert repo.get_by_link_hash_any_feed("def456", []) is not None
+        assert repo.get_by_title_hash_any_feed("abc123", [feed.id]) is not None
+        assert repo.get_by_content_hash("0123", feed_id=other_feed) is None
+        assert repo.get_by_title_and_content("abc123", "0123", feed_id=feed.id) is not None
+        assert repo.get_by_title_and_content("abc123", "4567") is None
+
+    def test_get_many_by_hash(self, db_session: Session, feed: FeedModel):
+        """Test looking up many hashes with one query per batch."""
+        repo = EntryRepository(db_session, batch_size=2)
+        for i in range(3):
+            repo.create(
+                EntryCreate(
+                    feed_id=feed.id,
+                    title=f"Entry {i}",
+                    link=f"https://example.com/entry{i}",
+                    title_hash=f"a0{i:02x}",
+                    link_hash=f"b0{i:02x}",
+                    content_hash=f"c0{i:02x}",
+                )
+            )
+
+        found = repo.get_many_by_link_hash(["b000", "b002", "b002", "ffff"])
+        assert {h: e.title for h, e in found.items()} == {"b000": "Entry 0", "b002": "Entry 2"}
+
+        assert set(repo.get_many_by_title_hash(["a001", "a002"], feed_id=feed.id)) == {
+            "a001",
+            "a002",
+        }
+        assert repo.get_many_by_content_hash(["c000"], feed_id=feed.id + 1) == {}
+        assert repo.get_many_by_link_hash([]) == {}
+
+        assert repo.get_by_hash("content", "c001", feed_ids=[feed.id]).title == "Entry 1"
+        assert set(repo.get_many_by_hash("link", ["b001", "b009"])) == {"b001"}
+        with pytest.raises(ValueError):
+            repo.get_by_hash("summary", "c001")
+
+        assert repo.exists_link_hashes(["b000", "b002", "b002", "ffff"]) == {"b000", "b002"}
+        assert repo.existing_hashes("title", ["a001"], feed_id=feed.id) == {"a001"}
+        assert repo.existing_hashes("content", ["c000"], feed_id=feed.id + 1) == set()
+
     def test_list_entries(self, db_session: Session, feed: FeedModel):
         """Test listing entries."""
         repo = EntryRepository(db_session)
@@ -233,8 +513,8 @@ class TestEntryRepository:
                     feed_id=feed.id,
                     title=f"Entry {i}",
                     link=f"https://example.com/entry{i}",
-                    title_hash=f"hash{i}",
-                    link_hash=f"link_hash{i}",
+                    title_hash=f"a0{i:02x}",
+                    link_hash=f"b0{i:02x}",
                 )
             )
 
@@ -250,6 +530,123 @@ class TestEntryRepository:
         entries = repo.list(limit=3)
         assert len(entries) == 3
 
+        # Keyset pagination from the last entry of the first page
+        entries = repo.list(limit=3, order_by="fetched_at")
+        last = entries[-1]
+        rest = repo.list(order_by="fetched_at", after_value=last.fetched_at, after_id=last.id)
+        assert [e.id for e in entries + rest] == [e.id for e in repo.list(order_by="fetched_at")]
+
+        # Names that are not columns (e.g. the feed relationship) sort by published_at
+        assert [e.id for e in repo.list(order_by="feed")] == [e.id for e in repo.list()]
+
+    def test_reading_time_computed_from_content(self, db_session: Session, feed: FeedModel):
+        """Test reading_time_seconds is generated by the database from content."""
+        from spider_aggregation.models.entry import EntryUpdate
+
+        repo = EntryRepository(db_session)
+        entry = repo.create(
+            EntryCreate(
+                feed_id=feed.id,
+                title="Long Entry",
+                link="https://example.com/long",
+                title_hash="a1",
+                link_hash="b1",
+                content="x" * 1200,
+            )
+        )
+        assert entry.reading_time_seconds == 60
+
+        repo.update(entry, EntryUpdate(content="short"))
+        assert entry.reading_time_seconds == 10
+
+        repo.update(entry, EntryUpdate(content=None))
+        assert entry.reading_time_seconds is None
+
+    def test_list_rows(self, db_session: Session, feed: FeedModel):
+        """Test listing entries as column rows."""
+        repo = EntryRepository(db_session)
+
+        for i in range(3):
+            repo.create(
+                EntryCreate(
+                    feed_id=feed.id,
+                    title=f"Entry {i}",
+                    link=f"https://example.com/entry{i}",
+                    title_hash=f"a0{i:02x}",
+                    link_hash=f"b0{i:02x}",
+                    tags=["python"],
+                )
+            )
+
+        rows = repo.list_rows(feed_id=feed.id, order_by="id", order_desc=False)
+        assert [row.title for row in rows] == ["Entry 0", "Entry 1", "Entry 2"]
+        assert rows[0].feed_name == feed.name
+        assert rows[0].link_hash == "b000"
+        assert rows[0].tags == ["python"]
+
+        response = EntryListResponse.from_rows(rows[:2], total=3, page=1, page_size=2)
+        assert response.total == 3
+        assert [entry.title for entry in response.entries] == ["Entry 0", "Entry 1"]
+        assert response.entries[1].title_hash == "a001"
+
+    def test_list_with_count(self, db_session: Session, feed: FeedModel):
+        """Test listing a page of entries together with the total."""
+        repo = EntryRepository(db_session)
+
+        for i in range(5):
+            repo.create(
+                EntryCreate(
+                    feed_id=feed.id,
+                    title=f"Entry {i}",
+                    link=f"https://example.com/entry{i}",
+                    title_hash=f"a0{i:02x}",
+                    link_hash=f"b0{i:02x}",
+                )
+            )
+
+        entries, total = repo.list_with_count(limit=2, offset=2, order_by="id", order_desc=False)
+        assert [e.title for e in entries] == ["Entry 2", "Entry 3"]
+        assert total == 5
+
+        rows, total = repo.list_rows_with_count(feed_id=feed.id, limit=2)
+        assert len(rows) == 2
+        assert total == 5
+
+        # Past the last page there is no row to carry the total
+        rows, total = repo.list_rows_with_count(limit=2, offset=10)
+        assert rows == []
+        assert total == 5
+
+        assert repo.list_with_count(feed_id=feed.id + 1) == ([], 0)
+
+        # Ties in the order column are broken by id, as in list()
+        entries, _ = repo.list_with_count(order_by="feed_id", order_desc=False)
+        assert [e.title for e in entries] == [f"Entry {i}" for i in range(5)]
+        rows, _ = repo.list_rows_with_count(order_by="feed_id")
+        assert [row.title for row in rows] == [f"Entry {i}" for i in range(4, -1, -1)]
+
+    def test_iter_all(self, db_session: Session, feed: FeedModel):
+        """Test iterating over entries in batches."""
+        repo = EntryRepository(db_session)
+
+        for i in range(5):
+            repo.create(
+                EntryCreate(
+                    feed_id=feed.id,
+                    title=f"Entry {i}",
+                    link=f"https://example.com/entry{i}",
+                    title_hash=f"a0{i:02x}",
+                    link_hash=f"b0{i:02x}",
+                )
+            )
+
+        entries = repo.iter_all(batch_size=2, order_by="id", order_desc=False)
+        assert [e.title for e in entries] == [f"Entry {i}" for i in range(5)]
+
+        entries = repo.iter_all(feed_id=feed.id, limit=3, batch_size=2, order_by="id")
+        assert [e.title for e in entries] == ["Entry 4", "Entry 3", "Entry 2"]
+        assert list(repo.iter_all(feed_id=feed.id + 1)) == []
+
     def test_count_entries(self, db_session: Session, feed: FeedModel):
         """Test counting entries."""
         repo = EntryRepository(db_session)
@@ -262,8 +659,8 @@ class TestEntryRepository:
                     feed_id=feed.id,
                     title=f"Entry {i}",
                     link=f"https://example.com/entry{i}",
-                    title_hash=f"hash{i}",
-                    link_hash=f"link_hash{i}",
+                    title_hash=f"a0{i:02x}",
+                    link_hash=f"b0{i:02x}",
                 )
             )
 
@@ -317,8 +714,8 @@ class TestEntryRepository:
                     feed_id=feed.id,
                     title=f"Entry {i}",
                     link=f"https://example.com/entry{i}",
-                    title_hash=f"hash{i}",
-                    link_hash=f"link_hash{i}",
+                    title_hash=f"a0{i:02x}",
+                    link_hash=f"b0{i:02x}",
                 )
             )
 
@@ -328,6 +725,31 @@ class TestEntryRepository:
         assert count == 3
         assert entry_repo.count(feed_id=feed.id) == 0
 
+    def test_delete_feed_cascades_entries(self, db_session: Session, feed: FeedModel):
+        """Test deleting a feed removes its entries without loading them."""
+        entry_repo = EntryRepository(db_session)
+        entry_repo.create(
+            EntryCreate(
+                feed_id=feed.id,
+                title="Entry",
+                link="https://example.com/entry",
+                title_hash="a1",
+                link_hash="b1",
+            )
+        )
+        feed_id = feed.id
+
+        FeedRepository(db_session).delete(feed)
+
+        assert entry_repo.count(feed_id=feed_id) == 0
+
+        # Entries are never lazy loaded
+        other = FeedRepository(db_session).create(
+            FeedCreate(url="https://example.com/other.xml", name="Other")
+        )
+        with pytest.raises(InvalidRequestError):
+            other.entries
+
     def test_search_entries(self, db_session: Session, feed: FeedModel):
         """Test searching entries."""
         repo = EntryRepository(db_session)
@@ -337,8 +759,8 @@ class TestEntryRepository:
                 feed_id=feed.id,
                 title="Python Programming",
                 link="https://example.com/1",
-                title_hash="hash1",
-                link_hash="link1",
+                title_hash="a1",
+                link_hash="b1",
                 content="Learn Python programming",
             )
         )
@@ -348,8 +770,8 @@ class TestEntryRepository:
                 feed_id=feed.id,
                 title="JavaScript Guide",
                 link="https://example.com/2",
-                title_hash="hash2",
-                link_hash="link2",
+                title_hash="a2",
+                link_hash="b2",
                 content="Learn JavaScript",
             )
         )
@@ -359,6 +781,27 @@ class TestEntryRepository:
         assert len(results) == 1
         assert "Python" in results[0].title
 
+    def test_list_by_tag(self, db_session: Session, feed: FeedModel):
+        """Test listing entries by an exact tag match."""
+        repo = EntryRepository(db_session)
+
+        for i, tags in enumerate([["python", "数据库"], ["pythonic"], None]):
+            repo.create(
+                EntryCreate(
+                    feed_id=feed.id,
+                    title=f"Entry {i}",
+                    link=f"https://example.com/{i}",
+                    title_hash=f"a{i}",
+                    link_hash=f"b{i}",
+                    tags=tags,
+                )
+            )
+
+        assert [e.title for e in repo.list_by_tag("python")] == ["Entry 0"]
+        assert [e.title for e in repo.list_by_tag("数据库", feed_id=feed.id)] == ["Entry 0"]
+        assert repo.list_by_tag("python", feed_id=feed.id + 1) == []
+        assert repo.list_by_tag("go") == []
+
     def test_get_stats(self, db_session: Session, feed: FeedModel):
         """Test getting entry statistics."""
         repo = EntryRepository(db_session)
@@ -368,8 +811,8 @@ class TestEntryRepository:
                 feed_id=feed.id,
                 title="Entry 1",
                 link="https://example.com/1",
-                title_hash="hash1",
-                link_hash="link1",
+                title_hash="a1",
+                link_hash="b1",
                 language="en",
             )
         )
@@ -379,8 +822,8 @@ class TestEntryRepository:
                 feed_id=feed.id,
                 title="条目 2",
                 link="https://example.com/2",
-                title_hash="hash2",
-                link_hash="link2",
+                title_hash="a2",
+                link_hash="b2",
                 language="zh",
             )
         )
@@ -391,6 +834,12 @@ class TestEntryRepository:
         assert stats["language_counts"]["en"] == 1
         assert stats["language_counts"]["zh"] == 1
 
+        assert repo.get_stats(feed_id=feed.id + 1) == {
+            "total": 0,
+            "language_counts": {},
+            "most_recent": None,
+        }
+
 
 class TestDatabaseManager:
     """Tests for DatabaseManager."""
@@ -421,6 +870,53 @@ class TestDatabaseManager:
             feeds = session.query(FeedModel).all()
             assert len(feeds) == 1
 
+    def test_json_helpers(self):
+        """Test the shared JSON helpers encode to text and decode back."""
+        from spider_aggregation.utils.json_utils import dumps, loads
+
+        encoded = dumps({"tags": ["python", "数据库"], "count": 2})
+        assert isinstance(encoded, str)
+        assert loads(encoded) == {"tags": ["python", "数据库"], "count": 2}
+
+    def test_json_columns_round_trip(self, db_manager: DatabaseManager):
+        """Test JSON columns round-trip with whichever JSON encoder is installed."""
+        from spider_aggregation.utils import json_utils
+
+        dialect = db_manager.engine.dialect
+        if json_utils.ORJSON_AVAILABLE:
+            assert dialect._json_serializer is json_utils.dumps
+
+        with db_manager.session() as session:
+            feed = FeedRepository(session).create(FeedCreate(url="https://example.com/feed.xml"))
+            EntryRepository(session).create(
+                EntryCreate(
+                    feed_id=feed.id,
+                    title="Entry",
+                    link="https://example.com/entry",
+                    title_hash="a1",
+                    link_hash="b1",
+                    tags=["python", "数据库"],
+                )
+            )
+
+        with db_manager.session() as session:
+            assert session.query(EntryModel).one().tags == ["python", "数据库"]
+
+    def test_session_factory_reused(self):
+        """Test sessions share one factory until the manager is closed."""
+        manager = DatabaseManager(":memory:")
+        with manager.session():
+            pass
+        factory = manager._session_factory
+        assert factory is not None
+
+        with manager.session():
+            pass
+        assert manager._session_factory is factory
+
+        manager.close()
+        assert manager._session_factory is None
+
     def test_drop_all(self):
         """Test dropping all tables."""
         manager = DatabaseManager(":memory:")
@@ -543,6 +1039,126 @@ class TestDatabaseManagerExtended:
             with db_manager.session() as session:
                 session.query(FeedModel).all()
 
+    def test_get_session_is_thread_local(self, db_manager: DatabaseManager, monkeypatch):
+        """Test get_session reuses one session per thread until removed."""
+        import threading
+
+        from sqlalchemy.orm import sessionmaker
+
+        from spider_aggregation.storage import database
+        from spider_aggregation.storage.database import close_db, get_session, remove_session
+
+        monkeypatch.setattr(database, "_session_factory", sessionmaker(bind=db_manager.engine))
+        monkeypatch.setattr(database, "_scoped_session", None)
+
+        session = get_session()
+        assert get_session() is session
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(get_session()))
+        thread.start()
+        thread.join()
+        assert other[0] is not session
+
+        remove_session()
+        assert get_session() is not session
+
+        close_db()
+        assert database._scoped_session is None
+
+    def test_get_db_readonly_uses_reader_engine(self, tmp_path, monkeypatch):
+        """Test read-only sessions use a separate query-only SQLite engine."""
+        from types import SimpleNamespace
+
+        from sqlalchemy.exc import OperationalError
+
+        from spider_aggregation.config import DatabaseConfig
+        from spider_aggregation.storage import database
+        from spider_aggregation.storage.database import (
+            close_db,
+            get_db,
+            get_engine,
+            get_reader_engine,
+        )
+
+        db_config = DatabaseConfig(type="sqlite", path=str(tmp_path / "rw.db"))
+        monkeypatch.setattr(database, "get_config", lambda: SimpleNamespace(database=db_config))
+        close_db()
+
+        try:
+            assert get_reader_engine() is not get_engine()
+            assert get_reader_engine().url.query["mode"] == "ro"
+            database.Base.metadata.create_all(bind=get_engine())
+
+            with get_db() as session:
+                session.add(FeedModel(url="https://example.com/feed.xml", name="Feed"))
+
+            with get_db(readonly=True) as session:
+                assert session.query(FeedModel).count() == 1
+
+            with pytest.raises(OperationalError, match="readonly"):
+                with get_db(readonly=True) as session:
+                    session.add(FeedModel(url="https://example.com/other.xml", name="Other"))
+        finally:
+            close_db()
+
+    def test_init_db_skips_managed_database(self, tmp_path, monkeypatch):
+        """Test init_db leaves a database with alembic_version to Alembic."""
+        from types import SimpleNamespace
+
+        from alembic import command
+
+        from spider_aggregation.config import DatabaseConfig
+        from spider_aggregation.storage import database
+        from spider_aggregation.storage.database import close_db, get_engine
+
+        db_config = DatabaseConfig(type="sqlite", path=str(tmp_path / "managed.db"))
+        monkeypatch.setattr(database, "get_config", lambda: SimpleNamespace(database=db_config))
+        for name in ("stamp", "upgrade"):
+            monkeypatch.setattr(command, name, pytest.fail)
+        close_db()
+
+        try:
+            with get_engine().begin() as conn:
+                conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32))"))
+            init_db()
+        finally:
+            close_db()
+
+    def test_init_db_checks_migrations_once(self, tmp_path, monkeypatch):
+        """Test init_db inspects a database once, and never when skipped."""
+        from types import SimpleNamespace
+
+        import sqlalchemy
+
+        from spider_aggregation.config import DatabaseConfig
+        from spider_aggregation.storage import database
+        from spider_aggregation.storage.database import close_db, get_engine
+
+        db_config = DatabaseConfig(type="sqlite", path=str(tmp_path / "managed.db"))
+        monkeypatch.setattr(database, "get_config", lambda: SimpleNamespace(database=db_config))
+        close_db()
+
+        inspected = []
+        real_inspect = sqlalchemy.inspect
+        monkeypatch.setattr(
+            sqlalchemy, "inspect", lambda bind: inspected.append(bind) or real_inspect(bind)
+        )
+
+        try:
+            with get_engine().begin() as conn:
+                conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32))"))
+            init_db()
+            init_db()
+            assert len(inspected) == 1
+
+            database._migrations_checked.clear()
+            db_config.skip_migrations = True
+            init_db()
+            assert len(inspected) == 1
+        finally:
+            close_db()
+
 
 class TestFeedRepositoryExtended:
     """Extended tests for FeedRepository to improve coverage."""
@@ -675,12 +1291,8 @@ class TestEntryRepositoryExtended:
         # Update with tags
         updated = repo.update(entry, EntryUpdate(tags=["python", "programming"]))
 
-        # Tags should be JSON serialized
-        import json
-
-        assert updated.tags is not None
-        tags_list = json.loads(updated.tags)
-        assert tags_list == ["python", "programming"]
+        # Tags are stored as a native JSON list
+        assert updated.tags == ["python", "programming"]
 
     def test_update_clears_tags(self, db_session: Session, feed: FeedModel):
         """Test clearing tags with None."""
@@ -701,18 +1313,15 @@ class TestEntryRepositoryExtended:
         entry = repo.create(entry_data)
 
         # Tags should be set
-        import json
-
-        original_tags = json.loads(entry.tags)
-        assert original_tags == ["tag1", "tag2"]
+        assert entry.tags == ["tag1", "tag2"]
 
         # Clear tags with None (or empty list)
         # Actually, tags=None won't clear in current implementation
         # Let's test with empty list instead
         updated = repo.update(entry, EntryUpdate(tags=[]))
 
-        # Tags should be empty JSON array
-        assert updated.tags == "[]"
+        # Tags should be an empty list
+        assert updated.tags == []
 
     def test_get_recent(self, db_session: Session, feed: FeedModel):
         """Test getting recent entries."""
@@ -726,8 +1335,8 @@ class TestEntryRepositoryExtended:
                 feed_id=feed.id,
                 title="Old Entry",
                 link="https://example.com/old",
-                title_hash="old",
-                link_hash="old_link",
+                title_hash="a0",
+                link_hash="b0",
                 published_at=datetime.utcnow() - timedelta(days=10),
             )
         )
@@ -738,8 +1347,8 @@ class TestEntryRepositoryExtended:
                 feed_id=feed.id,
                 title="Recent Entry",
                 link="https://example.com/recent",
-                title_hash="recent",
-                link_hash="recent_link",
+                title_hash="a1",
+                link_hash="b1",
                 published_at=datetime.utcnow() - timedelta(days=1),
             )
         )
@@ -762,8 +1371,8 @@ class TestEntryRepositoryExtended:
                 feed_id=feed.id,
                 title="Old Entry",
                 link="https://example.com/old",
-                title_hash="old",
-                link_hash="old_link",
+                title_hash="a0",
+                link_hash="b0",
             )
         )
         # Manually set fetched_at to old date
@@ -775,8 +1384,8 @@ class TestEntryRepositoryExtended:
                 feed_id=feed.id,
                 title="Recent Entry",
                 link="https://example.com/recent",
-                title_hash="recent",
-                link_hash="recent_link",
+                title_hash="a1",
+                link_hash="b1",
             )
         )
 
@@ -802,8 +1411,8 @@ class TestEntryRepositoryExtended:
                     feed_id=feed.id,
                     title=title,
                     link=f"https://example.com/{title}",
-                    title_hash=title.lower(),
-                    link_hash=title.lower(),
+                    title_hash=compute_title_hash(title),
+                    link_hash=compute_title_hash(title),
                 )
             )
 
@@ -825,8 +1434,8 @@ class TestEntryRepositoryExtended:
                 feed_id=feed.id,
                 title="Test Entry",
                 link="https://example.com/test",
-                title_hash="test",
-                link_hash="test_link",
+                title_hash="aa",
+                link_hash="ba",
                 content="This is about Python programming",
             )
         )
@@ -836,8 +1445,8 @@ class TestEntryRepositoryExtended:
                 feed_id=feed.id,
                 title="Other Entry",
                 link="https://example.com/other",
-                title_hash="other",
-                link_hash="other_link",
+                title_hash="ab",
+                link_hash="bb",
                 content="JavaScript tutorial",
             )
         )
@@ -847,6 +1456,52 @@ class TestEntryRepositoryExtended:
         assert len(results) == 1
         assert "Python" in results[0].content
 
+    def test_search_substring(self, db_session: Session, feed: FeedModel):
+        """Test search matches substrings, short and quoted queries."""
+        repo = EntryRepository(db_session)
+
+        repo.create(
+            EntryCreate(
+                feed_id=feed.id,
+                title='Say "hi" to 数据库系统',
+                link="https://example.com/db",
+                title_hash="aa",
+                link_hash="ba",
+            )
+        )
+
+        assert len(repo.search("据库系")) == 1
+        assert len(repo.search("数据")) == 1
+        assert len(repo.search('"hi"')) == 1
+        assert len(repo.search("hello")) == 0
+        # Case-insensitive, and wildcards in short (LIKE) queries are literal
+        assert len(repo.search("SAY")) == 1
+        assert len(repo.search("%")) == 0
+        assert len(repo.search("_")) == 0
+
+    def test_search_rows_with_count(self, db_session: Session, feed: FeedModel):
+        """Test searching for plain rows together with the number of matches."""
+        repo = EntryRepository(db_session)
+
+        for i in range(3):
+            repo.create(
+                EntryCreate(
+                    feed_id=feed.id,
+                    title=f"Python tip {i}",
+                    link=f"https://example.com/tip{i}",
+                    title_hash=f"a{i}",
+                    link_hash=f"b{i}",
+                )
+            )
+
+        rows, total = repo.search_rows_with_count("Python", limit=2)
+        assert len(rows) == 2
+        assert total == 3
+        assert rows[0].feed_name == feed.name
+
+        assert repo.search_rows_with_count("Python", offset=10) == ([], 3)
+        assert repo.search_rows_with_count("Python", feed_id=feed.id + 1) == ([], 0)
+
     def test_search_with_feed_filter(self, db_session: Session, feed: FeedModel):
         """Test searching with feed filter."""
         from spider_aggregation.storage.repositories.feed_repo import FeedRepository
@@ -866,8 +1521,8 @@ class TestEntryRepositoryExtended:
                 feed_id=feed.id,
                 title="Python Entry",
                 link="https://example.com/1",
-                title_hash="1",
-                link_hash="1",
+                title_hash="01",
+                link_hash="01",
                 content="Python content",
             )
         )
@@ -877,8 +1532,8 @@ class TestEntryRepositoryExtended:
                 feed_id=feed2.id,
                 title="Python in Feed 2",
                 link="https://example.com/2",
-                title_hash="2",
-                link_hash="2",
+                title_hash="02",
+                link_hash="02",
                 content="Python content",
             )
         )
@@ -910,8 +1565,8 @@ class TestEntryRepositoryExtended:
                 feed_id=feed.id,
                 title="Test Entry",
                 link="https://example.com/test",
-                title_hash="test",
-                link_hash="test_link",
+                title_hash="aa",
+                link_hash="ba",
                 published_at=datetime.utcnow() - timedelta(days=1),
             )
         )
@@ -16,6 +16,7 @@ from spider_aggregation.models import EntryModel, FeedModel
 from spider_aggregation.storage.repositories.feed_repo import FeedRepository
 from spider_aggregation.utils.hash_utils import (
     compute_content_hash,
+    compute_digest,
     compute_link_hash,
     compute_md5_hash,
     compute_sha256_hash,
@@ -111,8 +112,8 @@ class TestHashUtils:
         result = compute_content_hash("This is some content")
         assert result is not None
 
-        # Uses SHA256
-        assert len(result) == 64
+        # Uses SHA256 truncated to 16 bytes
+        assert len(result) == 32
 
         # Case insensitive
         assert compute_content_hash("Content") == compute_content_hash("content")
@@ -150,6 +151,29 @@ class TestHashUtils:
         assert compute_similarity_hash("") is None
         assert compute_similarity_hash(None) is None
 
+    def test_hashes_match_stored_values(self):
+        """Test hashes stay equal to those stored by earlier releases."""
+        # 500-char cut ending on a space
+        content = "a" * 499 + " tail words here"
+        assert compute_content_hash(content) == "784c091196cc4271d990a029433f40af"
+
+        # Trailing slash removal exposing a space
+        link = "https://example.com/a /"
+        assert compute_link_hash(link) == "cd69b81ea00cc2798797293cbc92d643"
+
+    def test_compute_digest_methods(self):
+        """Test dedup digests are 16 bytes for every hash method."""
+        for method in ("md5", "sha256", "blake2b"):
+            assert len(compute_digest("test", method)) == 32
+
+        # Default link and title hashes keep using MD5
+        assert compute_title_hash("Test") == compute_digest("test", "md5")
+        assert compute_title_hash("Test", "blake2b") == compute_digest("test", "blake2b")
+        assert compute_title_hash("Test", "blake2b") != compute_title_hash("Test")
+
+        with pytest.raises(ValueError):
+            compute_digest("test", "crc32")
+
 
 class TestDeduplicator:
     """Tests for Deduplicator."""
@@ -920,3 +944,87 @@ class TestDeduplicatorExtended:
 
             # Should NOT match (title checking disabled, link is different)
             assert result.is_duplicate is False
+
+    @pytest.mark.parametrize("strategy", list(DedupStrategy))
+    def test_check_duplicates_matches_single_checks(self, db_session: Session, strategy):
+        """Test batch checks give the same results as checking entries one by one."""
+        repo = FeedRepository(db_session)
+        from spider_aggregation.models.feed import FeedCreate
+
+        feed = repo.create(FeedCreate(url="https://example.com/feed.xml", name="Test Feed"))
+
+        from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+        from spider_aggregation.models.entry import EntryCreate
+
+        entry_repo = EntryRepository(db_session)
+        for i, content in enumerate(["Shared content", "Other content"]):
+            link = f"https://example.com/a{i}"
+            entry_repo.create(
+                EntryCreate(
+                    feed_id=feed.id,
+                    title="Same Title",
+                    link=link,
+                    content=content,
+                    link_hash=compute_link_hash(link),
+                    title_hash=compute_title_hash("Same Title"),
+                    content_hash=compute_content_hash(content),
+                )
+            )
+
+        entries = [
+            {"title": "New", "link": "https://example.com/a0"},
+            {"title": "Same Title", "link": "https://example.com/b1", "content": "Other content"},
+            {"title": "Same Title", "link": "https://example.com/b2", "content": "Fresh"},
+            {"title": "New", "link": "https://example.com/b3", "content": "Shared content"},
+            {"title": "Unrelated", "link": "https://example.com/b4", "content": "Nothing"},
+        ]
+
+        dedup = Deduplicator(session=db_session, strategy=strategy)
+        batch = dedup.check_duplicates(entries, feed_id=feed.id)
+        single = [dedup.check_duplicate(entry, feed_id=feed.id) for entry in entries]
+
+        assert [r.is_duplicate for r in batch] == [r.is_duplicate for r in single]
+        assert batch[0].is_duplicate is True
+        assert batch[4].is_duplicate is False
+        assert dedup.get_stats()["checks"] == 2 * len(entries)
+
+    def test_check_duplicates_without_links_then_bulk_create(self, db_session: Session):
+        """Test existing links left to bulk_create are ignored by the insert."""
+        repo = FeedRepository(db_session)
+        from spider_aggregation.models.feed import FeedCreate
+
+        feed = repo.create(FeedCreate(url="https://example.com/feed.xml", name="Test Feed"))
+
+        from spider_aggregation.storage.repositories.entry_repo import EntryRepository
+        from spider_aggregation.models.entry import EntryCreate
+
+        entry_repo = EntryRepository(db_session)
+        link = "https://example.com/a1"
+        entry_repo.create(
+            EntryCreate(
+                feed_id=feed.id,
+                title="Old Title",
+                link=link,
+                link_hash=compute_link_hash(link),
+                title_hash=compute_title_hash("Old Title"),
+            )
+        )
+
+        dedup = Deduplicator(session=db_session, strategy=DedupStrategy.MEDIUM)
+        entry = {"title": "New Title", "link": link}
+
+        [result] = dedup.check_duplicates([entry], feed_id=feed.id, check_links=False)
+        assert result.is_duplicate is False
+
+        created = entry_repo.bulk_create(
+            [
+                EntryCreate(
+                    feed_id=feed.id,
+                    title="New Title",
+                    link=link,
+                    link_hash=compute_link_hash(link),
+                    title_hash=compute_title_hash("New Title"),
+                )
+            ]
+        )
+        assert created == 0
@@ -4,6 +4,7 @@ Unit tests for EntryRepository category methods.
 
 import pytest
 from datetime import datetime, timedelta
+from sqlalchemy import inspect
 
 from spider_aggregation.models import FeedCreate, CategoryCreate, EntryCreate
 from spider_aggregation.storage.repositories.feed_repo import FeedRepository
@@ -114,6 +115,39 @@ class TestEntryRepositoryCategoryMethods:
         assert len(entries) == 2
         assert {e.id for e in entries} == {entry1.id, entry2.id}
 
+    def test_list_by_categories_feed_in_several(self, db_session):
+        """Test entries of a feed in several requested categories are listed once."""
+        feed_repo = FeedRepository(db_session)
+        cat_repo = CategoryRepository(db_session)
+        entry_repo = EntryRepository(db_session)
+
+        cat1 = cat_repo.create(name="技术博客")
+        cat2 = cat_repo.create(name="新闻")
+
+        feed = feed_repo.create(FeedCreate(url="https://example.com/feed1"))
+        cat_repo.add_feed_to_category(feed, cat1)
+        cat_repo.add_feed_to_category(feed, cat2)
+
+        entry = self.create_test_entry(entry_repo, feed, "Entry 1")
+
+        entries = entry_repo.list_by_categories([cat1.id, cat2.id])
+        assert [e.id for e in entries] == [entry.id]
+
+    def test_list_by_categories_long_id_list(self, db_session):
+        """Test listing by more category IDs than are bound one by one."""
+        feed_repo = FeedRepository(db_session)
+        cat_repo = CategoryRepository(db_session)
+        entry_repo = EntryRepository(db_session)
+
+        cat = cat_repo.create(name="技术博客")
+        feed = feed_repo.create(FeedCreate(url="https://example.com/feed1"))
+        cat_repo.add_feed_to_category(feed, cat)
+        entry = self.create_test_entry(entry_repo, feed, "Entry 1")
+
+        category_ids = [cat.id] + list(range(10_000, 11_000))
+        entries = entry_repo.list_by_categories(category_ids)
+        assert [e.id for e in entries] == [entry.id]
+
     def test_list_by_categories_empty_list(self, db_session):
         """Test listing entries with empty category list."""
         entry_repo = EntryRepository(db_session)
@@ -172,6 +206,32 @@ class TestEntryRepositoryCategoryMethods:
         assert len(results) == 1
         assert results[0].id == entry2.id
 
+    def test_search_by_category_substring(self, db_session):
+        """Test search matches substrings, short queries and edited entries."""
+        feed_repo = FeedRepository(db_session)
+        cat_repo = CategoryRepository(db_session)
+        entry_repo = EntryRepository(db_session)
+
+        cat = cat_repo.create(name="技术博客")
+        feed = feed_repo.create(FeedCreate(url="https://example.com/feed"))
+        cat_repo.add_feed_to_category(feed, cat)
+
+        entry = self.create_test_entry(entry_repo, feed, "Python 入门教程")
+
+        # Substring inside CJK text and inside a word, case-insensitively
+        assert [e.id for e in entry_repo.search_by_category("门教程", cat.id)] == [entry.id]
+        assert [e.id for e in entry_repo.search_by_category("pyth", cat.id)] == [entry.id]
+        # Shorter than a trigram
+        assert [e.id for e in entry_repo.search_by_category("教程", cat.id)] == [entry.id]
+        # Quotes are matched literally
+        assert entry_repo.search_by_category('"Python', cat.id) == []
+
+        entry.title = "Rust 入门"
+        entry.content = "Content for Rust 入门"
+        db_session.flush()
+        assert entry_repo.search_by_category("Python", cat.id) == []
+        assert [e.id for e in entry_repo.search_by_category("Rust", cat.id)] == [entry.id]
+
     def test_get_recent_by_category(self, db_session):
         """Test getting recent entries by category."""
         feed_repo = FeedRepository(db_session)
@@ -226,13 +286,104 @@ class TestEntryRepositoryCategoryMethods:
         entry3.language = "en"
         db_session.flush()
 
+        # Entries without a language count towards the total only
+        self.create_test_entry(entry_repo, feed1, "Entry 4", days_ago=3)
+
         # Get stats
         stats = entry_repo.get_stats_by_category(cat.id)
 
-        assert stats["total"] == 3
-        assert stats["language_counts"]["en"] == 2
-        assert stats["language_counts"]["zh"] == 1
-        assert stats["most_recent"] is not None
+        assert stats["total"] == 4
+        assert stats["language_counts"] == {"en": 2, "zh": 1}
+        assert stats["most_recent"] == max(e.published_at for e in (entry1, entry2, entry3))
+        assert isinstance(stats["most_recent"], datetime)
+
+    def test_category_results_cached_until_flush(self, db_session):
+        """Test repeated category queries hit the session cache until a flush."""
+        from sqlalchemy import event
+
+        feed_repo = FeedRepository(db_session)
+        cat_repo = CategoryRepository(db_session)
+        entry_repo = EntryRepository(db_session)
+
+        cat = cat_repo.create(name="技术博客")
+        feed = feed_repo.create(FeedCreate(url="https://example.com/feed1"))
+        cat_repo.add_feed_to_category(feed, cat)
+        self.create_test_entry(entry_repo, feed, "Entry 1")
+
+        statements = []
+        engine = db_session.get_bind()
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            assert entry_repo.count_by_category(cat.id) == 1
+            assert len(entry_repo.list_by_category(cat.id)) == 1
+            queries = len(statements)
+            assert entry_repo.count_by_category(cat.id) == 1
+            assert len(entry_repo.list_by_category(cat.id)) == 1
+            assert len(statements) == queries
+
+            self.create_test_entry(entry_repo, feed, "Entry 2")
+            assert entry_repo.count_by_category(cat.id) == 2
+            assert len(entry_repo.list_by_category(cat.id)) == 2
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+    def test_category_cache_cleared_by_bulk_insert(self, db_session):
+        """Test Core bulk inserts, which do not flush, invalidate the cache."""
+        feed_repo = FeedRepository(db_session)
+        cat_repo = CategoryRepository(db_session)
+        entry_repo = EntryRepository(db_session)
+
+        cat = cat_repo.create(name="技术博客")
+        feed = feed_repo.create(FeedCreate(url="https://example.com/feed1"))
+        cat_repo.add_feed_to_category(feed, cat)
+        assert entry_repo.count_by_category(cat.id) == 0
+
+        links = [f"https://example.com/bulk-{i}" for i in range(3)]
+        inserted = entry_repo.bulk_create(
+            [
+                EntryCreate(
+                    feed_id=feed.id,
+                    title=link,
+                    link=link,
+                    title_hash=compute_title_hash(link),
+                    link_hash=compute_link_hash(link),
+                )
+                for link in links
+            ]
+        )
+
+        assert inserted == 3
+        assert entry_repo.count_by_category(cat.id) == 3
+
+    def test_category_cache_cleared_at_transaction_end(self, db_session):
+        """Test a reused session does not serve results from a finished transaction."""
+        from spider_aggregation.storage.mixins import _CATEGORY_CACHE_KEY
+
+        feed_repo = FeedRepository(db_session)
+        cat_repo = CategoryRepository(db_session)
+        entry_repo = EntryRepository(db_session)
+
+        cat = cat_repo.create(name="技术博客")
+        feed = feed_repo.create(FeedCreate(url="https://example.com/feed1"))
+        cat_repo.add_feed_to_category(feed, cat)
+        assert entry_repo.count_by_category(cat.id) == 0
+        assert db_session.info[_CATEGORY_CACHE_KEY]
+
+        db_session.commit()
+        assert not db_session.info[_CATEGORY_CACHE_KEY]
+
+        assert entry_repo.count_by_category(cat.id) == 0
+        db_session.close()
+        assert not db_session.info[_CATEGORY_CACHE_KEY]
+
+    def test_category_statements_are_reused(self, db_session):
+        """Test the category base statements are built once per model."""
+        first = EntryRepository(db_session)._build_entry_category_query()
+        assert EntryRepository(db_session)._build_entry_category_query() is first
 
     def test_list_by_category_pagination(self, db_session):
         """Test pagination when listing entries by category."""
@@ -259,6 +410,76 @@ class TestEntryRepositoryCategoryMethods:
         page3 = entry_repo.list_by_category(cat.id, limit=2, offset=4)
         assert len(page3) == 1
 
+    def test_list_by_category_keyset_pagination(self, db_session):
+        """Test keyset pagination walks every entry exactly once."""
+        feed_repo = FeedRepository(db_session)
+        cat_repo = CategoryRepository(db_session)
+        entry_repo = EntryRepository(db_session)
+
+        cat = cat_repo.create(name="测试分类")
+
+        feed = feed_repo.create(FeedCreate(url="https://example.com/feed"))
+        cat_repo.add_feed_to_category(feed, cat)
+
+        entries = [
+            self.create_test_entry(entry_repo, feed, f"Entry {i}", days_ago=i % 2) for i in range(5)
+        ]
+
+        seen = []
+        page = entry_repo.list_by_category(cat.id, limit=2)
+        # Bounded, so a cursor that repeats rows fails instead of hanging
+        for _ in range(len(entries)):
+            if not page:
+                break
+            seen.extend(e.id for e in page)
+            last = page[-1]
+            page = entry_repo.list_by_category(
+                cat.id, limit=2, after_value=last.published_at, after_id=last.id
+            )
+
+        assert page == []
+        assert sorted(seen) == sorted(e.id for e in entries)
+        assert seen == [e.id for e in entry_repo.list_by_category(cat.id)]
+
+    def test_iter_by_category(self, db_session):
+        """Test streaming all entries of a category in batches."""
+        feed_repo = FeedRepository(db_session)
+        cat_repo = CategoryRepository(db_session)
+        entry_repo = EntryRepository(db_session)
+
+        cat = cat_repo.create(name="测试分类")
+
+        feed = feed_repo.create(FeedCreate(url="https://example.com/feed"))
+        cat_repo.add_feed_to_category(feed, cat)
+
+        for i in range(5):
+            self.create_test_entry(entry_repo, feed, f"Entry {i}", days_ago=i)
+
+        streamed = [e.id for e in entry_repo.iter_by_category(cat.id, batch_size=2)]
+        assert streamed == [e.id for e in entry_repo.list_by_category(cat.id)]
+
+    def test_list_by_category_load_relations(self, db_session):
+        """Test feeds are eager-loaded only when requested."""
+        feed_repo = FeedRepository(db_session)
+        cat_repo = CategoryRepository(db_session)
+        entry_repo = EntryRepository(db_session)
+
+        cat = cat_repo.create(name="测试分类")
+        feed = feed_repo.create(FeedCreate(url="https://example.com/feed"))
+        cat_repo.add_feed_to_category(feed, cat)
+        self.create_test_entry(entry_repo, feed, "Entry 1")
+        self.create_test_entry(entry_repo, feed, "Entry 2")
+        db_session.expunge_all()
+
+        entries = entry_repo.list_by_category(cat.id, load_relations=True)
+        assert len(entries) == 2
+        assert all("feed" not in inspect(e).unloaded for e in entries)
+        assert [c.name for c in entries[0].feed.categories] == ["测试分类"]
+
+        db_session.expunge_all()
+        entries = entry_repo.list_by_category(cat.id)
+        assert all("feed" in inspect(e).unloaded for e in entries)
+
     def test_list_by_category_ordering(self, db_session):
         """Test ordering when listing entries by category."""
         feed_repo = FeedRepository(db_session)
@@ -186,6 +186,50 @@ class TestFeedRepositoryCategoryMethods:
 
         assert len(updated_feed.categories) == 3
         assert {c.id for c in updated_feed.categories} == {cat2.id, cat3.id, cat4.id}
+        assert feed not in cat1.feeds
+        assert feed in cat4.feeds
+
+    def test_set_categories_unchanged(self, db_session):
+        """Test setting the same categories leaves the feed untouched."""
+        feed_repo = FeedRepository(db_session)
+        cat_repo = CategoryRepository(db_session)
+
+        cat1 = cat_repo.create(name="技术博客")
+        feed = feed_repo.create(FeedCreate(url="https://example.com/feed"))
+        cat_repo.add_feed_to_category(feed, cat1)
+        updated_at = feed.updated_at
+
+        feed_repo.set_categories(feed, [cat1.id])
+
+        assert [c.id for c in feed.categories] == [cat1.id]
+        assert feed.updated_at == updated_at
+
+    def test_set_categories_twice(self, db_session):
+        """Test setting categories again while the previous ones are unloaded."""
+        feed_repo = FeedRepository(db_session)
+        cat_repo = CategoryRepository(db_session)
+
+        cat1 = cat_repo.create(name="技术博客")
+        cat2 = cat_repo.create(name="新闻")
+        feed = feed_repo.create(FeedCreate(url="https://example.com/feed"))
+
+        feed_repo.set_categories(feed, [cat1.id, cat2.id])
+        feed_repo.set_categories(feed, [cat2.id])
+
+        assert [c.id for c in feed.categories] == [cat2.id]
+        assert feed not in cat1.feeds
+
+    def test_set_categories_ignores_unknown_ids(self, db_session):
+        """Test unknown category IDs are skipped when setting categories."""
+        feed_repo = FeedRepository(db_session)
+        cat_repo = CategoryRepository(db_session)
+
+        cat1 = cat_repo.create(name="技术博客")
+        feed = feed_repo.create(FeedCreate(url="https://example.com/feed"))
+
+        feed_repo.set_categories(feed, [cat1.id, 99999])
+
+        assert [c.id for c in feed.categories] == [cat1.id]
 
     def test_add_category(self, db_session):
         """Test adding a category to a feed."""
@@ -1046,3 +1046,101 @@ class TestFeedPersonalization:
         # None should be allowed (no limit)
         assert feed.max_entries_per_fetch is None
         assert feed.fetch_only_recent is False
+
+
+class TestAsyncFeedFetcher:
+    """Tests for AsyncFeedFetcher batch fetching."""
+
+    def _fetcher_with_handler(self, handler):
+        from spider_aggregation.core.async_fetcher import AsyncFeedFetcher
+
+        fetcher = AsyncFeedFetcher(max_retries=1)
+        fetcher.retry_delay_seconds = 0  # Set to 0 for testing
+        fetcher._create_client = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return fetcher
+
+    def test_fetch_multiple_preserves_order(self):
+        """Test concurrent fetches return results in feed order."""
+        import asyncio
+
+        def handler(request):
+            if request.url.path == "/missing.xml":
+                return httpx.Response(404, request=request)
+            body = b"<rss><channel><item><title>Entry</title></item></channel></rss>"
+            return httpx.Response(200, content=body, headers={"ETag": "abc"}, request=request)
+
+        feeds = [
+            FeedModel(id=1, url="https://example.com/a.xml", fetch_only_recent=False),
+            FeedModel(id=2, url="https://example.com/missing.xml", fetch_only_recent=False),
+            FeedModel(id=3, url="https://example.com/b.xml", fetch_only_recent=False),
+        ]
+
+        fetcher = self._fetcher_with_handler(handler)
+        results = asyncio.run(fetcher.fetch_multiple(feeds))
+
+        assert [r.feed_id for r in results] == [1, 2, 3]
+        assert results[0].success is True
+        assert results[0].entries_count == 1
+        assert results[0].etag == "abc"
+        assert results[1].success is False
+        assert results[1].http_status == 404
+        assert fetcher.stats.total_feeds == 3
+
+    def test_fetch_url_sends_conditional_headers(self):
+        """Test ETag/Last-Modified are sent and 304 is handled."""
+        import asyncio
+
+        seen_headers = {}
+
+        def handler(request):
+            seen_headers.update(request.headers)
+            return httpx.Response(304, headers={"ETag": "abc"}, request=request)
+
+        fetcher = self._fetcher_with_handler(handler)
+
+        async def run():
+            async with fetcher._create_client() as client:
+                return await fetcher.fetch_url(
+                    client, "https://example.com/feed.xml", etag="abc", last_modified="yesterday"
+                )
+
+        result = asyncio.run(run())
+
+        assert result.success is True
+        assert result.http_status == 304
+        assert seen_headers["if-none-match"] == "abc"
+        assert seen_headers["if-modified-since"] == "yesterday"
+
+    def test_not_modified_recorded_alike_by_sync_and_async_paths(self, db_session):
+        """Test a 304 updates the feed and stats the same way on both paths."""
+        import asyncio
+
+        from spider_aggregation.core.async_fetcher import AsyncFeedFetcher
+        from spider_aggregation.core.services.fetcher_service import FetcherService
+        from spider_aggregation.models.feed import FeedCreate
+
+        def handler(request):
+            return httpx.Response(304, headers={"ETag": "def"}, request=request)
+
+        repo = FeedRepository(db_session)
+        sync_feed = repo.create(FeedCreate(url="https://example.com/a.xml"))
+        async_feed = repo.create(FeedCreate(url="https://example.com/b.xml"))
+
+        service = FetcherService(session=db_session)
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        with patch("spider_aggregation.core.fetcher.httpx.Client", return_value=client):
+            sync_result = service._fetcher.fetch_feed(sync_feed)
+        with patch.object(
+            AsyncFeedFetcher,
+            "_create_client",
+            lambda self: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ):
+            [async_result] = asyncio.run(service.fetch_many_async([async_feed]))
+
+        for feed, result in ((sync_feed, sync_result), (async_feed, async_result)):
+            assert result.success is True
+            assert result.http_status == 304
+            assert feed.last_fetched_at is not None
+            assert feed.etag == "def"
+        assert service.stats.total_feeds == 2
+        assert service.stats.successful_fetches == 2
@@ -62,27 +62,27 @@ def sample_entries(db_session):
             feed_id=feed.id,
             title="Python Programming Tutorial",
             link="https://example.com/python",
-            title_hash="hash1",
-            link_hash="linkhash1",
+            title_hash="a1",
+            link_hash="b1",
             content="Learn Python programming from scratch",
-            tags='["python", "programming"]',
+            tags=["python", "programming"],
         ),
         EntryModel(
             feed_id=feed.id,
             title="Special Advertisement",
             link="https://example.com/ad",
-            title_hash="hash2",
-            link_hash="linkhash2",
+            title_hash="a2",
+            link_hash="b2",
             content="This is an advertisement post",
         ),
         EntryModel(
             feed_id=feed.id,
             title="JavaScript Guide",
             link="https://example.com/js",
-            title_hash="hash3",
-            link_hash="linkhash3",
+            title_hash="a3",
+            link_hash="b3",
             content="Complete JavaScript guide",
-            tags='["javascript", "tech"]',
+            tags=["javascript", "tech"],
         ),
     ]
     for entry in entries:
@@ -145,8 +145,8 @@ def test_no_include_match(sample_rules, db_session):
         feed_id=1,
         title="Random Article",
         link="https://example.com/random",
-        title_hash="hash_random",
-        link_hash="linkhash_random",
+        title_hash="a4",
+        link_hash="b4",
         content="Random content that doesn't match anything",
     )
 
@@ -213,8 +213,8 @@ def test_regex_filter(db_session):
         feed_id=feed.id,
         title="Contact Me",
         link="https://example.com/contact",
-        title_hash="hash_contact",
-        link_hash="linkhash_contact",
+        title_hash="a5",
+        link_hash="b5",
         content="Email me at test@example.com for details",
     )
 
@@ -255,8 +255,8 @@ def test_language_filter(db_session):
         feed_id=feed.id,
         title="English Article",
         link="https://example.com/en",
-        title_hash="hash_en",
-        link_hash="linkhash_en",
+        title_hash="a6",
+        link_hash="b6",
         content="This is English content",
         language="en",
     )
@@ -265,8 +265,8 @@ def test_language_filter(db_session):
         feed_id=feed.id,
         title="Chinese Article",
         link="https://example.com/zh",
-        title_hash="hash_zh",
-        link_hash="linkhash_zh",
+        title_hash="a7",
+        link_hash="b7",
         content="这是中文内容",
         language="zh",
     )
@@ -278,3 +278,181 @@ def test_language_filter(db_session):
     # Chinese should not pass (only include rule for English)
     result_zh = engine.filter_entry(chinese_entry)
     assert result_zh.passed is False
+
+
+def test_regex_rules_scanned_with_hyperscan(db_session):
+    """Test regex rules are compiled into one Hyperscan database."""
+    pytest.importorskip("hyperscan")
+    from spider_aggregation.models.entry import EntryModel
+
+    rules = [
+        FilterRuleModel(
+            id=1,
+            name="include_release",
+            enabled=True,
+            rule_type="regex",
+            match_type="include",
+            pattern=r"v\d+\.\d+",
+            priority=2,
+        ),
+        FilterRuleModel(
+            id=2,
+            name="exclude_sponsored",
+            enabled=True,
+            rule_type="regex",
+            match_type="exclude",
+            pattern=r"sponsor(ed)?",
+            priority=1,
+        ),
+    ]
+    engine = FilterEngine(rules)
+    assert engine._hs_db is not None
+
+    release = EntryModel(feed_id=1, title="Release v2.1 is out", link="https://example.com/r")
+    sponsored = EntryModel(
+        feed_id=1, title="Release v3.0", link="https://example.com/s", content="Sponsored post"
+    )
+
+    assert engine.filter_entry(release).passed is True
+    result = engine.filter_entry(sponsored)
+    assert result.passed is False
+    assert result.excluded_by == "exclude_sponsored"
+
+
+def test_regex_fallback_for_unsupported_pattern(db_session):
+    """Test patterns Hyperscan rejects still match through re."""
+    from spider_aggregation.models.entry import EntryModel
+
+    rule = FilterRuleModel(
+        id=1,
+        name="repeated_word",
+        enabled=True,
+        rule_type="regex",
+        match_type="exclude",
+        pattern=r"\b(\w+) \1\b",
+        priority=1,
+    )
+    engine = FilterEngine([rule])
+    assert engine._hs_db is None
+
+    entry = EntryModel(feed_id=1, title="the the typo", link="https://example.com/t")
+    result = engine.filter_entry(entry)
+    assert result.passed is False
+    assert result.excluded_by == "repeated_word"
+
+
+def test_entry_data_haystack(sample_rules):
+    """Test EntryData joins its text fields once for rule matching."""
+    from spider_aggregation.core.services.filter_service import EntryData
+
+    entry = EntryData(title="Weekly notes", summary="All about Python", content="")
+    assert entry.haystack == "Weekly notes\nAll about Python"
+
+    engine = FilterEngine(sample_rules)
+    result = engine.filter_entry(entry)
+    assert result.passed is True
+    assert "include_python" in result.matched_rules
+
+
+def test_keyword_rules_scanned_with_hyperscan(db_session):
+    """Test keyword rules are matched as literals in the Hyperscan database."""
+    pytest.importorskip("hyperscan")
+    from spider_aggregation.models.entry import EntryModel
+
+    rule = FilterRuleModel(
+        id=1,
+        name="exclude_cpp",
+        enabled=True,
+        rule_type="keyword",
+        match_type="exclude",
+        pattern="C++",
+        priority=1,
+    )
+    engine = FilterEngine([rule])
+    assert engine._hs_rule_ids == [1]
+
+    cpp = EntryModel(feed_id=1, title="Modern c++ tips", link="https://example.com/c")
+    cc = EntryModel(feed_id=1, title="Modern cc tips", link="https://example.com/cc")
+
+    assert engine.filter_entry(cpp).excluded_by == "exclude_cpp"
+    assert engine.filter_entry(cc).passed is True
+
+
+def test_filter_service_reuses_engine_until_rules_change(sample_rules, db_session):
+    """Test FilterService only rebuilds the engine when the rules change."""
+    from spider_aggregation.core.services.filter_service import FilterService
+    from spider_aggregation.storage.repositories.filter_rule_repo import FilterRuleRepository
+
+    service = FilterService()
+    repo = FilterRuleRepository(db_session)
+    entry = {"title": "Python news", "tags_list": ["tech"]}
+
+    assert service.apply(entry, repo).passed is True
+    engine = service._engine
+    assert service.apply(entry, repo).passed is True
+    assert service._engine is engine
+
+    sample_rules[0].enabled = False
+    db_session.flush()
+
+    service.apply(entry, repo)
+    assert service._engine is not engine
+
+
+def test_rule_types_stored_as_codes(sample_rules, db_session):
+    """Test rule and match types are stored as SMALLINT codes but read as names."""
+    from sqlalchemy import text
+
+    from spider_aggregation.models.filter_rule import MatchType, RuleType
+    from spider_aggregation.storage.repositories.filter_rule_repo import FilterRuleRepository
+
+    raw = db_session.execute(
+        text("SELECT rule_type, match_type FROM filter_rules WHERE name = 'include_tag_tech'")
+    ).one()
+    assert tuple(raw) == (RuleType.TAG, MatchType.INCLUDE)
+
+    db_session.expire_all()
+    repo = FilterRuleRepository(db_session)
+    rules = repo.list(rule_type="keyword", match_type="exclude")
+    assert [(r.name, r.rule_type, r.match_type) for r in rules] == [
+        ("exclude_ai", "keyword", "exclude")
+    ]
+
+
+def test_regex_rules_match_each_field_separately(db_session):
+    """Test anchors and whitespace classes do not match across text fields."""
+    from spider_aggregation.models.entry import EntryModel
+
+    rules = [
+        FilterRuleModel(
+            id=1,
+            name="summary_starts_with_ad",
+            enabled=True,
+            rule_type="regex",
+            match_type="exclude",
+            pattern=r"^ad:",
+            priority=2,
+        ),
+        FilterRuleModel(
+            id=2,
+            name="weekly_notes",
+            enabled=True,
+            rule_type="regex",
+            match_type="exclude",
+            pattern=r"weekly\s+notes",
+            priority=1,
+        ),
+    ]
+    engine = FilterEngine(rules)
+
+    across = EntryModel(
+        feed_id=1, title="Python weekly", summary="notes and links", link="https://example.com/a"
+    )
+    assert engine.filter_entry(across).passed is True
+
+    anchored = EntryModel(
+        feed_id=1, title="Python", summary="Ad: buy now", link="https://example.com/b"
+    )
+    result = engine.filter_entry(anchored)
+    assert result.passed is False
+    assert result.excluded_by == "summary_starts_with_ad"
@@ -349,6 +349,141 @@ class TestIntegration:
         assert "Message 2" in log_file2.read_text()
 
 
+class TestLoggerBackend:
+    """Tests for logging backend selection."""
+
+    def test_default_backend_is_loguru(self):
+        """Test that loguru is the default backend."""
+        from spider_aggregation import logger as logger_module
+
+        assert logger_module._backend() == "loguru"
+        assert logger_module._resolve_loguru() is _logger
+
+    def test_loguru_imported_on_first_use(self):
+        """Test that importing the logger module does not import loguru."""
+        import subprocess
+
+        code = (
+            "import sys\n"
+            "from spider_aggregation.logger import get_logger\n"
+            "log = get_logger('lazy')\n"
+            "print('loguru' in sys.modules)\n"
+            "log.info('first use')\n"
+            "print('loguru' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.split() == ["False", "True"]
+
+    def test_backend_selected_on_first_use(self):
+        """Test that importing the logger module does not load the configuration."""
+        import subprocess
+
+        code = (
+            "from spider_aggregation import config\n"
+            "from spider_aggregation.logger import get_logger\n"
+            "log = get_logger('lazy')\n"
+            "print(config._config is not None)\n"
+            "log.info('first use')\n"
+            "print(config._config is not None)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.split() == ["False", "True"]
+
+    def test_backend_validation(self):
+        """Test that unknown backends are rejected."""
+        from spider_aggregation.config import LoggingConfig
+
+        assert LoggingConfig(backend="PicoLogging").backend == "picologging"
+        with pytest.raises(Exception):
+            LoggingConfig(backend="invalid")
+
+    def test_parse_size(self):
+        """Test translating loguru size rotation to bytes."""
+        from spider_aggregation.logger import _parse_size
+
+        assert _parse_size("100 MB") == 100 * 1024 * 1024
+        assert _parse_size("512 KB") == 512 * 1024
+        assert _parse_size("1 day") == 0
+
+
+class TestBoundedQueueSink:
+    """Tests for the bounded file sink queue."""
+
+    def _blocked_sink(self, overflow_policy):
+        import threading
+
+        from spider_aggregation.logger import _BoundedQueueSink
+
+        blocked = threading.Event()
+        release = threading.Event()
+        written = []
+
+        def write(message):
+            blocked.set()
+            release.wait()
+            written.append(message)
+
+        sink = _BoundedQueueSink(
+            write=write,
+            close=lambda: None,
+            maxsize=2,
+            overflow_policy=overflow_policy,
+            batch_bytes=1,
+        )
+        # First record is taken by the writer thread, which then blocks
+        sink.write("first")
+        assert blocked.wait(timeout=5)
+        return sink, release, written
+
+    def test_drop_oldest(self):
+        """Test that a full queue drops the oldest pending record."""
+        sink, release, written = self._blocked_sink("drop_oldest")
+
+        for message in ("a", "b", "c"):
+            sink.write(message)
+
+        release.set()
+        sink.stop()
+        assert written == ["first", "b", "c"]
+        assert sink.dropped == 1
+
+    def test_drop_newest(self):
+        """Test that a full queue drops incoming records."""
+        sink, release, written = self._blocked_sink("drop_newest")
+
+        for message in ("a", "b", "c"):
+            sink.write(message)
+
+        release.set()
+        sink.stop()
+        assert written == ["first", "a", "b"]
+        assert sink.dropped == 1
+
+    def test_batches_records(self):
+        """Test that queued records are coalesced into one write."""
+        from spider_aggregation.logger import _BoundedQueueSink
+
+        written = []
+        sink = _BoundedQueueSink(
+            write=written.append,
+            close=lambda: None,
+            maxsize=100,
+            overflow_policy="drop_oldest",
+            batch_bytes=65536,
+            batch_interval_ms=10_000,
+        )
+
+        for message in ("a\n", "b\n", "c\n"):
+            sink.write(message)
+
+        sink.stop()
+        assert written == ["a\nb\nc\n"]
+
+
 class TestLoggerInitialization:
     """Tests for logger initialization."""
 
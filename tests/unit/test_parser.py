@@ -222,25 +222,6 @@ class TestContentParser:
         entry = {}
         assert parser._detect_language(entry) is None
 
-    def test_calculate_reading_time(self):
-        """Test reading time calculation."""
-        parser = ContentParser()
-
-        # English content (~200 words per minute)
-        english = "word " * 100  # ~500 chars
-        result = parser._calculate_reading_time(english)
-        assert result >= 10  # Minimum 10 seconds
-        assert result <= 180  # Should be ~30 seconds
-
-        # Chinese content (~400 chars per minute)
-        chinese = "中" * 400
-        result = parser._calculate_reading_time(chinese)
-        assert result >= 10
-
-        # Empty content
-        assert parser._calculate_reading_time("") == 0
-        assert parser._calculate_reading_time(None) == 0
-
     def test_full_entry_parsing(self):
         """Test full entry parsing workflow."""
         parser = ContentParser()
@@ -267,7 +248,7 @@ class TestContentParser:
         assert isinstance(result["published_at"], datetime)
         assert result["tags"] == ["test", "example"]
         assert result["language"] == "en"
-        assert result["reading_time_seconds"] is not None
+        assert "reading_time_seconds" not in result  # Computed by the database
 
     def test_edge_cases(self):
         """Test edge cases."""
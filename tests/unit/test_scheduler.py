@@ -7,7 +7,9 @@ import pytest
 from sqlalchemy.orm import Session
 
 from spider_aggregation.core.scheduler import (
+    BoundedThreadPoolExecutor,
     FeedScheduler,
+    JobQueueFullError,
     JobStatus,
     SchedulerStats,
     create_scheduler,
@@ -428,6 +430,33 @@ class TestCreateScheduler:
         assert scheduler.max_workers == 10
 
 
+class TestBoundedThreadPoolExecutor:
+    """Tests for the bounded scheduler executor."""
+
+    def test_default_queue_size(self):
+        """Test queue size defaults to four runs per worker."""
+        scheduler = FeedScheduler(max_workers=2)
+
+        assert scheduler.max_queue == 8
+
+    def test_rejects_runs_when_full(self):
+        """Test runs beyond workers + queue are rejected until a slot frees."""
+        executor = BoundedThreadPoolExecutor(max_workers=1, max_queue=1)
+        executor._pool = MagicMock()  # Submitted runs never complete
+        job = Mock(id="feed_1", _jobstore_alias="default")
+
+        executor._do_submit_job(job, [])
+        executor._do_submit_job(job, [])
+        with pytest.raises(JobQueueFullError):
+            executor._do_submit_job(job, [])
+
+        with patch("apscheduler.executors.pool.BasePoolExecutor._run_job_success"):
+            executor._run_job_success(job.id, [])
+
+        executor._do_submit_job(job, [])
+        assert executor._pool.submit.call_count == 3
+
+
 class TestSchedulerIntegration:
     """Integration tests for scheduler with real feeds."""
 